@@ -6,7 +6,7 @@ Handles real-time chat interactions and message processing
 import logging
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
-from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Response, status, BackgroundTasks
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,7 +17,7 @@ from backend.common.auth import get_current_user, UserContext
 from backend.common.exceptions import ValidationError, NotFoundError, AuthenticationError
 
 # Import service components
-from ..models.chat import ChatSessionCreate, ChatMessageCreate, ChatMessageResponse
+from ..models.chat import ChatSessionCreate, ChatMessageCreate, ChatHistoryResponse
 from ..models.rag import RAGRequest, StreamingChunk
 from ..crud.chat import ChatSessionCRUD, ChatMessageCRUD, ChatContextCRUD
 from ..crud.rag import RAGService
@@ -279,7 +279,7 @@ async def stream_message(
         )
 
 
-@router.get("/history/{session_id}")
+@router.get("/history/{session_id}", response_model=ChatHistoryResponse)
 async def get_chat_history(
     session_id: UUID,
     current_user: UserContext = Depends(get_current_user),
@@ -298,11 +298,13 @@ async def get_chat_history(
             db, session_id, current_user.user_id, limit, offset
         )
 
-        return {
-            "session_id": session_id,
-            "messages": [ChatMessageResponse.from_orm(msg) for msg in messages],
-            "total": len(messages),
-        }
+        # Validate the whole page from the ORM rows and serialize it in one pass, instead of
+        # per-message models run through jsonable_encoder
+        history = ChatHistoryResponse.model_validate(
+            {"session_id": session_id, "messages": messages, "total": len(messages)},
+            from_attributes=True,
+        )
+        return Response(content=history.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error getting chat history: {e}", exc_info=True)
@@ -7,7 +7,7 @@ from enum import Enum as PyEnum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
@@ -83,6 +83,8 @@ class ChatContext(Base):
 class ChatSessionResponse(BaseModel):
     """Chat session API response model"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_id: UUID
     title: Optional[str]
@@ -93,13 +95,12 @@ class ChatSessionResponse(BaseModel):
     updated_at: datetime
     message_count: Optional[int] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ChatMessageResponse(BaseModel):
     """Chat message API response model"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     session_id: UUID
     user_id: UUID
@@ -111,8 +112,13 @@ class ChatMessageResponse(BaseModel):
     response_time_ms: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+
+class ChatHistoryResponse(BaseModel):
+    """Chat history page API response model"""
+
+    session_id: UUID
+    messages: List[ChatMessageResponse]
+    total: int
 
 
 class ChatSessionCreate(BaseModel):
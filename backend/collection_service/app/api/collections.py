@@ -8,6 +8,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.auth import UserContext, get_current_user
@@ -34,6 +35,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_collection_list_adapter = TypeAdapter(List[CollectionResponse])
+
 
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_collection(
@@ -68,7 +71,7 @@ async def list_collections(
 ):
     """List collections accessible to the current user"""
     try:
-        collections = await CollectionCRUD.get_user_collections(
+        collections, total_count = await CollectionCRUD.get_user_collections(
             db=db,
             user_id=current_user.user_id,
             limit=limit,
@@ -79,43 +82,12 @@ async def list_collections(
 
         logger.info(f"Retrieved {len(collections)} collections")
 
-        # Get total count for pagination
-        total_collections = await CollectionCRUD.get_user_collections(
-            db=db,
-            user_id=current_user.user_id,
-            limit=1000000,  # Large number to get all
-            offset=0,
-            status=status_filter,
-            search=search,
-        )
-
-        total_count = len(total_collections)
         has_more = offset + limit < total_count
 
-        collection_responses = []
-        for c in collections:
-            logger.info(f"Processing collection {c.id}, settings: {c.settings}")
-            collection_responses.append(
-                CollectionResponse(
-                    id=c.id,
-                    name=c.name,
-                    description=c.description,
-                    owner_id=c.owner_id,
-                    status=c.status,
-                    is_public=c.is_public,
-                    vector_collection_name=c.vector_collection_name,
-                    embedding_model=c.embedding_model,
-                    embedding_dimensions=c.embedding_dimensions,
-                    chunking_strategy=c.chunking_strategy,
-                    chunk_size=c.chunk_size,
-                    chunk_overlap=c.chunk_overlap,
-                    settings=c.settings or {},
-                    document_count=c.document_count,
-                    total_chunks=c.total_chunks,
-                    created_at=c.created_at,
-                    updated_at=c.updated_at,
-                )
-            )
+        # One compiled validator for the whole page, reading attributes off the ORM rows
+        collection_responses = _collection_list_adapter.validate_python(
+            collections, from_attributes=True
+        )
 
         return CollectionListResponse(
             collections=collection_responses, total_count=total_count, has_more=has_more
@@ -4,13 +4,15 @@ Collection Service CRUD Operations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, delete, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.common.database.pagination import page_total
+
 from ..models.collection import (
     AccessLevel,
     Collection,
@@ -128,12 +130,13 @@ class CollectionCRUD:
         offset: int = 0,
         status: Optional[CollectionStatus] = None,
         search: Optional[str] = None,
-    ) -> List[Collection]:
-        """Get collections accessible to a user"""
+    ) -> Tuple[List[Collection], int]:
+        """Get a page of collections accessible to a user and the total matching count"""
         try:
-            # Get collections where user is owner or has access
+            # Get collections where user is owner or has access; the total comes back with
+            # the page rather than from a second query
             query = (
-                select(Collection)
+                select(Collection, func.count().over().label("total_count"))
                 .join(
                     CollectionAccess,
                     and_(
@@ -161,7 +164,10 @@ class CollectionCRUD:
             query = query.order_by(desc(Collection.updated_at)).limit(limit).offset(offset)
 
             result = await db.execute(query)
-            return result.scalars().unique().all()
+            rows = result.all()
+
+            total = await page_total(db, query, rows, offset)
+            return [row.Collection for row in rows], total
 
         except Exception as e:
             logger.error(f"Error getting user collections for {user_id}: {e}")
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .collection import AccessLevel, CollectionStatus
 
@@ -44,6 +44,8 @@ class CollectionUpdate(BaseModel):
 class CollectionResponse(BaseModel):
     """Collection response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     name: str
     description: Optional[str]
@@ -68,9 +70,6 @@ class CollectionResponse(BaseModel):
         """Convert None to empty dict"""
         return v if v is not None else {}
 
-    class Config:
-        from_attributes = True
-
 
 class CollectionListResponse(BaseModel):
     """Collection list response schema"""
@@ -91,6 +90,8 @@ class CollectionVersionCreate(BaseModel):
 class CollectionVersionResponse(BaseModel):
     """Collection version response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     collection_id: UUID
     version_number: int
@@ -103,9 +104,6 @@ class CollectionVersionResponse(BaseModel):
     created_by: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class CollectionVersionListResponse(BaseModel):
     """Collection version list response schema"""
@@ -119,6 +117,8 @@ class CollectionVersionListResponse(BaseModel):
 class VersionComparisonResponse(BaseModel):
     """Version comparison response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     collection_id: UUID
     version1: int
     version2: int
@@ -126,9 +126,6 @@ class VersionComparisonResponse(BaseModel):
     summary: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Collection Access Schemas
 class CollectionAccessCreate(BaseModel):
@@ -157,6 +154,8 @@ class CollectionAccessUpdate(BaseModel):
 class CollectionAccessResponse(BaseModel):
     """Collection access response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     collection_id: UUID
     user_id: UUID
@@ -169,9 +168,6 @@ class CollectionAccessResponse(BaseModel):
     granted_at: datetime
     expires_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-
 
 # Collection Statistics
 class CollectionStats(BaseModel):
@@ -3,6 +3,7 @@ Shared API Patterns and Response Models
 Common API patterns for all services
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -91,15 +92,35 @@ class BaseQueryParams(BaseModel):
 class DependencyCheck:
     """Base class for dependency health checks"""
 
-    def __init__(self, name: str, check_func: Callable[[], Awaitable[Dict[str, Any]]]):
+    def __init__(
+        self,
+        name: str,
+        check_func: Callable[[], Awaitable[Dict[str, Any]]],
+        cache_ttl: float = 1.0,
+        timeout: float = 5.0,
+    ):
         self.name = name
         self.check_func = check_func
+        self.timeout = timeout
+        # Results are reused for cache_ttl seconds so rapid probes don't hit the dependency
+        self.cache_ttl = cache_ttl
+        self._cached_result: Optional[Dict[str, Any]] = None
+        self._cached_at = 0.0
 
     async def check(self) -> Dict[str, Any]:
+        """Execute the dependency check, reusing a result younger than cache_ttl"""
+        if self._cached_result and time.monotonic() - self._cached_at < self.cache_ttl:
+            return self._cached_result
+
+        self._cached_result = await self._run_check()
+        self._cached_at = time.monotonic()
+        return self._cached_result
+
+    async def _run_check(self) -> Dict[str, Any]:
         """Execute the dependency check"""
         try:
             start_time = time.time()
-            result = await self.check_func()
+            result = await asyncio.wait_for(self.check_func(), timeout=self.timeout)
             response_time = int((time.time() - start_time) * 1000)
 
             # Ensure result has required fields
@@ -109,6 +130,12 @@ class DependencyCheck:
                 result["response_time_ms"] = response_time
 
             return result
+        except asyncio.TimeoutError:
+            return {
+                "status": "unhealthy",
+                "error": f"timed out after {self.timeout}s",
+                "details": f"{self.name} check failed",
+            }
         except Exception as e:
             return {"status": "unhealthy", "error": str(e), "details": f"{self.name} check failed"}
 
@@ -133,13 +160,9 @@ def create_health_router(
     critical_dependencies = critical_dependencies or []
 
     async def check_all_dependencies() -> Dict[str, Any]:
-        """Check all configured dependencies"""
-        dependencies = {}
-
-        for dep_check in dependency_checks:
-            dependencies[dep_check.name] = await dep_check.check()
-
-        return dependencies
+        """Check all configured dependencies concurrently"""
+        results = await asyncio.gather(*[dep_check.check() for dep_check in dependency_checks])
+        return {dep_check.name: result for dep_check, result in zip(dependency_checks, results)}
 
     @router.get("/", response_model=HealthResponse)
     async def health_check():
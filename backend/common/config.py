@@ -6,7 +6,7 @@ Centralized configuration loading from config/environments/ directory
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from pydantic import Field, validator
@@ -214,6 +214,7 @@ class DatabaseServiceConfig(BaseServiceConfig):
     qdrant_grpc_port: int = 6336
     qdrant_timeout: int = 30
     qdrant_collection_name: str = "documents"
+    embedding_quantization: Literal["none", "int8"] = "none"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -228,6 +229,7 @@ class DatabaseServiceConfig(BaseServiceConfig):
                 self.qdrant_url = f"http://{host}:{port}"
             self.qdrant_grpc_port = qdrant_config.get("grpc_port", 6336)
             self.qdrant_timeout = qdrant_config.get("timeout", 30)
+            self.embedding_quantization = qdrant_config.get("embedding_quantization", "none")
 
     @property
     def qdrant_host(self) -> str:
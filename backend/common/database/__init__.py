@@ -2,12 +2,15 @@
 
 from .base import Base, get_async_session, get_database_engine, get_db, get_db_session
 from .models import *
+from .pagination import page_total
 from .redis import (
+    BloomFilter,
     CacheManager,
     EmbeddingCache,
     QueryCache,
     RateLimiter,
     SessionManager,
+    get_bloom_filter,
     get_cache_manager,
     get_rate_limiter,
     get_redis,
@@ -41,10 +44,13 @@ __all__ = [
     "get_database_engine",
     "get_db",
     "get_db_session",
+    "page_total",
     "get_redis",
     "get_cache_manager",
     "get_session_manager",
     "get_rate_limiter",
+    "get_bloom_filter",
+    "BloomFilter",
     "CacheManager",
     "SessionManager",
     "RateLimiter",
@@ -7,18 +7,21 @@ from typing import Optional
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
+    SmallInteger,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -146,7 +149,10 @@ class File(Base, UUIDMixin, TimestampMixin):
     """File model for document management"""
 
     __tablename__ = "files"
-    __table_args__ = {"schema": "files"}
+    __table_args__ = (
+        Index("uq_files_collection_checksum", "collection_id", "checksum", unique=True),
+        {"schema": "files"},
+    )
 
     filename = Column(String(255), nullable=False)
     original_filename = Column(String(255), nullable=False)
@@ -154,6 +160,7 @@ class File(Base, UUIDMixin, TimestampMixin):
     file_size = Column(Integer, nullable=False)
     file_path = Column(String(500), nullable=False)
     mime_type = Column(String(100), nullable=False)
+    checksum = Column(String(64), nullable=False)  # SHA-256 hex digest of the content
 
     # Processing status
     status = Column(Enum(FileStatus), default=FileStatus.UPLOADED, nullable=False)
@@ -186,6 +193,7 @@ class DocumentChunk(Base, UUIDMixin, TimestampMixin):
     chunk_index = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     content_length = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of normalized content
 
     # Vector database reference
     vector_id = Column(String(255), nullable=True)  # ID in vector database
@@ -200,6 +208,34 @@ class DocumentChunk(Base, UUIDMixin, TimestampMixin):
     file = relationship("File", back_populates="chunks")
 
 
+# Number of rows each user's file statistics are spread over
+USER_FILE_STATS_SLOTS = 8
+
+
+class UserFileStats(Base):
+    """Per-user file statistics, maintained by triggers on files.files
+
+    A user's totals are the sum of their slot rows. Each file always updates the
+    same slot, so concurrent writes to one user's files rarely touch the same row.
+    The triggers are installed by the add_user_file_stats migration; tables created
+    with metadata.create_all have none, which FileCRUD.get_file_stats detects.
+    """
+
+    __tablename__ = "user_file_stats"
+    __table_args__ = {"schema": "files"}
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("auth.users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    slot = Column(SmallInteger, primary_key=True, default=0)  # 0..USER_FILE_STATS_SLOTS - 1
+    status_counts = Column(JSONB, nullable=False, default=dict)  # FileStatus name -> count
+    type_counts = Column(JSONB, nullable=False, default=dict)  # FileType name -> count
+    total_size_bytes = Column(BigInteger, default=0, nullable=False)
+    total_chunks = Column(BigInteger, default=0, nullable=False)
+
+
 # Chat Service Models
 class ChatSessionStatus(PyEnum):
     """Chat session status enumeration"""
@@ -0,0 +1,18 @@
+"""Pagination helpers shared by the services' list queries"""
+
+from typing import Sequence
+
+from sqlalchemy import Row, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def page_total(db: AsyncSession, query, rows: Sequence[Row], offset: int) -> int:
+    """Total matches of a page query carrying a COUNT(*) OVER () total_count column"""
+    if rows:
+        return rows[0].total_count
+    if not offset:
+        return 0
+
+    # Past the last page the window has no rows to report the total on
+    count_query = query.with_only_columns(func.count()).order_by(None)
+    return await db.scalar(count_query.limit(None).offset(None))
@@ -4,10 +4,11 @@ import json
 import logging
 import os
 from datetime import timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +257,142 @@ class RateLimiter:
             return True, 0, limit
 
 
+class BloomFilter:
+    """Probabilistic membership pre-filter using the RedisBloom module"""
+
+    # Whether the server has the RedisBloom module; probed once per process
+    _supported: Optional[bool] = None
+
+    @classmethod
+    async def is_supported(cls, redis: Redis) -> bool:
+        """Check once whether the server understands the BF.* commands"""
+        if cls._supported is None:
+            try:
+                await redis.execute_command("BF.EXISTS", "bloom:probe", "probe")
+                cls._supported = True
+            except ResponseError:
+                cls._supported = False
+                logger.warning("RedisBloom module not loaded; Bloom filter pre-checks disabled")
+        return cls._supported
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "bloom:",
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+    def _bloom_key(self, name: str) -> str:
+        """Generate bloom filter key"""
+        return f"{self.prefix}{name}"
+
+    def _seeded_key(self, name: str) -> str:
+        """Key marking that the filter has been seeded from the authoritative store"""
+        return f"{self.prefix}{name}:seeded"
+
+    async def might_contain(self, name: str, item: str) -> Optional[bool]:
+        """
+        Check whether item may have been added to the filter
+        Returns: False if definitely absent, True if possibly present,
+        None if the filter has not been seeded yet
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                await pipe.exists(self._seeded_key(name))
+                await pipe.execute_command("BF.EXISTS", self._bloom_key(name), item)
+                seeded, found = await pipe.execute()
+
+            if not seeded:
+                return None
+            return bool(found)
+
+        except Exception as e:
+            logger.error(f"Bloom filter check error for {name}: {e}")
+            # Fail open - callers fall back to the authoritative lookup
+            return True
+
+    async def might_contain_many(self, name: str, items: List[str]) -> Optional[List[bool]]:
+        """
+        Check several items in one round-trip
+        Returns: one flag per item (False = definitely absent), or None if the
+        filter has not been seeded yet
+        """
+        if not items:
+            return []
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                await pipe.exists(self._seeded_key(name))
+                await pipe.execute_command("BF.MEXISTS", self._bloom_key(name), *items)
+                seeded, found = await pipe.execute()
+
+            if not seeded:
+                return None
+            return [bool(flag) for flag in found]
+
+        except Exception as e:
+            logger.error(f"Bloom filter check error for {name}: {e}")
+            # Fail open - callers fall back to the authoritative lookup
+            return [True] * len(items)
+
+    async def add(self, name: str, items: Iterable[str]) -> bool:
+        """Add items to the filter, creating it if needed"""
+        items = list(items)
+        if not items:
+            return True
+
+        try:
+            await self.redis.execute_command(
+                "BF.INSERT",
+                self._bloom_key(name),
+                "CAPACITY",
+                self.capacity,
+                "ERROR",
+                self.error_rate,
+                "ITEMS",
+                *items,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Bloom filter add error for {name}: {e}")
+            return False
+
+    async def seed(self, name: str, items: Iterable[str]) -> bool:
+        """
+        Add the authoritative item set and mark the filter seeded, atomically
+
+        Adds that arrive before seeding land in the same filter, since both paths
+        create it on demand, so nothing recorded concurrently is lost
+        """
+        items = list(items)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                if items:
+                    await pipe.execute_command(
+                        "BF.INSERT",
+                        self._bloom_key(name),
+                        "CAPACITY",
+                        self.capacity,
+                        "ERROR",
+                        self.error_rate,
+                        "ITEMS",
+                        *items,
+                    )
+                await pipe.set(self._seeded_key(name), 1)
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Bloom filter seed error for {name}: {e}")
+            return False
+
+
 async def get_cache_manager() -> CacheManager:
     """Dependency to get cache manager"""
     redis = await get_redis()
@@ -274,6 +411,14 @@ async def get_rate_limiter() -> RateLimiter:
     return RateLimiter(redis)
 
 
+async def get_bloom_filter() -> Optional[BloomFilter]:
+    """Dependency to get bloom filter; None when Redis has no RedisBloom module"""
+    redis = await get_redis()
+    if not await BloomFilter.is_supported(redis):
+        return None
+    return BloomFilter(redis)
+
+
 # Cache decorators and utilities
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
@@ -5,12 +5,14 @@ Follows DRY principles with shared functionality across services
 """
 
 import asyncio
+import functools
 import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID, uuid4
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import ResponseHandlingException
 from qdrant_client.models import (
@@ -19,10 +21,15 @@ from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
+    MatchAny,
     MatchValue,
     PointsList,
     PointStruct,
     Record,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     SearchRequest,
     UpdateResult,
     VectorParams,
@@ -36,19 +43,29 @@ logger = logging.getLogger(__name__)
 class VectorPoint:
     """Represents a vector point with metadata"""
 
-    def __init__(self, id: Union[str, UUID], vector: List[float], payload: Dict[str, Any] = None):
+    __slots__ = ("id", "vector", "payload")
+
+    def __init__(
+        self,
+        id: Union[str, UUID],
+        vector: Union[np.ndarray, List[float]],
+        payload: Dict[str, Any] = None,
+    ):
         self.id = str(id) if isinstance(id, UUID) else id
         self.vector = vector
         self.payload = payload or {}
 
     def to_qdrant_point(self) -> PointStruct:
         """Convert to Qdrant PointStruct"""
-        return PointStruct(id=self.id, vector=self.vector, payload=self.payload)
+        vector = self.vector.tolist() if isinstance(self.vector, np.ndarray) else self.vector
+        return PointStruct(id=self.id, vector=vector, payload=self.payload)
 
 
 class VectorSearchResult:
     """Represents a vector search result"""
 
+    __slots__ = ("id", "score", "payload", "vector")
+
     def __init__(
         self, id: str, score: float, payload: Dict[str, Any], vector: Optional[List[float]] = None
     ):
@@ -108,6 +125,22 @@ class VectorService:
         except Exception as e:
             raise ConnectionError(f"Cannot connect to Qdrant: {e}")
 
+    @staticmethod
+    def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Build a Qdrant filter requiring every key to match; list values match any element"""
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            if isinstance(value, list):
+                # Handle list values (e.g., collection_ids)
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=value)))
+            else:
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+
+        return Filter(must=conditions) if conditions else None
+
     async def ensure_collection(
         self, collection_name: str, vector_size: int = 1536, distance: Distance = Distance.COSINE
     ) -> bool:
@@ -127,12 +160,22 @@ class VectorService:
                 logger.debug(f"Collection '{collection_name}' already exists")
                 return True
 
+            # Enable server-side int8 scalar quantization when configured
+            quantization_config = None
+            if self.config.embedding_quantization == "int8":
+                quantization_config = ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+                )
+
             # Create collection
             await asyncio.get_event_loop().run_in_executor(
                 None,
-                self.client.create_collection,
-                collection_name,
-                VectorParams(size=vector_size, distance=distance),
+                functools.partial(
+                    self.client.create_collection,
+                    collection_name,
+                    VectorParams(size=vector_size, distance=distance),
+                    quantization_config=quantization_config,
+                ),
             )
 
             logger.info(f"Created collection '{collection_name}' with vector size {vector_size}")
@@ -172,7 +215,7 @@ class VectorService:
     async def search_vectors(
         self,
         collection_name: str,
-        query_vector: List[float],
+        query_vector: Union[np.ndarray, List[float]],
         limit: int = 10,
         score_threshold: float = 0.0,
         filters: Optional[Dict[str, Any]] = None,
@@ -183,20 +226,7 @@ class VectorService:
             await self.initialize()
 
         try:
-            # Build filter if provided
-            qdrant_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    if isinstance(value, list):
-                        # Handle list values (e.g., collection_ids)
-                        for v in value:
-                            conditions.append(FieldCondition(key=key, match=MatchValue(value=v)))
-                    else:
-                        conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-
-                if conditions:
-                    qdrant_filter = Filter(must=conditions)
+            qdrant_filter = self._build_filter(filters)
 
             # Perform search
             results = await asyncio.get_event_loop().run_in_executor(
@@ -251,6 +281,42 @@ class VectorService:
             logger.error(f"Failed to get point '{point_id}' from '{collection_name}': {e}")
             return None
 
+    async def get_points(
+        self, collection_name: str, point_ids: List[str], with_vector: bool = False
+    ) -> List[VectorSearchResult]:
+        """Get several points by ID in a single request"""
+        if not self._initialized:
+            await self.initialize()
+
+        if not point_ids:
+            return []
+
+        try:
+            result = await asyncio.get_event_loop().run_in_executor(
+                None,
+                functools.partial(
+                    self.client.retrieve,
+                    collection_name,
+                    point_ids,
+                    with_payload=True,
+                    with_vectors=with_vector,
+                ),
+            )
+
+            return [
+                VectorSearchResult(
+                    id=str(point.id),
+                    score=1.0,  # No score for direct retrieval
+                    payload=point.payload or {},
+                    vector=point.vector if with_vector else None,
+                )
+                for point in result
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to get points from '{collection_name}': {e}")
+            return []
+
     async def delete_points(self, collection_name: str, point_ids: List[str]) -> bool:
         """Delete points by IDs"""
         if not self._initialized:
@@ -271,6 +337,27 @@ class VectorService:
             logger.error(f"Failed to delete points from '{collection_name}': {e}")
             raise
 
+    async def delete_points_by_filter(self, collection_name: str, filters: Dict[str, Any]) -> bool:
+        """Delete all points whose payload matches the given filters"""
+        if not self._initialized:
+            await self.initialize()
+
+        qdrant_filter = self._build_filter(filters)
+        if qdrant_filter is None:
+            raise ValueError("Refusing to delete points without a filter")
+
+        try:
+            result = await asyncio.get_event_loop().run_in_executor(
+                None, self.client.delete, collection_name, FilterSelector(filter=qdrant_filter)
+            )
+
+            logger.info(f"Deleted points matching {filters} from collection '{collection_name}'")
+            return result.status == "completed"
+
+        except Exception as e:
+            logger.error(f"Failed to delete points by filter from '{collection_name}': {e}")
+            raise
+
     async def delete_collection(self, collection_name: str) -> bool:
         """Delete an entire collection"""
         if not self._initialized:
@@ -339,14 +426,7 @@ class VectorService:
             await self.initialize()
 
         try:
-            # Build filter if provided
-            qdrant_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-                if conditions:
-                    qdrant_filter = Filter(must=conditions)
+            qdrant_filter = self._build_filter(filters)
 
             result = await asyncio.get_event_loop().run_in_executor(
                 None, self.client.count, collection_name, qdrant_filter
@@ -5,13 +5,14 @@ DRY implementation for FastAPI service applications
 """
 
 import logging
+import sys
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Type
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.routing import APIRouter
 
 from backend.common.api import create_health_router
@@ -50,6 +51,14 @@ class BaseServiceApp(ABC):
         """Get service-specific endpoints for root response. Override if needed."""
         return {"health": "/health"}
 
+    def get_health_router(self) -> APIRouter:
+        """Get the health router mounted at /health. Override to add dependency checks."""
+        return create_health_router(service_name=self.service_name, version=self.version)
+
+    def get_default_response_class(self) -> Type[Response]:
+        """Get the response class used by routes without their own. Override if needed."""
+        return JSONResponse
+
     async def startup_tasks(self):
         """Service-specific startup tasks. Override if needed."""
         self.logger.info(f"Starting {self.service_name}...")
@@ -70,13 +79,18 @@ class BaseServiceApp(ABC):
         await self.shutdown_tasks()
 
     def create_app(self) -> FastAPI:
-        """Create and configure the FastAPI application"""
+        """Create and configure the FastAPI application; later calls return the same instance"""
+        # Routers, middleware and handlers are registered once per service object
+        if self.app is not None:
+            return self.app
+
         # Create FastAPI application
         self.app = FastAPI(
             title=f"Advanced RAG System - {self.service_name}",
             description=self.service_description,
             version=self.version,
             lifespan=self.lifespan,
+            default_response_class=self.get_default_response_class(),
         )
 
         # Get settings
@@ -95,8 +109,7 @@ class BaseServiceApp(ABC):
         )
 
         # Include health router
-        health_router = create_health_router(service_name=self.service_name, version=self.version)
-        self.app.include_router(health_router, prefix="/health", tags=["health"])
+        self.app.include_router(self.get_health_router(), prefix="/health", tags=["health"])
 
         # Include service-specific routers
         for router_config in self.get_service_routers():
@@ -133,7 +146,10 @@ class BaseServiceApp(ABC):
 
     async def global_exception_handler(self, request, exc):
         """Global exception handler"""
-        self.logger.error(f"Unhandled exception: {exc}", exc_info=True)
+        # Log the traceback rather than str(exc), which renders SQLAlchemy statements in full
+        self.logger.error(
+            f"Unhandled {type(exc).__name__} on {request.method} {request.url.path}", exc_info=exc
+        )
         return JSONResponse(status_code=500, content={"detail": "Internal server error"})
 
     def run(self, host: str = None, port: int = None, reload: bool = True):
@@ -149,4 +165,8 @@ class BaseServiceApp(ABC):
             port=port or self.settings.port,
             reload=reload,
             log_level=self.settings.log_level.lower(),
+            # uvloop and httptools ship with uvicorn[standard]; fail loudly if they are missing
+            # instead of silently falling back to the slower asyncio loop and h11 parser
+            loop="uvloop" if sys.platform != "win32" else "asyncio",
+            http="httptools",
         )
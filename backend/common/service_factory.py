@@ -4,7 +4,10 @@ Service Factory - DRY Implementation
 Creates service applications without code duplication
 """
 
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Type
+
+from fastapi.responses import Response
+from fastapi.routing import APIRouter
 
 from backend.common.main_base import BaseServiceApp
 
@@ -25,6 +28,8 @@ class ServiceApp(BaseServiceApp):
         startup_tasks_func: Callable = None,
         shutdown_tasks_func: Callable = None,
         endpoints_config: Dict[str, str] = None,
+        health_router: APIRouter = None,
+        default_response_class: Type[Response] = None,
     ):
         super().__init__(service_name, service_description, version)
         self._settings_getter = settings_getter
@@ -32,6 +37,8 @@ class ServiceApp(BaseServiceApp):
         self._startup_tasks_func = startup_tasks_func
         self._shutdown_tasks_func = shutdown_tasks_func
         self._endpoints_config = endpoints_config or {"health": "/health"}
+        self._health_router = health_router
+        self._default_response_class = default_response_class
 
     def get_settings(self):
         """Get service settings using the provided getter function"""
@@ -45,6 +52,14 @@ class ServiceApp(BaseServiceApp):
         """Get service endpoints from configuration"""
         return self._endpoints_config
 
+    def get_health_router(self) -> APIRouter:
+        """Get the configured health router, falling back to the default one"""
+        return self._health_router or super().get_health_router()
+
+    def get_default_response_class(self) -> Type[Response]:
+        """Get the configured default response class, falling back to JSONResponse"""
+        return self._default_response_class or super().get_default_response_class()
+
     async def startup_tasks(self):
         """Execute custom startup tasks if provided"""
         await super().startup_tasks()
@@ -67,6 +82,8 @@ def create_service_app(
     startup_tasks_func: Callable = None,
     shutdown_tasks_func: Callable = None,
     endpoints_config: Dict[str, str] = None,
+    health_router: APIRouter = None,
+    default_response_class: Type[Response] = None,
 ) -> ServiceApp:
     """
     Factory function to create a service application.
@@ -80,6 +97,9 @@ def create_service_app(
         startup_tasks_func: Optional custom startup tasks function
         shutdown_tasks_func: Optional custom shutdown tasks function
         endpoints_config: Optional custom endpoints configuration
+        health_router: Optional health router replacing the default one
+        default_response_class: Optional response class for routes that set none,
+            e.g. ORJSONResponse
 
     Returns:
         Configured ServiceApp instance
@@ -93,4 +113,6 @@ def create_service_app(
         startup_tasks_func=startup_tasks_func,
         shutdown_tasks_func=shutdown_tasks_func,
         endpoints_config=endpoints_config,
+        health_router=health_router,
+        default_response_class=default_response_class,
     )
@@ -5,6 +5,8 @@ This module contains utility functions that are shared across
 all microservices in the system.
 """
 
+import codecs
+import functools
 import hashlib
 import logging
 import os
@@ -14,6 +16,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import charset_normalizer
 import magic
 import structlog
 from pydantic import BaseModel
@@ -78,6 +81,20 @@ def generate_checksum(content: Union[str, bytes]) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+@functools.lru_cache(maxsize=None)
+def get_mime_detector() -> magic.Magic:
+    """
+    Get the shared libmagic MIME detector.
+
+    Loading the magic database is expensive, so one instance is reused.
+    Magic serializes its own calls with an internal lock.
+
+    Returns:
+        magic.Magic instance configured for MIME types
+    """
+    return magic.Magic(mime=True)
+
+
 def detect_mime_type(file_path: Union[str, Path]) -> str:
     """
     Detect MIME type of a file using python-magic.
@@ -89,8 +106,7 @@ def detect_mime_type(file_path: Union[str, Path]) -> str:
         MIME type string
     """
     try:
-        mime = magic.Magic(mime=True)
-        return mime.from_file(str(file_path))
+        return get_mime_detector().from_file(str(file_path))
     except Exception:
         # Fallback to basic detection based on extension
         file_path = Path(file_path)
@@ -112,6 +128,46 @@ def detect_mime_type(file_path: Union[str, Path]) -> str:
         return mime_map.get(extension, "application/octet-stream")
 
 
+# Byte order marks, longest first so UTF-32 LE is not mistaken for UTF-16 LE
+_TEXT_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def detect_text_encoding(prefix: bytes, default: str = "utf-8") -> str:
+    """
+    Detect the encoding of a text file from a prefix of its bytes.
+
+    A byte order mark wins outright, then a prefix that decodes as UTF-8 is
+    taken as UTF-8 (this also covers ASCII); only otherwise is
+    charset-normalizer asked to guess.
+
+    Args:
+        prefix: Leading bytes of the file
+        default: Encoding used when nothing better can be determined
+
+    Returns:
+        Python codec name
+    """
+    for bom, encoding in _TEXT_BOMS:
+        if prefix.startswith(bom):
+            return encoding
+
+    try:
+        # The prefix can end mid-character, so decode it as an incomplete stream
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    best = charset_normalizer.from_bytes(prefix).best()
+    return codecs.lookup(best.encoding).name if best is not None else default
+
+
 def get_file_size(file_path: Union[str, Path]) -> int:
     """
     Get file size in bytes.
@@ -103,103 +103,147 @@ async def process_file_pipeline(
                 db, file_id, chunks, chunking_strategy
             )
 
-            # Step 3: Generate Embeddings
-            logger.info(f"Starting embedding generation for {len(chunks)} chunks")
-            enriched_chunks = await embedding_service.embed_chunks(chunks)
-            logger.info(f"Embedding generation completed, got {len(enriched_chunks)} results")
-
-            # Update chunks with embeddings and collect successful embeddings
-            successful_embeddings = []
-            successful_chunks = []
-
-            for i, chunk_record in enumerate(chunk_records):
-                logger.info(f"Processing chunk {i}: enriched_chunks length={len(enriched_chunks)}")
-                if i < len(enriched_chunks):
-                    logger.info(f"Chunk {i} enriched data keys: {list(enriched_chunks[i].keys())}")
-                    logger.info(f"Chunk {i} success value: {enriched_chunks[i].get('success')}")
-                    logger.info(f"Chunk {i} embedding present: {'embedding' in enriched_chunks[i]}")
-                    if enriched_chunks[i].get("success"):
-                        # Update chunk record with embedding info
-                        await FileChunkCRUD.update_chunk_embedding(
-                            db,
-                            chunk_record.id,
-                            enriched_chunks[i]["embedding"],
-                            enriched_chunks[i]["embedding_model"],
+            # Steps 3 & 4: Generate embeddings and store them in the vector database.
+            # Batches are upserted as soon as they are embedded, so embedding API
+            # latency overlaps with Qdrant writes.
+            successful_embeddings = 0
+            embedding_model = embedding_service.get_model_info()["model"]
+            reused_embeddings = {}
+
+            async def embed_batch(batch_records):
+                nonlocal successful_embeddings
+                # Only chunks without a reusable embedding go to the embedding API
+                to_embed = [
+                    record
+                    for record in batch_records
+                    if record.content_hash not in reused_embeddings
+                ]
+                enriched_chunks = await embedding_service.embed_chunks(
+                    [chunks[record.chunk_index] for record in to_embed]
+                )
+                enriched_by_id = {
+                    record.id: enriched for record, enriched in zip(to_embed, enriched_chunks)
+                }
+
+                embeddings = []
+                embedding_updates = []
+                for chunk_record in batch_records:
+                    reused = reused_embeddings.get(chunk_record.content_hash)
+                    if reused is not None:
+                        embedding_updates.append(
+                            {
+                                "chunk_id": chunk_record.id,
+                                "embedding_model": embedding_model,
+                                "embedding_dimensions": len(reused),
+                            }
                         )
+                        embeddings.append(reused)
+                        continue
 
-                        # Collect for vector storage
-                        successful_embeddings.append(enriched_chunks[i]["embedding"])
-                        successful_chunks.append(chunk_record)
-                        logger.info(f"Added chunk {i} to successful embeddings")
-                    else:
+                    enriched = enriched_by_id[chunk_record.id]
+                    if not enriched.get("success"):
                         logger.warning(
-                            f"Chunk {i} embedding failed or missing success flag: {enriched_chunks[i].get('success')}"
+                            f"Chunk {chunk_record.chunk_index} embedding failed: {enriched.get('error')}"
                         )
-                        logger.warning(f"Chunk {i} error: {enriched_chunks[i].get('error')}")
-                else:
-                    logger.warning(f"Chunk {i} embedding failed or missing")
-
-            logger.info(
-                f"Embedding processing complete: {len(successful_embeddings)} successful embeddings"
-            )
+                        embeddings.append(None)
+                        continue
+
+                    embedding_updates.append(
+                        {
+                            "chunk_id": chunk_record.id,
+                            "embedding_model": enriched["embedding_model"],
+                            "embedding_dimensions": len(enriched["embedding"]),
+                        }
+                    )
+                    embeddings.append(enriched["embedding"])
 
-            # Step 4: Store Embeddings in Vector Database
-            logger.info(
-                f"Vector storage check: successful_embeddings={len(successful_embeddings)}, successful_chunks={len(successful_chunks)}"
-            )
+                # Update chunk records with embedding info in one round-trip
+                successful_embeddings += await FileChunkCRUD.update_chunk_embeddings(
+                    db, embedding_updates
+                )
+                return embeddings
 
-            if successful_embeddings and successful_chunks:
-                try:
-                    from ..core.vector_integration import get_file_vector_service
+            logger.info(f"Starting embedding generation for {len(chunks)} chunks")
+            try:
+                from ..core.vector_integration import get_file_vector_service
 
-                    vector_service = await get_file_vector_service()
+                vector_service = await get_file_vector_service()
 
-                    # Use default collection if file doesn't have one assigned
-                    collection_id = file_record.collection_id or "default_collection"
+                # Use default collection if file doesn't have one assigned
+                collection_id = file_record.collection_id or "default_collection"
 
-                    logger.info(
-                        f"Attempting to store {len(successful_embeddings)} embeddings in collection {collection_id}"
+                # Reuse embeddings of identical chunks already stored in this collection
+                try:
+                    duplicates = await FileChunkCRUD.find_embedded_duplicates(
+                        db,
+                        collection_id,
+                        file_id,
+                        [record.content_hash for record in chunk_records],
+                        embedding_model,
                     )
-
-                    vector_ids = await vector_service.store_chunk_embeddings(
-                        chunks=successful_chunks,
-                        embeddings=successful_embeddings,
-                        collection_id=collection_id,
+                    stored = await vector_service.get_chunk_embeddings(
+                        list(set(duplicates.values())), collection_id
                     )
-
-                    # Update chunk records with vector IDs
-                    for chunk_record, vector_id in zip(successful_chunks, vector_ids):
-                        await FileChunkCRUD.update_chunk_embedding(
-                            db,
-                            chunk_record.id,
-                            None,  # Embedding already stored in vector DB
-                            chunk_record.embedding_model,  # Keep existing model
-                            vector_id=vector_id,
-                        )
-
+                    reused_embeddings = {
+                        content_hash: stored[vector_id]
+                        for content_hash, vector_id in duplicates.items()
+                        if vector_id in stored
+                    }
                     logger.info(
-                        f"Successfully stored {len(vector_ids)} embeddings in vector database for file {file_id} in collection {collection_id}"
+                        f"Reusing {len(reused_embeddings)} existing embeddings for file {file_id}"
                     )
-
                 except Exception as e:
-                    logger.error(
-                        f"Failed to store embeddings in vector database: {e}", exc_info=True
-                    )
-                    # Don't fail the entire pipeline for vector storage issues
-                    # The embeddings are still stored in the database
-            else:
-                logger.warning(
-                    f"Skipping vector storage: successful_embeddings={len(successful_embeddings)}, successful_chunks={len(successful_chunks)}"
+                    logger.warning(f"Chunk deduplication skipped: {e}")
+
+                vector_ids = await vector_service.embed_and_store_chunks(
+                    chunks=chunk_records,
+                    embed_fn=embed_batch,
+                    collection_id=collection_id,
+                )
+
+                # Update chunk records with vector IDs
+                await FileChunkCRUD.update_chunk_embeddings(
+                    db,
+                    [
+                        {
+                            "chunk_id": chunk_record.id,
+                            "vector_id": vector_ids[str(chunk_record.id)],
+                        }
+                        for chunk_record in chunk_records
+                        if str(chunk_record.id) in vector_ids
+                    ],
+                )
+                await FileChunkCRUD.add_chunk_hashes_to_filter(
+                    collection_id,
+                    [
+                        chunk_record.content_hash
+                        for chunk_record in chunk_records
+                        if str(chunk_record.id) in vector_ids
+                    ],
+                )
+
+                logger.info(
+                    f"Successfully stored {len(vector_ids)} embeddings in vector database for file {file_id} in collection {collection_id}"
                 )
 
+            except Exception as e:
+                logger.error(f"Failed to store embeddings in vector database: {e}", exc_info=True)
+                # A file that is only partly in Qdrant is only partly searchable; fail it so it
+                # gets reprocessed rather than reported as processed
+                raise RuntimeError(f"Vector storage failed: {e}") from e
+
+            logger.info(
+                f"Embedding processing complete: {successful_embeddings} successful embeddings"
+            )
+
             # Update file status to processed
             processing_metadata = {
                 "extraction_metadata": extraction_result["metadata"],
                 "chunking_strategy": chunking_strategy.value,
                 "chunk_count": len(chunks),
-                "successful_embeddings": len(successful_embeddings),
+                "successful_embeddings": successful_embeddings,
                 "embedding_model": embedding_service.get_model_info(),
-                "vector_storage": len(successful_embeddings) > 0,
+                "vector_storage": successful_embeddings > 0,
             }
 
             await FileCRUD.update_file_status(
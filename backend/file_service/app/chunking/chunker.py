@@ -3,12 +3,57 @@ Text Chunking Service
 Implements different chunking strategies following DRY principles
 """
 
+import math
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from backend.file_service.app.models.file import ChunkingStrategy
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class Chunk(NamedTuple):
+    """A chunk of text with its position in the source document"""
+
+    text: str
+    index: int
+    start_position: Optional[int]
+    end_position: Optional[int]
+    metadata: Dict[str, Any]
+
+
+def _window_stride(chunk_size: int, overlap: int) -> int:
+    """Stride between sliding windows; raises ValueError if the windows would not advance"""
+    stride = chunk_size - overlap
+    if stride <= 0:
+        raise ValueError("Chunk overlap must be smaller than chunk size")
+    return stride
+
+
+def sliding_window_count(text_length: int, chunk_size: int, overlap: int) -> int:
+    """Number of windows sliding_window_positions yields, without building them"""
+    if text_length <= chunk_size:
+        return 1
+
+    return math.ceil((text_length - chunk_size) / _window_stride(chunk_size, overlap)) + 1
+
+
+def sliding_window_positions(
+    text_length: int, chunk_size: int, overlap: int
+) -> List[Tuple[int, int]]:
+    """Compute (start, end) offsets of sliding windows with stride chunk_size - overlap"""
+    if text_length <= chunk_size:
+        return [(0, text_length)]
+
+    stride = _window_stride(chunk_size, overlap)
+
+    # Yields ceil((N - K) / S) + 1 windows; the last one is clipped to the end of the text
+    return [
+        (start, min(start + chunk_size, text_length))
+        for start in range(0, text_length - overlap, stride)
+    ]
+
 
 class BaseChunker(ABC):
     """Base class for text chunkers following DRY principles"""
@@ -18,9 +63,7 @@ class BaseChunker(ABC):
         self.overlap = overlap
 
     @abstractmethod
-    def chunk_text(
-        self, text: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Chunk]:
         """Chunk text and return list of chunks with metadata"""
         pass
 
@@ -36,20 +79,25 @@ class BaseChunker(ABC):
         start_pos: int = None,
         end_pos: int = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        already_clean: bool = False,
+    ) -> Chunk:
         """Create standardized chunk object"""
-        return {
-            "text": text.strip(),
-            "index": index,
-            "start_position": start_pos,
-            "end_position": end_pos,
-            "metadata": metadata or {},
-        }
+        return Chunk(
+            text=text if already_clean else text.strip(),
+            index=index,
+            start_position=start_pos,
+            end_position=end_pos,
+            metadata=metadata or {},
+        )
 
     def _clean_text(self, text: str) -> str:
         """Clean text by removing excessive whitespace"""
+        # ASCII fast path: str.split() collapses whitespace runs in a tight C loop
+        if text.isascii():
+            return " ".join(text.split())
+
         # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
+        text = _WHITESPACE_RE.sub(" ", text)
         return text.strip()
 
 
@@ -59,51 +107,25 @@ class FixedSizeChunker(BaseChunker):
     def get_strategy(self) -> ChunkingStrategy:
         return ChunkingStrategy.FIXED
 
-    def chunk_text(
-        self, text: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Chunk]:
         """Chunk text into fixed-size chunks with overlap"""
         text = self._clean_text(text)
-        chunks = []
 
-        if len(text) <= self.chunk_size:
-            # Text is smaller than chunk size, return as single chunk
-            chunks.append(
-                self._create_chunk(
-                    text=text, index=0, start_pos=0, end_pos=len(text), metadata=metadata
-                )
-            )
-            return chunks
-
-        start = 0
-        chunk_index = 0
-
-        while start < len(text):
-            # Calculate end position
-            end = min(start + self.chunk_size, len(text))
-
-            # Extract chunk
-            chunk_text = text[start:end]
-
-            chunks.append(
-                self._create_chunk(
-                    text=chunk_text,
-                    index=chunk_index,
-                    start_pos=start,
-                    end_pos=end,
-                    metadata=metadata,
-                )
+        # Only materialize substrings once the window offsets are known
+        return [
+            self._create_chunk(
+                text=text[start:end],
+                index=chunk_index,
+                start_pos=start,
+                end_pos=end,
+                metadata=metadata,
             )
+            for chunk_index, (start, end) in enumerate(self.chunk_positions(text))
+        ]
 
-            # Move start position with overlap
-            start = end - self.overlap
-            chunk_index += 1
-
-            # Prevent infinite loop if overlap is too large
-            if start >= end:
-                break
-
-        return chunks
+    def chunk_positions(self, text: str) -> List[Tuple[int, int]]:
+        """Get (start, end) offsets of each chunk without copying any text"""
+        return sliding_window_positions(len(text), self.chunk_size, self.overlap)
 
 
 class RecursiveChunker(BaseChunker):
@@ -123,20 +145,22 @@ class RecursiveChunker(BaseChunker):
             " ",  # Space
             "",  # Character level (last resort)
         ]
+        # Single-pass scanner for every non-empty separator, longest alternatives first
+        self._separator_pattern = re.compile(
+            "|".join(re.escape(sep) for sep in self.separators if sep)
+        )
 
     def get_strategy(self) -> ChunkingStrategy:
         return ChunkingStrategy.RECURSIVE
 
-    def chunk_text(
-        self, text: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Chunk]:
         """Chunk text recursively using natural boundaries"""
         text = self._clean_text(text)
         return self._recursive_split(text, 0, metadata or {})
 
     def _recursive_split(
         self, text: str, start_offset: int = 0, metadata: Dict[str, Any] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Chunk]:
         """Recursively split text using separators"""
         if len(text) <= self.chunk_size:
             return [
@@ -146,27 +170,35 @@ class RecursiveChunker(BaseChunker):
                     start_pos=start_offset,
                     end_pos=start_offset + len(text),
                     metadata=metadata,
+                    already_clean=True,  # Whole text was stripped by _clean_text
                 )
             ]
 
-        # Try each separator
-        for separator in self.separators:
-            if separator in text:
-                chunks = self._split_by_separator(text, separator, start_offset, metadata)
-                if chunks:
-                    return chunks
+        # Try each separator present in the text, scanning it only once
+        for separator in self._present_separators(text):
+            chunks = self._split_by_separator(text, separator, start_offset, metadata)
+            if chunks:
+                return chunks
 
-        # If no separator works, fall back to fixed-size chunking
+        # If no separator works, fall back to character-level fixed-size chunking
         return self._fallback_split(text, start_offset, metadata)
 
+    def _present_separators(self, text: str) -> List[str]:
+        """Get the non-empty separators occurring in text, in order of preference"""
+        found = set(self._separator_pattern.findall(text))
+        # A separator nested in a matched one (e.g. "\n" in "\n\n") is present as well
+        return [sep for sep in self.separators if sep and any(sep in match for match in found)]
+
     def _split_by_separator(
         self, text: str, separator: str, start_offset: int, metadata: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Chunk]:
         """Split text by a specific separator"""
         parts = text.split(separator)
         chunks = []
         current_chunk = ""
         current_start = start_offset
+        # Exact offset of the next unconsumed character in the original text
+        cursor = start_offset
 
         for i, part in enumerate(parts):
             # Add separator back (except for last part)
@@ -186,15 +218,17 @@ class RecursiveChunker(BaseChunker):
                             text=current_chunk,
                             index=len(chunks),
                             start_pos=current_start,
-                            end_pos=current_start + len(current_chunk),
+                            end_pos=cursor,
                             metadata=metadata,
                         )
                     )
 
-                # Start new chunk
-                current_start = current_start + len(current_chunk) - self.overlap
+                # Start new chunk exactly where this part begins
+                current_start = cursor
                 current_chunk = part_with_sep
 
+            cursor += len(part_with_sep)
+
         # Add final chunk
         if current_chunk.strip():
             chunks.append(
@@ -211,30 +245,20 @@ class RecursiveChunker(BaseChunker):
 
     def _fallback_split(
         self, text: str, start_offset: int, metadata: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Chunk]:
         """Fallback to fixed-size splitting"""
-        chunks = []
-        start = 0
-
-        while start < len(text):
-            end = min(start + self.chunk_size, len(text))
-            chunk_text = text[start:end]
-
-            chunks.append(
-                self._create_chunk(
-                    text=chunk_text,
-                    index=len(chunks),
-                    start_pos=start_offset + start,
-                    end_pos=start_offset + end,
-                    metadata=metadata,
-                )
+        return [
+            self._create_chunk(
+                text=text[start:end],
+                index=index,
+                start_pos=start_offset + start,
+                end_pos=start_offset + end,
+                metadata=metadata,
             )
-
-            start = end - self.overlap
-            if start >= end:
-                break
-
-        return chunks
+            for index, (start, end) in enumerate(
+                sliding_window_positions(len(text), self.chunk_size, self.overlap)
+            )
+        ]
 
 
 class ParagraphChunker(BaseChunker):
@@ -243,9 +267,7 @@ class ParagraphChunker(BaseChunker):
     def get_strategy(self) -> ChunkingStrategy:
         return ChunkingStrategy.PARAGRAPH
 
-    def chunk_text(
-        self, text: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Chunk]:
         """Chunk text by paragraphs, combining small ones"""
         text = self._clean_text(text)
 
@@ -270,6 +292,7 @@ class ParagraphChunker(BaseChunker):
                         start_pos=current_start,
                         end_pos=current_start + len(current_chunk),
                         metadata=metadata,
+                        already_clean=True,
                     )
                 )
 
@@ -283,8 +306,8 @@ class ParagraphChunker(BaseChunker):
                 else:
                     current_chunk = paragraph
 
-        # Add final chunk
-        if current_chunk.strip():
+        # Add final chunk (paragraphs are stripped, so no need to strip again)
+        if current_chunk:
             chunks.append(
                 self._create_chunk(
                     text=current_chunk,
@@ -292,6 +315,7 @@ class ParagraphChunker(BaseChunker):
                     start_pos=current_start,
                     end_pos=current_start + len(current_chunk),
                     metadata=metadata,
+                    already_clean=True,
                 )
             )
 
@@ -304,9 +328,7 @@ class SemanticChunker(BaseChunker):
     def get_strategy(self) -> ChunkingStrategy:
         return ChunkingStrategy.SEMANTIC
 
-    def chunk_text(
-        self, text: str, metadata: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Chunk]:
         """Semantic chunking - currently falls back to recursive chunking"""
         # TODO: Implement semantic chunking using sentence embeddings
         # For now, fall back to recursive chunking
@@ -342,16 +364,15 @@ class ChunkingService:
         chunk_size: int = 1000,
         overlap: int = 100,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Chunk]:
         """Chunk text using specified strategy"""
         chunker = self.get_chunker(strategy, chunk_size, overlap)
         chunks = chunker.chunk_text(text, metadata)
 
         # Reindex chunks to ensure sequential numbering
-        for i, chunk in enumerate(chunks):
-            chunk["index"] = i
-
-        return chunks
+        return [
+            chunk if chunk.index == i else chunk._replace(index=i) for i, chunk in enumerate(chunks)
+        ]
 
     def get_supported_strategies(self) -> List[ChunkingStrategy]:
         """Get list of supported chunking strategies"""
@@ -359,8 +380,4 @@ class ChunkingService:
 
     def estimate_chunks(self, text_length: int, chunk_size: int = 1000, overlap: int = 100) -> int:
         """Estimate number of chunks for given text length"""
-        if text_length <= chunk_size:
-            return 1
-
-        effective_chunk_size = chunk_size - overlap
-        return max(1, (text_length - overlap) // effective_chunk_size + 1)
+        return sliding_window_count(text_length, chunk_size, overlap)
@@ -5,9 +5,12 @@ Handles storing and retrieving embeddings in Qdrant vector database
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 from uuid import UUID
 
+import numpy as np
+from tenacity import retry, stop_after_attempt, wait_exponential
+
 from backend.common.database.models import DocumentChunk
 from backend.common.database.vector import (
     VectorPoint,
@@ -50,44 +53,49 @@ class FileVectorService:
         )
 
     async def store_chunk_embeddings(
-        self, chunks: List[DocumentChunk], embeddings: List[List[float]], collection_id: str
+        self,
+        chunks: List[DocumentChunk],
+        embeddings: Union[np.ndarray, List[List[float]]],
+        collection_id: str,
+        ensure_collection: bool = True,
     ) -> List[str]:
         """Store chunk embeddings in Qdrant"""
         if not self.vector_service:
             await self.initialize()
 
-        if len(chunks) != len(embeddings):
+        # Keep the batch as one contiguous (N, D) float32 matrix
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2 or len(chunks) != vectors.shape[0]:
             raise ValueError("Number of chunks must match number of embeddings")
 
-        # Ensure collection exists
-        await self.ensure_collection_exists(collection_id, len(embeddings[0]))
+        # Ensure collection exists (callers storing several batches do this once)
+        if ensure_collection:
+            await self.ensure_collection_exists(collection_id, vectors.shape[1])
 
         collection_name = await self.get_collection_name(collection_id)
 
-        # Create vector points
-        vector_points = []
-        vector_ids = []
-
-        for chunk, embedding in zip(chunks, embeddings):
-            vector_id = str(chunk.id)
-            vector_ids.append(vector_id)
-
-            # Create payload with chunk metadata
-            payload = {
-                "chunk_id": str(chunk.id),
-                "file_id": str(chunk.file_id),
-                "collection_id": collection_id,
-                "chunk_index": chunk.chunk_index,
-                "content": chunk.content,
-                "content_length": chunk.content_length,
-                "embedding_model": chunk.embedding_model,
-                "page_number": chunk.page_number,
-                "section_title": chunk.section_title,
-                "chunk_metadata": chunk.chunk_metadata or {},
-            }
-
-            vector_point = VectorPoint(id=vector_id, vector=embedding, payload=payload)
-            vector_points.append(vector_point)
+        # Create vector points in a single pass. Vectors stay float32: with int8
+        # embedding_quantization the collection quantizes server-side and keeps the originals
+        vector_points = [
+            VectorPoint(
+                id=str(chunk.id),
+                vector=vector,
+                payload={
+                    "chunk_id": str(chunk.id),
+                    "file_id": str(chunk.file_id),
+                    "collection_id": collection_id,
+                    "chunk_index": chunk.chunk_index,
+                    "content": chunk.content,
+                    "content_length": chunk.content_length,
+                    "embedding_model": chunk.embedding_model,
+                    "page_number": chunk.page_number,
+                    "section_title": chunk.section_title,
+                    "chunk_metadata": chunk.chunk_metadata or {},
+                },
+            )
+            for chunk, vector in zip(chunks, vectors)
+        ]
+        vector_ids = [point.id for point in vector_points]
 
         # Store in Qdrant
         success = await self.vector_service.upsert_points(
@@ -100,9 +108,85 @@ class FileVectorService:
         else:
             raise RuntimeError("Failed to store embeddings in Qdrant")
 
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=0.5, max=5), reraise=True)
+    async def _store_batch_with_retry(
+        self, chunks: List[DocumentChunk], embeddings: List[List[float]], collection_id: str
+    ) -> List[str]:
+        """Store one batch of a multi-batch upload, retrying transient Qdrant failures"""
+        return await self.store_chunk_embeddings(
+            chunks=chunks,
+            embeddings=embeddings,
+            collection_id=collection_id,
+            ensure_collection=False,
+        )
+
+    async def embed_and_store_chunks(
+        self,
+        chunks: List[DocumentChunk],
+        embed_fn: Callable[[List[DocumentChunk]], Awaitable[List[Optional[List[float]]]]],
+        collection_id: str,
+        batch_size: int = 64,
+    ) -> Dict[str, str]:
+        """Embed chunks in batches and upsert each batch as soon as it is ready
+
+        embed_fn returns one embedding per chunk, or None for chunks that failed
+        to embed (those are skipped). Embedding of the next batch overlaps with
+        the Qdrant upsert of the previous one. Returns chunk ID -> vector ID.
+        A batch that still fails after retries raises, so the file is never
+        reported as stored when only part of it is.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+        vector_ids: Dict[str, str] = {}
+
+        async def produce() -> None:
+            try:
+                for start in range(0, len(chunks), batch_size):
+                    batch = chunks[start : start + batch_size]
+                    embeddings = await embed_fn(batch)
+                    await queue.put(
+                        [
+                            (chunk, embedding)
+                            for chunk, embedding in zip(batch, embeddings)
+                            if embedding is not None
+                        ]
+                    )
+            except Exception:
+                # Let the consumer finish the batches already queued
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        async def consume() -> None:
+            collection_ready = False
+            while (embedded := await queue.get()) is not None:
+                if not embedded:
+                    continue
+                batch_chunks = [chunk for chunk, _ in embedded]
+                batch_embeddings = [embedding for _, embedding in embedded]
+                if not collection_ready:
+                    await self.ensure_collection_exists(collection_id, len(batch_embeddings[0]))
+                    collection_ready = True
+                batch_ids = await self._store_batch_with_retry(
+                    batch_chunks, batch_embeddings, collection_id
+                )
+                vector_ids.update(
+                    (str(chunk.id), vector_id) for chunk, vector_id in zip(batch_chunks, batch_ids)
+                )
+
+        producer = asyncio.create_task(produce())
+        try:
+            await consume()
+            await producer
+        finally:
+            # A failed upsert must not leave the producer blocked on a full queue
+            if not producer.done():
+                producer.cancel()
+
+        return vector_ids
+
     async def search_similar_chunks(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         collection_id: str,
         limit: int = 10,
         score_threshold: float = 0.0,
@@ -132,7 +216,7 @@ class FileVectorService:
 
     async def search_across_collections(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         collection_ids: List[str],
         limit: int = 10,
         score_threshold: float = 0.0,
@@ -142,22 +226,30 @@ class FileVectorService:
         if not self.vector_service:
             await self.initialize()
 
-        all_results = []
+        # Convert once so every concurrent search shares the same float32 buffer
+        query_embedding = np.asarray(query_embedding, dtype=np.float32)
 
-        # Search each collection
-        for collection_id in collection_ids:
-            try:
-                results = await self.search_similar_chunks(
+        # Search all collections concurrently
+        search_results = await asyncio.gather(
+            *[
+                self.search_similar_chunks(
                     query_embedding=query_embedding,
                     collection_id=collection_id,
                     limit=limit,
                     score_threshold=score_threshold,
                     filters=filters,
                 )
-                all_results.extend(results)
-            except Exception as e:
-                logger.warning(f"Failed to search collection '{collection_id}': {e}")
+                for collection_id in collection_ids
+            ],
+            return_exceptions=True,
+        )
+
+        all_results = []
+        for collection_id, results in zip(collection_ids, search_results):
+            if isinstance(results, Exception):
+                logger.warning(f"Failed to search collection '{collection_id}': {results}")
                 continue
+            all_results.extend(results)
 
         # Sort by score and limit results
         all_results.sort(key=lambda x: x.score, reverse=True)
@@ -178,6 +270,20 @@ class FileVectorService:
 
         return result
 
+    async def get_chunk_embeddings(
+        self, vector_ids: List[str], collection_id: str
+    ) -> Dict[str, List[float]]:
+        """Fetch stored embeddings by vector ID"""
+        if not self.vector_service:
+            await self.initialize()
+
+        collection_name = await self.get_collection_name(collection_id)
+
+        points = await self.vector_service.get_points(
+            collection_name=collection_name, point_ids=vector_ids, with_vector=True
+        )
+        return {point.id: point.vector for point in points if point.vector is not None}
+
     async def delete_chunk_embeddings(self, chunk_ids: List[str], collection_id: str) -> bool:
         """Delete chunk embeddings from Qdrant"""
         if not self.vector_service:
@@ -204,23 +310,9 @@ class FileVectorService:
 
         collection_name = await self.get_collection_name(collection_id)
 
-        # Search for all chunks from this file
-        results = await self.vector_service.search_vectors(
-            collection_name=collection_name,
-            query_vector=[0.0] * 1536,  # Dummy vector for filter-only search
-            limit=10000,  # Large limit to get all chunks
-            filters={"file_id": file_id},
-        )
-
-        if not results:
-            return True
-
-        # Extract vector IDs
-        vector_ids = [result.id for result in results]
-
-        # Delete the points
-        return await self.vector_service.delete_points(
-            collection_name=collection_name, point_ids=vector_ids
+        # Delete by payload filter in a single request
+        return await self.vector_service.delete_points_by_filter(
+            collection_name=collection_name, filters={"file_id": file_id}
         )
 
     async def get_collection_stats(self, collection_id: str) -> Dict[str, Any]:
@@ -4,18 +4,39 @@ Database operations for file management following DRY principles
 Updated to work with existing shared models
 """
 
+import asyncio
+import functools
 import hashlib
+import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
 
-import aiofiles
-import magic
+from cachetools import TTLCache
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import and_, or_, select
+from sqlalchemy import (
+    JSON,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 
+from backend.common.database.redis import BloomFilter, get_bloom_filter
+from backend.common.utils import get_mime_detector
+from backend.file_service.app.chunking.chunker import Chunk
 from backend.file_service.app.models.file import (
     ChunkingStrategy,
     File,
@@ -25,6 +46,93 @@ from backend.file_service.app.models.file import (
     ProcessingJob,
 )
 
+logger = logging.getLogger(__name__)
+
+# Uploads are hashed and written in 1 MiB pieces; libmagic only needs the header
+UPLOAD_CHUNK_SIZE = 1 << 20
+MIME_SNIFF_BYTES = 4096
+
+# Per-owner Bloom filter of uploaded checksums (false positives fall through to SQL)
+CHECKSUM_FILTER_NAME = "user:{user_id}:chk"
+
+# user_id -> default collection id, so uploads without a collection skip the lookup
+_default_collection_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Cached result of FileCRUD._stats_triggers_installed
+_stats_triggers_present: Optional[bool] = None
+
+# Per-collection Bloom filter of chunk content hashes
+CHUNK_FILTER_NAME = "collection:{collection_id}:chunks"
+
+
+def chunk_content_hash(text: str) -> str:
+    """SHA-256 of normalized chunk text, used to spot chunks that were already embedded"""
+    return hashlib.sha256(text.strip().lower().encode()).hexdigest()
+
+
+def merge_json(column, patch):
+    """SQL expression merging a JSONB patch into a JSON column (jsonb ||), NULL-safe"""
+    existing = func.coalesce(cast(column, JSONB), cast("{}", JSONB))
+    return cast(existing.op("||")(patch), JSON)
+
+
+@functools.lru_cache(maxsize=16)
+def _ensure_storage_dir(path: str) -> None:
+    """Create a storage directory once per process"""
+    os.makedirs(path, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=16)
+def _supports_linked_tmpfile(path: str) -> bool:
+    """Check once whether unnamed O_TMPFILE files can be created and linked in a directory"""
+    if not hasattr(os, "O_TMPFILE"):
+        return False
+
+    probe_path = os.path.join(path, f".probe_{uuid4().hex}")
+    try:
+        fd = os.open(path, os.O_TMPFILE | os.O_WRONLY, 0o600)
+        try:
+            os.link(f"/proc/self/fd/{fd}", probe_path)
+        finally:
+            os.close(fd)
+        os.remove(probe_path)
+        return True
+    except OSError:
+        return False
+
+
+def _open_upload(storage_path: str) -> Tuple[int, Optional[str]]:
+    """
+    Open a file for an incoming upload
+    Returns: (fd, temp_path) - temp_path is None for an unnamed O_TMPFILE, which never
+    shows up in the directory until it is linked and vanishes by itself on failure
+    """
+    if _supports_linked_tmpfile(storage_path):
+        return os.open(storage_path, os.O_TMPFILE | os.O_WRONLY, 0o644), None
+
+    temp_path = os.path.join(storage_path, f".upload_{uuid4().hex}")
+    return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644), temp_path
+
+
+def _publish_upload(fd: int, temp_path: Optional[str], file_path: str) -> None:
+    """Give a fully written upload its final name"""
+    if temp_path is not None:
+        os.replace(temp_path, file_path)
+        return
+
+    try:
+        os.link(f"/proc/self/fd/{fd}", file_path)
+    except FileExistsError:
+        # Stored names start with the checksum, so the existing file has the same content
+        pass
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, retrying short writes"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
 class FileCRUD:
     """File CRUD operations following DRY principles"""
@@ -37,7 +145,12 @@ class FileCRUD:
         if user_id:
             from backend.common.database.models import Collection
 
-            query = query.join(Collection).filter(Collection.owner_id == user_id)
+            # Populate File.collection from the join instead of a later lazy load
+            query = (
+                query.join(Collection)
+                .filter(Collection.owner_id == user_id)
+                .options(contains_eager(File.collection))
+            )
 
         result = await db.execute(query)
         return result.scalar_one_or_none()
@@ -67,23 +180,66 @@ class FileCRUD:
         return result.scalars().all()
 
     @staticmethod
-    async def get_file_by_checksum(db: AsyncSession, checksum: str, user_id: str) -> Optional[File]:
+    async def get_file_by_checksum(
+        db: AsyncSession, checksum: str, user_id: str, use_bloom_filter: bool = True
+    ) -> Optional[File]:
         """Get file by checksum to detect duplicates within user's collections"""
         from backend.common.database.models import Collection
 
-        # Check for files with matching checksum in metadata
+        # Most uploads are new files - a negative Bloom filter answer skips the query
+        if use_bloom_filter and not await FileCRUD.checksum_may_exist(db, checksum, user_id):
+            return None
+
+        # Indexed lookup on the checksum column
         result = await db.execute(
             select(File)
             .join(Collection)
-            .filter(
-                and_(
-                    Collection.owner_id == user_id,
-                    File.file_metadata.op("->>")("checksum") == checksum,
-                )
-            )
+            .filter(and_(Collection.owner_id == user_id, File.checksum == checksum))
+            .limit(1)
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def checksum_may_exist(db: AsyncSession, checksum: str, user_id: str) -> bool:
+        """Check the owner's checksum Bloom filter, seeding it from the database on first use"""
+        from backend.common.database.models import Collection
+
+        try:
+            bloom = await get_bloom_filter()
+        except Exception as e:
+            logger.error(f"Bloom filter unavailable, checking checksum in database: {e}")
+            return True
+        if bloom is None:
+            return True
+
+        filter_name = CHECKSUM_FILTER_NAME.format(user_id=user_id)
+        found = await bloom.might_contain(filter_name, checksum)
+        if found is not None:
+            return found
+
+        # Filter missing: seed it with the owner's existing checksums
+        result = await db.execute(
+            select(File.checksum).join(Collection).filter(Collection.owner_id == user_id)
+        )
+        checksums = set(result.scalars().all())
+        await bloom.seed(filter_name, checksums)
+        return checksum in checksums
+
+    @staticmethod
+    async def add_checksum_to_filter(checksum: str, user_id: str) -> None:
+        """Record an uploaded checksum in the owner's Bloom filter"""
+        try:
+            bloom = await get_bloom_filter()
+        except Exception as e:
+            logger.error(f"Bloom filter unavailable, checksum not recorded: {e}")
+            return
+        if bloom is None:
+            return
+
+        # Recorded even before the filter is seeded: lookups only trust a seeded filter, and
+        # seeding adds to whatever is already there
+        await bloom.add(CHECKSUM_FILTER_NAME.format(user_id=user_id), [checksum])
+
     @staticmethod
     def calculate_file_checksum(file_content: bytes) -> str:
         """Calculate SHA-256 checksum of file content"""
@@ -125,6 +281,10 @@ class FileCRUD:
         """Get or create a default collection for the user"""
         from backend.common.database.models import Collection, CollectionStatus
 
+        collection_id = _default_collection_cache.get(str(user_id))
+        if collection_id:
+            return collection_id
+
         # Try to find existing default collection
         result = await db.execute(
             select(Collection).filter(
@@ -151,6 +311,7 @@ class FileCRUD:
             await db.commit()
             await db.refresh(collection)
 
+        _default_collection_cache[str(user_id)] = collection.id
         return collection.id
 
     @staticmethod
@@ -163,76 +324,110 @@ class FileCRUD:
     ) -> File:
         """Create a new file record and save file to storage"""
 
-        # Read file content
-        file_content = await upload_file.read()
-        file_size = len(file_content)
-
-        # Calculate checksum
-        checksum = FileCRUD.calculate_file_checksum(file_content)
-
-        # Check for duplicates
-        existing_file = await FileCRUD.get_file_by_checksum(db, checksum, user_id)
-        if existing_file:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"File already exists: {existing_file.original_filename}",
-            )
+        # Ensure storage directory exists
+        _ensure_storage_dir(storage_path)
 
-        # Detect MIME type
-        mime_type = magic.from_buffer(file_content, mime=True)
+        # Stream the upload to an unnamed temporary file, hashing it on the way
+        hasher = hashlib.sha256()
+        file_size = 0
+        header = b""
+        fd, temp_path = _open_upload(storage_path)
+        pending_write = None
 
-        # Detect file type
-        file_type = FileCRUD.detect_file_type(upload_file.filename, mime_type)
+        try:
+            # Each chunk is written in a worker thread while the next one is read
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                if not header:
+                    header = chunk[:MIME_SNIFF_BYTES]
+                hasher.update(chunk)
+                if pending_write:
+                    await pending_write
+                pending_write = asyncio.ensure_future(asyncio.to_thread(_write_all, fd, chunk))
+                file_size += len(chunk)
+            if pending_write:
+                await pending_write
+
+            checksum = hasher.hexdigest()
+
+            # Check for duplicates across all of the owner's collections
+            existing_file = await FileCRUD.get_file_by_checksum(db, checksum, user_id)
+            if existing_file:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"File already exists: {existing_file.original_filename}",
+                )
 
-        # Get or create collection
-        if not collection_id:
-            collection_id = await FileCRUD.get_or_create_default_collection(db, user_id)
+            # Detect MIME type
+            mime_type = get_mime_detector().from_buffer(header)
 
-        # Generate unique filename
-        unique_filename = f"{checksum[:16]}_{upload_file.filename}"
-        file_path = os.path.join(storage_path, unique_filename)
+            # Detect file type
+            file_type = FileCRUD.detect_file_type(upload_file.filename, mime_type)
 
-        # Ensure storage directory exists
-        os.makedirs(storage_path, exist_ok=True)
+            # Get or create collection
+            if not collection_id:
+                collection_id = await FileCRUD.get_or_create_default_collection(db, user_id)
 
-        # Save file to storage
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_content)
+            # Generate unique filename
+            unique_filename = f"{checksum[:16]}_{upload_file.filename}"
+            file_path = os.path.join(storage_path, unique_filename)
 
-        # Create file metadata including checksum
-        file_metadata = {
-            "checksum": checksum,
-            "upload_timestamp": datetime.utcnow().isoformat(),
-            "original_size": file_size,
-        }
+            # Create file metadata including checksum
+            file_metadata = {
+                "checksum": checksum,
+                "upload_timestamp": datetime.utcnow().isoformat(),
+                "original_size": file_size,
+            }
 
-        # Create file record using existing schema
-        db_file = File(
-            filename=unique_filename,
-            original_filename=upload_file.filename,
-            file_path=file_path,
-            file_size=file_size,
-            file_type=file_type,
-            mime_type=mime_type,
-            collection_id=collection_id,
-            status=FileStatus.UPLOADED,
-            file_metadata=file_metadata,
-        )
+            # Create file record using existing schema
+            db_file = File(
+                filename=unique_filename,
+                original_filename=upload_file.filename,
+                file_path=file_path,
+                file_size=file_size,
+                file_type=file_type,
+                mime_type=mime_type,
+                collection_id=collection_id,
+                status=FileStatus.UPLOADED,
+                checksum=checksum,
+                file_metadata=file_metadata,
+            )
 
-        try:
+            # The unique (collection_id, checksum) index rejects duplicates atomically,
+            # so flush before the upload is published over any existing file
             db.add(db_file)
+            try:
+                await db.flush()
+            except IntegrityError:
+                await db.rollback()
+                # The cached default collection may have been deleted elsewhere
+                _default_collection_cache.pop(str(user_id), None)
+                existing_file = await FileCRUD.get_file_by_checksum(
+                    db, checksum, user_id, use_bloom_filter=False
+                )
+                if existing_file:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"File already exists: {existing_file.original_filename}",
+                    )
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to create file record",
+                )
+
+            # Publish the upload under its final name and persist the record
+            _publish_upload(fd, temp_path, file_path)
             await db.commit()
             await db.refresh(db_file)
+
+            await FileCRUD.add_checksum_to_filter(checksum, user_id)
             return db_file
-        except IntegrityError:
-            await db.rollback()
-            # Clean up file if database operation fails
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to create file record",
-            )
+        finally:
+            # Never close the descriptor under a write that is still running
+            if pending_write and not pending_write.done():
+                await asyncio.wait([pending_write])
+            os.close(fd)
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
 
     @staticmethod
     async def update_file_status(
@@ -243,48 +438,56 @@ class FileCRUD:
         processing_metadata: Optional[Dict[str, Any]] = None,
     ) -> Optional[File]:
         """Update file processing status"""
-        file = await FileCRUD.get_file_by_id(db, file_id)
-        if not file:
-            return None
-
-        file.status = status
+        values = {"status": status}
         if error_message:
-            file.error_message = error_message
+            values["error_message"] = error_message
         if processing_metadata:
-            # Store in file_metadata field
-            if file.file_metadata:
-                file.file_metadata.update(processing_metadata)
-            else:
-                file.file_metadata = processing_metadata
+            # Merge into file_metadata server-side
+            values["file_metadata"] = merge_json(
+                File.file_metadata, literal(processing_metadata, type_=JSONB)
+            )
 
         if status == FileStatus.PROCESSING:
-            file.processing_started_at = datetime.utcnow()
+            values["processing_started_at"] = func.now()
         elif status in [FileStatus.PROCESSED, FileStatus.FAILED]:
-            file.processing_completed_at = datetime.utcnow()
+            values["processing_completed_at"] = func.now()
 
-        await db.commit()
-        await db.refresh(file)
-        return file
+        return await FileCRUD._update_file(db, file_id, values)
 
     @staticmethod
     async def update_extracted_text(
         db: AsyncSession, file_id: str, extracted_text: str
     ) -> Optional[File]:
         """Update file with extracted text length"""
-        file = await FileCRUD.get_file_by_id(db, file_id)
-        if not file:
-            return None
-
-        file.extracted_text_length = len(extracted_text)
+        text_length = len(extracted_text)
 
         # Store text length in metadata
-        if file.file_metadata:
-            file.file_metadata["extracted_text_length"] = len(extracted_text)
-        else:
-            file.file_metadata = {"extracted_text_length": len(extracted_text)}
+        return await FileCRUD._update_file(
+            db,
+            file_id,
+            {
+                "extracted_text_length": text_length,
+                "file_metadata": merge_json(
+                    File.file_metadata,
+                    literal({"extracted_text_length": text_length}, type_=JSONB),
+                ),
+            },
+        )
 
+    @staticmethod
+    async def _update_file(
+        db: AsyncSession, file_id: str, values: Dict[str, Any]
+    ) -> Optional[File]:
+        """Apply an UPDATE ... RETURNING to one file and commit"""
+        result = await db.execute(
+            update(File)
+            .where(File.id == file_id)
+            .values(**values)
+            .returning(File)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        file = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(file)
         return file
 
     @staticmethod
@@ -304,10 +507,25 @@ class FileCRUD:
         return True
 
     @staticmethod
-    async def get_file_stats(db: AsyncSession, user_id: str) -> Dict[str, Any]:
-        """Get file statistics for user"""
-        from sqlalchemy import case, func
+    async def _stats_triggers_installed(db: AsyncSession) -> bool:
+        """Whether files.user_file_stats is kept up to date by the migration's triggers"""
+        global _stats_triggers_present
+        if _stats_triggers_present is None:
+            result = await db.execute(
+                text("SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = :name)"),
+                {"name": "files_user_file_stats_insert_delete"},
+            )
+            _stats_triggers_present = bool(result.scalar())
+            if not _stats_triggers_present:
+                logger.warning(
+                    "files.user_file_stats triggers are missing (tables created without "
+                    "migrations?); computing file stats from the files table"
+                )
+        return _stats_triggers_present
 
+    @staticmethod
+    async def _aggregate_file_stats(db: AsyncSession, user_id: str) -> Dict[str, Any]:
+        """Compute a user's totals directly from the files table"""
         from backend.common.database.models import Collection
 
         # Get file counts by status
@@ -326,25 +544,73 @@ class FileCRUD:
             .group_by(File.file_type)
         )
 
-        # Get total size
-        total_size = await db.execute(
-            select(func.sum(File.file_size)).join(Collection).filter(Collection.owner_id == user_id)
-        )
-
-        # Get total chunks
-        total_chunks = await db.execute(
-            select(func.sum(File.total_chunks))
+        # Get total size and chunks
+        totals = await db.execute(
+            select(func.sum(File.file_size), func.sum(File.total_chunks))
             .join(Collection)
             .filter(Collection.owner_id == user_id)
         )
+        total_size, total_chunks = totals.one()
 
         return {
-            "status_counts": {row.status: row.count for row in status_counts},
-            "type_counts": {row.file_type: row.count for row in type_counts},
-            "total_size_bytes": total_size.scalar() or 0,
-            "total_chunks": total_chunks.scalar() or 0,
+            "status_counts": {row.status.name: row.count for row in status_counts},
+            "type_counts": {row.file_type.name: row.count for row in type_counts},
+            "total_size_bytes": total_size or 0,
+            "total_chunks": total_chunks or 0,
         }
 
+    @staticmethod
+    async def get_file_stats(db: AsyncSession, user_id: str) -> Dict[str, Any]:
+        """Get file statistics for user"""
+        from backend.common.database.models import UserFileStats
+
+        if await FileCRUD._stats_triggers_installed(db):
+            # Sum the user's slot rows in the trigger-maintained summary table
+            result = await db.execute(select(UserFileStats).where(UserFileStats.user_id == user_id))
+            status_counts: Dict[str, int] = {}
+            type_counts: Dict[str, int] = {}
+            total_size_bytes = total_chunks = 0
+            for row in result.scalars():
+                for name, count in row.status_counts.items():
+                    status_counts[name] = status_counts.get(name, 0) + count
+                for name, count in row.type_counts.items():
+                    type_counts[name] = type_counts.get(name, 0) + count
+                total_size_bytes += row.total_size_bytes
+                total_chunks += row.total_chunks
+            stats = {
+                "status_counts": status_counts,
+                "type_counts": type_counts,
+                "total_size_bytes": total_size_bytes,
+                "total_chunks": total_chunks,
+            }
+        else:
+            stats = await FileCRUD._aggregate_file_stats(db, user_id)
+
+        return {
+            "status_counts": {
+                FileStatus[name]: count for name, count in stats["status_counts"].items() if count
+            },
+            "type_counts": {
+                FileType[name]: count for name, count in stats["type_counts"].items() if count
+            },
+            "total_size_bytes": stats["total_size_bytes"],
+            "total_chunks": stats["total_chunks"],
+        }
+
+    @staticmethod
+    async def reconcile_file_stats(db: AsyncSession, user_id: str) -> Dict[str, Any]:
+        """Recompute a user's summary rows from the files table"""
+        from backend.common.database.models import UserFileStats
+
+        values = await FileCRUD._aggregate_file_stats(db, user_id)
+
+        # Collapse the user's slots into slot 0
+        await db.execute(delete(UserFileStats).where(UserFileStats.user_id == user_id))
+        await db.execute(insert(UserFileStats).values(user_id=user_id, slot=0, **values))
+        await db.commit()
+
+        return await FileCRUD.get_file_stats(db, user_id)
+
 
 class FileChunkCRUD:
     """File chunk CRUD operations"""
@@ -353,44 +619,126 @@ class FileChunkCRUD:
     async def create_chunks(
         db: AsyncSession,
         file_id: str,
-        chunks: List[Dict[str, Any]],
+        chunks: List[Chunk],
         chunking_strategy: ChunkingStrategy,
     ) -> List[FileChunk]:
         """Create chunk records for a file"""
-        chunk_records = []
-
-        for i, chunk_data in enumerate(chunks):
-            chunk_record = FileChunk(
-                file_id=file_id,
-                chunk_index=i,
-                content=chunk_data["text"],
-                content_length=len(chunk_data["text"]),
-                embedding_model="text-embedding-3-small",  # Default model
-                page_number=chunk_data.get("metadata", {}).get("page_number"),
-                section_title=chunk_data.get("metadata", {}).get("section_title"),
-                chunk_metadata={
+        rows = [
+            {
+                "file_id": file_id,
+                "chunk_index": i,
+                "content": chunk.text,
+                "content_length": len(chunk.text),
+                "content_hash": chunk_content_hash(chunk.text),
+                "embedding_model": "text-embedding-3-small",  # Default model
+                "page_number": chunk.metadata.get("page_number"),
+                "section_title": chunk.metadata.get("section_title"),
+                "chunk_metadata": {
                     "chunking_strategy": chunking_strategy.value,
-                    "chunk_size": chunk_data.get("chunk_size"),
-                    "overlap": chunk_data.get("overlap"),
-                    **chunk_data.get("metadata", {}),
+                    "chunk_size": chunk.metadata.get("chunk_size"),
+                    "overlap": chunk.metadata.get("overlap"),
+                    **chunk.metadata,
                 },
+            }
+            for i, chunk in enumerate(chunks)
+        ]
+
+        # Single bulk INSERT ... RETURNING instead of one INSERT + refresh per chunk
+        chunk_records = []
+        if rows:
+            result = await db.scalars(
+                insert(FileChunk).returning(FileChunk, sort_by_parameter_order=True), rows
             )
-            chunk_records.append(chunk_record)
+            chunk_records = result.all()
 
-        db.add_all(chunk_records)
+        # Update file total chunks count in the same transaction
+        await db.execute(update(File).where(File.id == file_id).values(total_chunks=len(rows)))
         await db.commit()
 
-        # Refresh all records
-        for chunk in chunk_records:
-            await db.refresh(chunk)
+        return chunk_records
 
-        # Update file total chunks count
-        file = await FileCRUD.get_file_by_id(db, file_id)
-        if file:
-            file.total_chunks = len(chunk_records)
-            await db.commit()
+    @staticmethod
+    async def find_embedded_duplicates(
+        db: AsyncSession,
+        collection_id: str,
+        file_id: str,
+        content_hashes: List[str],
+        embedding_model: str,
+    ) -> Dict[str, str]:
+        """
+        Find chunks of other files in the collection with the same content that are
+        already embedded with the given model
+        Returns: content hash -> vector ID
+        """
+        content_hashes = list(dict.fromkeys(content_hashes))
+        if not content_hashes:
+            return {}
+
+        bloom = None
+        filter_name = CHUNK_FILTER_NAME.format(collection_id=collection_id)
+        try:
+            bloom = await get_bloom_filter()
+        except Exception as e:
+            logger.error(f"Bloom filter unavailable, checking chunk hashes in database: {e}")
+
+        # A negative Bloom filter answer means the chunk is new - only query the positives
+        if bloom is not None:
+            flags = await bloom.might_contain_many(filter_name, content_hashes)
+            if flags is None:
+                await FileChunkCRUD._seed_chunk_filter(db, bloom, collection_id)
+                flags = await bloom.might_contain_many(filter_name, content_hashes)
+            if flags is not None:
+                content_hashes = [h for h, flag in zip(content_hashes, flags) if flag]
+            if not content_hashes:
+                return {}
 
-        return chunk_records
+        result = await db.execute(
+            select(FileChunk.content_hash, FileChunk.vector_id)
+            .join(File)
+            .filter(
+                and_(
+                    File.collection_id == collection_id,
+                    FileChunk.file_id != file_id,
+                    FileChunk.content_hash.in_(content_hashes),
+                    FileChunk.embedding_model == embedding_model,
+                    FileChunk.vector_id.isnot(None),
+                )
+            )
+        )
+        return {content_hash: vector_id for content_hash, vector_id in result.all()}
+
+    @staticmethod
+    async def _seed_chunk_filter(db: AsyncSession, bloom: BloomFilter, collection_id: str) -> None:
+        """Seed the collection's chunk filter from the hashes of its embedded chunks"""
+        result = await db.execute(
+            select(FileChunk.content_hash)
+            .join(File)
+            .filter(
+                and_(
+                    File.collection_id == collection_id,
+                    FileChunk.content_hash.isnot(None),
+                    FileChunk.vector_id.isnot(None),
+                )
+            )
+            .distinct()
+        )
+        await bloom.seed(CHUNK_FILTER_NAME.format(collection_id=collection_id), result.scalars())
+
+    @staticmethod
+    async def add_chunk_hashes_to_filter(collection_id: str, content_hashes: List[str]) -> None:
+        """Record embedded chunk hashes in the collection's Bloom filter"""
+        try:
+            bloom = await get_bloom_filter()
+        except Exception as e:
+            logger.error(f"Bloom filter unavailable, chunk hashes not recorded: {e}")
+            return
+        if bloom is None:
+            return
+
+        # Recorded even before the filter is seeded; seeding adds to whatever is already there
+        await bloom.add(
+            CHUNK_FILTER_NAME.format(collection_id=collection_id), dict.fromkeys(content_hashes)
+        )
 
     @staticmethod
     async def get_chunks_by_file(db: AsyncSession, file_id: str) -> List[FileChunk]:
@@ -404,40 +752,86 @@ class FileChunkCRUD:
     async def update_chunk_embedding(
         db: AsyncSession,
         chunk_id: str,
-        embedding_vector: List[float],
+        embedding_vector: Optional[List[float]],
         embedding_model: str,
         vector_id: Optional[str] = None,
     ) -> Optional[FileChunk]:
         """Update chunk with embedding information"""
-        result = await db.execute(select(FileChunk).filter(FileChunk.id == chunk_id))
-        chunk = result.scalar_one_or_none()
-
-        if not chunk:
-            return None
+        # Store embedding info in metadata
+        embedding_info = {"embedding_model": embedding_model}
+        if embedding_vector is not None:
+            embedding_info["embedding_dimensions"] = len(embedding_vector)
+        if vector_id:
+            embedding_info["vector_id"] = vector_id
 
-        chunk.embedding_model = embedding_model
+        values = {
+            "embedding_model": embedding_model,
+            "chunk_metadata": merge_json(
+                FileChunk.chunk_metadata, literal(embedding_info, type_=JSONB)
+            ),
+        }
         if vector_id:
-            chunk.vector_id = vector_id
+            values["vector_id"] = vector_id
 
-        # Store embedding info in metadata
-        if chunk.chunk_metadata:
-            chunk.chunk_metadata.update(
+        # Single UPDATE ... RETURNING instead of SELECT + commit + refresh
+        result = await db.execute(
+            update(FileChunk)
+            .where(FileChunk.id == chunk_id)
+            .values(**values)
+            .returning(FileChunk)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        chunk = result.scalar_one_or_none()
+        await db.commit()
+        return chunk
+
+    @staticmethod
+    async def update_chunk_embeddings(db: AsyncSession, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update embedding information for many chunks in one round-trip
+        Each update has chunk_id and optionally embedding_model, embedding_dimensions
+        and vector_id; omitted fields keep their stored values
+        """
+        if not updates:
+            return 0
+
+        params = []
+        for item in updates:
+            embedding_info = {}
+            if item.get("embedding_model"):
+                embedding_info["embedding_model"] = item["embedding_model"]
+            if item.get("embedding_dimensions") is not None:
+                embedding_info["embedding_dimensions"] = item["embedding_dimensions"]
+            if item.get("vector_id"):
+                embedding_info["vector_id"] = item["vector_id"]
+
+            params.append(
                 {
-                    "embedding_model": embedding_model,
-                    "embedding_dimensions": len(embedding_vector),
-                    "vector_id": vector_id,
+                    "b_chunk_id": item["chunk_id"],
+                    "b_embedding_model": item.get("embedding_model"),
+                    "b_vector_id": item.get("vector_id"),
+                    "b_embedding_info": embedding_info,
                 }
             )
-        else:
-            chunk.chunk_metadata = {
-                "embedding_model": embedding_model,
-                "embedding_dimensions": len(embedding_vector),
-                "vector_id": vector_id,
-            }
 
+        # Core executemany: one statement, parameters for every chunk
+        chunk_table = FileChunk.__table__
+        stmt = (
+            update(chunk_table)
+            .where(chunk_table.c.id == bindparam("b_chunk_id"))
+            .values(
+                embedding_model=func.coalesce(
+                    bindparam("b_embedding_model"), chunk_table.c.embedding_model
+                ),
+                vector_id=func.coalesce(bindparam("b_vector_id"), chunk_table.c.vector_id),
+                chunk_metadata=merge_json(
+                    FileChunk.chunk_metadata, bindparam("b_embedding_info", type_=JSONB)
+                ),
+            )
+        )
+        await db.execute(stmt, params)
         await db.commit()
-        await db.refresh(chunk)
-        return chunk
+        return len(params)
 
 
 class ProcessingJobCRUD:
@@ -466,38 +860,39 @@ class ProcessingJobCRUD:
         db: AsyncSession, job_id: str, progress_percentage: int, current_step: Optional[str] = None
     ) -> Optional[ProcessingJob]:
         """Update job progress"""
-        result = await db.execute(select(ProcessingJob).filter(ProcessingJob.id == job_id))
-        job = result.scalar_one_or_none()
-
-        if not job:
-            return None
-
-        job.progress_percentage = progress_percentage
+        values = {"progress_percentage": progress_percentage}
         if current_step:
-            job.current_step = current_step
+            values["current_step"] = current_step
 
-        await db.commit()
-        await db.refresh(job)
-        return job
+        return await ProcessingJobCRUD._update_job(db, job_id, values)
 
     @staticmethod
     async def complete_job(
         db: AsyncSession, job_id: str, status: FileStatus, error_message: Optional[str] = None
     ) -> Optional[ProcessingJob]:
         """Complete a processing job"""
-        result = await db.execute(select(ProcessingJob).filter(ProcessingJob.id == job_id))
-        job = result.scalar_one_or_none()
-
-        if not job:
-            return None
-
-        job.status = status
-        job.completed_at = datetime.utcnow()
-        job.progress_percentage = 100 if status == FileStatus.PROCESSED else job.progress_percentage
+        # Completion time comes from the database clock
+        values = {"status": status, "completed_at": func.now()}
+        if status == FileStatus.PROCESSED:
+            values["progress_percentage"] = 100
 
         if error_message:
-            job.error_message = error_message
+            values["error_message"] = error_message
 
+        return await ProcessingJobCRUD._update_job(db, job_id, values)
+
+    @staticmethod
+    async def _update_job(
+        db: AsyncSession, job_id: str, values: Dict[str, Any]
+    ) -> Optional[ProcessingJob]:
+        """Apply an UPDATE ... RETURNING to one job and commit"""
+        result = await db.execute(
+            update(ProcessingJob)
+            .where(ProcessingJob.id == job_id)
+            .values(**values)
+            .returning(ProcessingJob)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        job = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(job)
         return job
@@ -4,12 +4,71 @@ Generates text embeddings using various providers following DRY principles
 """
 
 import asyncio
+import hashlib
 import os
+import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+import httpx
+import numpy as np
 import openai
 from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from backend.file_service.app.chunking.chunker import Chunk
+
+# OpenAI request packing: inputs per request and characters per request (token proxy)
+MAX_BATCH_INPUTS = 512
+MAX_BATCH_CHARS = 200_000
+MAX_CONCURRENT_REQUESTS = 8
+
+# Per-text fallback concurrency, for any provider
+MAX_CONCURRENT_FALLBACK_EMBEDDINGS = 16
+
+# httpx needs h2 for HTTP/2; without it the shared pool falls back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+
+    OPENAI_HTTP2 = True
+except ImportError:
+    OPENAI_HTTP2 = False
+
+# Shared HTTP/2 connection pool for every OpenAI client in the process
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+OPENAI_HTTP_TIMEOUT = 60.0
+
+_openai_http_client: Optional[httpx.AsyncClient] = None
+_openai_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for an API key"""
+    global _openai_http_client
+
+    client = _openai_clients.get(api_key)
+    if client is None:
+        if _openai_http_client is None:
+            _openai_http_client = httpx.AsyncClient(
+                http2=OPENAI_HTTP2, timeout=OPENAI_HTTP_TIMEOUT, limits=OPENAI_HTTP_LIMITS
+            )
+        client = AsyncOpenAI(api_key=api_key, http_client=_openai_http_client)
+        _openai_clients[api_key] = client
+    return client
+
+
+async def close_openai_clients() -> None:
+    """Close the shared OpenAI clients and their connection pool"""
+    global _openai_http_client
+
+    _openai_clients.clear()
+    if _openai_http_client is not None:
+        await _openai_http_client.aclose()
+        _openai_http_client = None
+
+
+# Any whitespace other than single spaces; text without it is already normalized
+_UNNORMALIZED_WS_RE = re.compile(r"[^\S ]| {2,}")
 
 
 class BaseEmbedder(ABC):
@@ -37,11 +96,13 @@ class BaseEmbedder(ABC):
 
     def _validate_text(self, text: str) -> str:
         """Validate and clean text for embedding"""
-        if not text or not text.strip():
+        if not text or text.isspace():
             raise ValueError("Text cannot be empty")
 
-        # Remove excessive whitespace
-        text = " ".join(text.split())
+        # Remove excessive whitespace - chunks usually arrive normalized, so only
+        # rebuild the string when a scan finds something to collapse
+        if text[0] == " " or text[-1] == " " or _UNNORMALIZED_WS_RE.search(text):
+            text = " ".join(text.split())
 
         # Truncate if too long (most models have token limits)
         max_chars = 8000  # Conservative limit
@@ -60,7 +121,8 @@ class OpenAIEmbedder(BaseEmbedder):
             raise ValueError("OpenAI API key is required")
 
         self.model = model
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
         # Model configurations
         self.model_configs = {
@@ -78,13 +140,46 @@ class OpenAIEmbedder(BaseEmbedder):
     def get_embedding_dimension(self) -> int:
         return self.model_configs[self.model]["dimension"]
 
+    @retry(
+        retry=retry_if_exception_type(openai.RateLimitError),
+        wait=wait_exponential(multiplier=1, min=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True,
+    )
+    async def _create_embeddings(self, inputs: List[str]) -> List[List[float]]:
+        """Call the embeddings API, bounded by the in-flight request limit"""
+        async with self._request_semaphore:
+            response = await self.client.embeddings.create(model=self.model, input=inputs)
+        return [data.embedding for data in response.data]
+
+    @staticmethod
+    def _pack_batches(texts: List[str]) -> List[List[str]]:
+        """Split texts into consecutive sub-batches within the per-request limits"""
+        batches = []
+        current = []
+        current_chars = 0
+
+        for text in texts:
+            if current and (
+                len(current) >= MAX_BATCH_INPUTS or current_chars + len(text) > MAX_BATCH_CHARS
+            ):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(text)
+            current_chars += len(text)
+
+        if current:
+            batches.append(current)
+        return batches
+
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for a single text"""
         text = self._validate_text(text)
 
         try:
-            response = await self.client.embeddings.create(model=self.model, input=text)
-            return response.data[0].embedding
+            embeddings = await self._create_embeddings([text])
+            return embeddings[0]
         except Exception as e:
             raise RuntimeError(f"OpenAI embedding generation failed: {str(e)}")
 
@@ -97,8 +192,11 @@ class OpenAIEmbedder(BaseEmbedder):
         validated_texts = [self._validate_text(text) for text in texts]
 
         try:
-            response = await self.client.embeddings.create(model=self.model, input=validated_texts)
-            return [data.embedding for data in response.data]
+            # Dispatch sub-batches concurrently; gather keeps them in input order
+            batch_results = await asyncio.gather(
+                *(self._create_embeddings(batch) for batch in self._pack_batches(validated_texts))
+            )
+            return [embedding for batch in batch_results for embedding in batch]
         except Exception as e:
             raise RuntimeError(f"OpenAI batch embedding generation failed: {str(e)}")
 
@@ -119,23 +217,11 @@ class MockEmbedder(BaseEmbedder):
         """Generate mock embedding"""
         text = self._validate_text(text)
 
-        # Generate deterministic mock embedding based on text hash
-        import hashlib
+        # Deterministic mock embedding: one hash byte per dimension, normalized to [-0.5, 0.5]
+        digest = hashlib.shake_256(text.encode()).digest(self.dimension)
+        embedding = np.frombuffer(digest, dtype=np.uint8).astype(np.float32) * (1.0 / 255.0) - 0.5
 
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-
-        # Convert hash to numbers and normalize
-        embedding = []
-        for i in range(0, len(text_hash), 2):
-            hex_pair = text_hash[i : i + 2]
-            value = int(hex_pair, 16) / 255.0 - 0.5  # Normalize to [-0.5, 0.5]
-            embedding.append(value)
-
-        # Pad or truncate to desired dimension
-        while len(embedding) < self.dimension:
-            embedding.extend(embedding[: min(len(embedding), self.dimension - len(embedding))])
-
-        return embedding[: self.dimension]
+        return embedding.tolist()
 
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate mock embeddings for multiple texts"""
@@ -184,13 +270,13 @@ class EmbeddingService:
                 "error": str(e),
             }
 
-    async def embed_chunks(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def embed_chunks(self, chunks: List[Chunk]) -> List[Dict[str, Any]]:
         """Generate embeddings for multiple chunks"""
         if not chunks:
             return []
 
         # Extract texts from chunks
-        texts = [chunk["text"] for chunk in chunks]
+        texts = [chunk.text for chunk in chunks]
 
         try:
             embeddings = await self.embedder.generate_embeddings(texts)
@@ -198,7 +284,7 @@ class EmbeddingService:
             # Add embeddings to chunks
             enriched_chunks = []
             for i, chunk in enumerate(chunks):
-                enriched_chunk = chunk.copy()
+                enriched_chunk = chunk._asdict()
                 enriched_chunk.update(
                     {
                         "embedding": embeddings[i],
@@ -217,15 +303,17 @@ class EmbeddingService:
             return await self._embed_chunks_individually(chunks, str(e))
 
     async def _embed_chunks_individually(
-        self, chunks: List[Dict[str, Any]], batch_error: str
+        self, chunks: List[Chunk], batch_error: str
     ) -> List[Dict[str, Any]]:
         """Fallback to individual embedding generation"""
-        enriched_chunks = []
 
-        for chunk in chunks:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FALLBACK_EMBEDDINGS)
+
+        async def embed_one(chunk: Chunk) -> Dict[str, Any]:
             try:
-                embedding = await self.embedder.generate_embedding(chunk["text"])
-                enriched_chunk = chunk.copy()
+                async with semaphore:
+                    embedding = await self.embedder.generate_embedding(chunk.text)
+                enriched_chunk = chunk._asdict()
                 enriched_chunk.update(
                     {
                         "embedding": embedding,
@@ -236,7 +324,7 @@ class EmbeddingService:
                     }
                 )
             except Exception as e:
-                enriched_chunk = chunk.copy()
+                enriched_chunk = chunk._asdict()
                 enriched_chunk.update(
                     {
                         "embedding": None,
@@ -246,10 +334,10 @@ class EmbeddingService:
                         "error": f"Individual embedding failed: {str(e)}",
                     }
                 )
+            return enriched_chunk
 
-            enriched_chunks.append(enriched_chunk)
-
-        return enriched_chunks
+        # Results come back in input order
+        return list(await asyncio.gather(*(embed_one(chunk) for chunk in chunks)))
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current embedding model"""
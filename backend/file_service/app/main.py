@@ -12,6 +12,8 @@ from backend.common.health_checks import check_database, check_openai_api, check
 from backend.common.service_factory import create_service_app
 from backend.file_service.app.api.files import router as files_router
 from backend.file_service.app.core.config import get_settings
+from backend.file_service.app.embedding.embedder import close_openai_clients
+from backend.file_service.app.processing.text_extractor import PDFTextExtractor
 
 
 async def file_service_startup():
@@ -21,6 +23,15 @@ async def file_service_startup():
     os.makedirs(settings.temp_dir, exist_ok=True)
 
 
+async def file_service_shutdown():
+    """File service specific shutdown tasks"""
+    # Release pooled OpenAI connections
+    await close_openai_clients()
+
+    # Stop the PDF page extraction worker processes
+    PDFTextExtractor.shutdown_pool()
+
+
 def create_file_service_health_router():
     """Create health router with file service specific checks"""
     settings = get_settings()
@@ -52,20 +63,12 @@ file_app = create_service_app(
     routers_config=[{"router": files_router, "prefix": "/api/v1/files", "tags": ["files"]}],
     version="1.0.0",
     startup_tasks_func=file_service_startup,
+    shutdown_tasks_func=file_service_shutdown,
+    health_router=create_file_service_health_router(),
 )
 
-# Override the health router with our custom one
-file_app._health_router = create_file_service_health_router()
-
 # Create the FastAPI app
 app = file_app.create_app()
 
-# Replace the default health router with our custom one
-for route in app.routes:
-    if hasattr(route, "path") and route.path.startswith("/health"):
-        app.routes.remove(route)
-
-app.include_router(file_app._health_router, prefix="/health", tags=["health"])
-
 if __name__ == "__main__":
     file_app.run()
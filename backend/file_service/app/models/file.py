@@ -4,9 +4,10 @@ Uses shared models and adds file service specific models
 """
 
 import enum
-from datetime import datetime
 
 from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql import func
 
 # Import shared models
 from backend.common.database.models import DocumentChunk, File, FileStatus, FileType
@@ -33,10 +34,10 @@ class ProcessingJob(BaseModel):
     # Job information
     file_id = Column(String(36), ForeignKey("files.files.id"), nullable=False, index=True)
     job_type = Column(String(50), nullable=False)  # 'text_extraction', 'chunking', 'embedding'
-    status = Column(Enum(FileStatus), default=FileStatus.PROCESSING, nullable=False)
+    status = Column(Enum(FileStatus), default=FileStatus.PROCESSING, nullable=False, index=True)
 
     # Processing details
-    started_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
 
@@ -50,15 +51,24 @@ class ProcessingJob(BaseModel):
     def __repr__(self):
         return f"<ProcessingJob(id={self.id}, file_id={self.file_id}, job_type={self.job_type}, status={self.status})>"
 
-    @property
+    # Hybrid properties also work in queries, e.g. select(ProcessingJob).where(...is_failed)
+    @hybrid_property
     def is_completed(self) -> bool:
         """Check if job is completed"""
-        return self.status == FileStatus.PROCESSED
+        return self.status is FileStatus.PROCESSED
 
-    @property
+    @is_completed.expression
+    def is_completed(cls):
+        return cls.status == FileStatus.PROCESSED
+
+    @hybrid_property
     def is_failed(self) -> bool:
         """Check if job failed"""
-        return self.status == FileStatus.FAILED
+        return self.status is FileStatus.FAILED
+
+    @is_failed.expression
+    def is_failed(cls):
+        return cls.status == FileStatus.FAILED
 
 
 # Alias the shared models for backward compatibility
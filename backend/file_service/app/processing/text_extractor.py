@@ -3,16 +3,35 @@ Text Extraction Processors
 Handles text extraction from different file types following DRY principles
 """
 
+import asyncio
 import io
+import mmap
+import multiprocessing
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-
-import fitz  # PyMuPDF
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from backend.common.utils import detect_text_encoding
 from backend.file_service.app.models.file import FileType
 
+# PyMuPDF and pandas are imported where they are used, so processes that only handle
+# plain text never load them
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Bytes read up front to pick an encoding without decoding the whole file
+ENCODING_SNIFF_BYTES = 65536
+
+# Used when the prefix gives no usable answer; it decodes any byte sequence
+FALLBACK_ENCODING = "latin-1"
+
+
+def _sniff_encoding(prefix: bytes) -> str:
+    """Pick the encoding for a text file from its leading bytes"""
+    return detect_text_encoding(prefix, default=FALLBACK_ENCODING)
+
 
 class BaseTextExtractor(ABC):
     """Base class for text extractors following DRY principles"""
@@ -50,47 +69,145 @@ class BaseTextExtractor(ABC):
         }
 
 
+def _pdf_page_count(file_path: str) -> int:
+    """Open a PDF just to read its page count"""
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        return len(doc)
+
+
+def _extract_pdf_pages(
+    file_path: str, start: int, stop: int, collect_image_stats: bool = False
+) -> List[Tuple[int, str, Optional[bool]]]:
+    """Extract (page_num, text, has_images) for pages [start, stop) of a PDF"""
+    import fitz  # PyMuPDF
+
+    # Plain text only: ligatures are expanded and dehyphenation is left off, so MuPDF does
+    # not do the extra per-character work those options need
+    text_flags = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+    with fitz.open(file_path) as doc:
+        pages = []
+        for page_num, page in enumerate(doc.pages(start, stop), start):
+            # Image lookup walks the page resources, so only do it when it is reported
+            has_images = bool(page.get_images(full=False)) if collect_image_stats else None
+            pages.append((page_num, page.get_text("text", flags=text_flags), has_images))
+        return pages
+
+
 class PDFTextExtractor(BaseTextExtractor):
     """PDF text extraction using PyMuPDF"""
 
+    # Small documents are not worth the cost of shipping work to other processes
+    PARALLEL_MIN_PAGES = 3
+
+    _pool: Optional[ProcessPoolExecutor] = None
+
+    def __init__(self, metadata_detail: bool = False):
+        # Per-page metadata (lengths, image presence) is only built when asked for
+        self.metadata_detail = metadata_detail
+
     def supports_file_type(self, file_type: FileType) -> bool:
         return file_type == FileType.PDF
 
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        """Get the shared page extraction process pool"""
+        if cls._pool is None:
+            # Forking a process that runs an event loop and holds open sockets is unsafe,
+            # so workers start from a clean forkserver (or spawn) process instead
+            method = (
+                "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+            cls._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method)
+            )
+        return cls._pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Shut down the shared page extraction process pool, if it was started"""
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=True, cancel_futures=True)
+            cls._pool = None
+
+    async def _extract_pages(
+        self, file_path: str, page_count: int
+    ) -> List[Tuple[int, str, Optional[bool]]]:
+        """Extract all pages, split into one contiguous range per worker process"""
+        if page_count < self.PARALLEL_MIN_PAGES:
+            return await asyncio.to_thread(
+                _extract_pdf_pages, file_path, 0, page_count, self.metadata_detail
+            )
+
+        # Each worker opens the document once and extracts its own range of pages
+        workers = min(page_count, os.cpu_count() or 1)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        ranges = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    pool, _extract_pdf_pages, file_path, start, stop, self.metadata_detail
+                )
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+        )
+        return [page for pages in ranges for page in pages]
+
     async def extract_text(self, file_path: str) -> Dict[str, Any]:
         """Extract text from PDF file"""
         try:
-            doc = fitz.open(file_path)
-            text_parts = []
-            metadata = {"page_count": len(doc), "pages": []}
+            # Opening the document and assembling the text are blocking, so they run in
+            # threads; page extraction itself goes to the process pool
+            page_count = await asyncio.to_thread(_pdf_page_count, file_path)
+            pages = await self._extract_pages(file_path, page_count)
+            return await asyncio.to_thread(self._build_result, pages, page_count)
 
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                page_text = page.get_text()
+        except Exception as e:
+            return self._create_error_result(f"PDF extraction failed: {str(e)}")
 
-                if page_text.strip():  # Only add non-empty pages
-                    text_parts.append(page_text)
+    def _build_result(
+        self, pages: List[Tuple[int, str, Optional[bool]]], page_count: int
+    ) -> Dict[str, Any]:
+        """Join extracted pages into the extraction result"""
+        buffer = io.StringIO()
+        metadata = {"page_count": page_count}
+        if self.metadata_detail:
+            metadata["pages"] = []
+
+        for page_num, page_text, has_images in pages:
+            if page_text.strip():  # Only add non-empty pages
+                if buffer.tell():
+                    buffer.write("\n\n")
+                buffer.write(page_text)
+                if self.metadata_detail:
                     metadata["pages"].append(
                         {
                             "page_number": page_num + 1,
                             "text_length": len(page_text),
-                            "has_images": len(page.get_images()) > 0,
+                            "has_images": has_images,
                         }
                     )
 
-            doc.close()
+        full_text = buffer.getvalue()
+        metadata["extraction_method"] = "pymupdf"
+        metadata["total_text_length"] = buffer.tell()
 
-            full_text = "\n\n".join(text_parts)
-            metadata["extraction_method"] = "pymupdf"
-            metadata["total_text_length"] = len(full_text)
+        return self._create_extraction_result(full_text, metadata)
 
-            return self._create_extraction_result(full_text, metadata)
 
-        except Exception as e:
-            return self._create_error_result(f"PDF extraction failed: {str(e)}")
+class CSVTextExtractor(BaseTextExtractor):
+    """CSV text extraction using pyarrow, or pandas when pyarrow is unavailable"""
 
+    # Rows parsed per chunk while streaming, and rows sampled for dtype inference
+    CHUNK_ROWS = 65536
+    SAMPLE_ROWS = 1000
 
-class CSVTextExtractor(BaseTextExtractor):
-    """CSV text extraction using pandas"""
+    # Bytes per Arrow record batch when streaming with pyarrow
+    ARROW_BLOCK_BYTES = 1 << 20
 
     def supports_file_type(self, file_type: FileType) -> bool:
         return file_type == FileType.CSV
@@ -98,51 +215,133 @@ class CSVTextExtractor(BaseTextExtractor):
     async def extract_text(self, file_path: str) -> Dict[str, Any]:
         """Extract text from CSV file"""
         try:
-            # Try different encodings
-            encodings = ["utf-8", "latin-1", "cp1252"]
-            df = None
-            used_encoding = None
-
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    used_encoding = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
-
-            if df is None:
-                return self._create_error_result(
-                    "Could not decode CSV file with any supported encoding"
-                )
+            return await asyncio.to_thread(self._extract_sync, file_path)
 
-            # Convert DataFrame to text representation
-            text_parts = []
+        except Exception as e:
+            return self._create_error_result(f"CSV extraction failed: {str(e)}")
 
-            # Add column headers
-            headers = " | ".join(df.columns.astype(str))
-            text_parts.append(f"Headers: {headers}")
+    def _extract_sync(self, file_path: str) -> Dict[str, Any]:
+        """Extract with pyarrow's multi-threaded reader, falling back to pandas"""
+        # Encoding is sniffed once from a prefix; the file is then parsed in a single pass
+        with open(file_path, "rb") as f:
+            encoding = _sniff_encoding(f.read(ENCODING_SNIFF_BYTES))
 
-            # Add data rows
-            for index, row in df.iterrows():
-                row_text = " | ".join(row.astype(str))
-                text_parts.append(f"Row {index + 1}: {row_text}")
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return self._extract_pandas(file_path, encoding)
 
-            full_text = "\n".join(text_parts)
+        try:
+            return self._extract_arrow(file_path, encoding)
+        except pa.ArrowInvalid:
+            # pandas replaces undecodable bytes instead of rejecting the file
+            return self._extract_pandas(file_path, encoding)
+
+    def _extract_arrow(self, file_path: str, encoding: str) -> Dict[str, Any]:
+        """Stream the CSV in Arrow record batches and build row text with Arrow kernels"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pac
+
+        read_options = pac.ReadOptions(
+            use_threads=True, block_size=self.ARROW_BLOCK_BYTES, encoding=encoding
+        )
+
+        # Column names and inferred types come from the first block
+        with pac.open_csv(file_path, read_options=read_options) as reader:
+            schema = reader.schema
+
+        # Add column headers
+        buffer = io.StringIO()
+        buffer.write(f"Headers: {' | '.join(schema.names)}")
+
+        # Add data rows; reading every column as string skips type conversion and keeps
+        # values as written, with empty cells rendered like pandas does
+        convert_options = pac.ConvertOptions(
+            column_types={name: pa.string() for name in schema.names},
+            strings_can_be_null=True,
+        )
+        row_count = 0
+        with pac.open_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        ) as reader:
+            for batch in reader:
+                if batch.num_rows and batch.num_columns:
+                    row_texts = pc.binary_join_element_wise(
+                        *batch.columns, " | ", null_handling="replace", null_replacement="nan"
+                    )
+                    row_numbers = pc.cast(
+                        pa.array(range(row_count + 1, row_count + batch.num_rows + 1)),
+                        pa.string(),
+                    )
+                    rows = pc.binary_join_element_wise("Row ", row_numbers, ": ", row_texts, "")
+                    buffer.write("\n")
+                    buffer.write("\n".join(rows.to_pylist()))
+                row_count += batch.num_rows
+
+        full_text = buffer.getvalue()
+
+        metadata = {
+            "row_count": row_count,
+            "column_count": len(schema.names),
+            "columns": schema.names,
+            "encoding": encoding,
+            "extraction_method": "pyarrow",
+            "data_types": {field.name: str(field.type) for field in schema},
+        }
 
-            metadata = {
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": df.columns.tolist(),
-                "encoding": used_encoding,
-                "extraction_method": "pandas",
-                "data_types": df.dtypes.astype(str).to_dict(),
-            }
+        return self._create_extraction_result(full_text, metadata)
+
+    def _extract_pandas(self, file_path: str, encoding: str) -> Dict[str, Any]:
+        """Stream the CSV in row chunks so only one chunk is parsed in memory at a time"""
+        import pandas as pd
+
+        # Column names and inferred types come from a small sample
+        sample = pd.read_csv(
+            file_path, encoding=encoding, encoding_errors="replace", nrows=self.SAMPLE_ROWS
+        )
+
+        # Add column headers
+        buffer = io.StringIO()
+        buffer.write(f"Headers: {' | '.join(sample.columns.astype(str))}")
+
+        # Add data rows; dtype=str skips type inference and keeps values as written
+        row_count = 0
+        with pd.read_csv(
+            file_path,
+            encoding=encoding,
+            encoding_errors="replace",
+            chunksize=self.CHUNK_ROWS,
+            dtype=str,
+        ) as reader:
+            for chunk in reader:
+                row_count += len(chunk)
+                if len(chunk) and len(chunk.columns):
+                    buffer.write("\n")
+                    buffer.write("\n".join(self._format_rows(chunk)))
+
+        full_text = buffer.getvalue()
+
+        metadata = {
+            "row_count": row_count,
+            "column_count": len(sample.columns),
+            "columns": sample.columns.tolist(),
+            "encoding": encoding,
+            "extraction_method": "pandas",
+            "data_types": sample.dtypes.astype(str).to_dict(),
+        }
 
-            return self._create_extraction_result(full_text, metadata)
+        return self._create_extraction_result(full_text, metadata)
 
-        except Exception as e:
-            return self._create_error_result(f"CSV extraction failed: {str(e)}")
+    @staticmethod
+    def _format_rows(df: "pd.DataFrame") -> List[str]:
+        """Render rows as "Row N: a | b | c", converting and joining whole columns at once"""
+        # Empty cells are rendered as "nan", like the Arrow path does
+        columns = [column.astype(str) for _, column in df.fillna("nan").items()]
+        row_texts = columns[0].str.cat(columns[1:], sep=" | ") if len(columns) > 1 else columns[0]
+        row_labels = "Row " + (df.index + 1).astype(str) + ": "
+        # Object arrays concatenate the same way whichever string dtype pandas picked
+        return list(row_labels.to_numpy(dtype=object) + row_texts.to_numpy(dtype=object))
 
 
 class TXTTextExtractor(BaseTextExtractor):
@@ -154,40 +353,43 @@ class TXTTextExtractor(BaseTextExtractor):
     async def extract_text(self, file_path: str) -> Dict[str, Any]:
         """Extract text from plain text file"""
         try:
-            # Try different encodings
-            encodings = ["utf-8", "latin-1", "cp1252"]
-            text = None
-            used_encoding = None
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, "r", encoding=encoding) as f:
-                        text = f.read()
-                    used_encoding = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
+            return await asyncio.to_thread(self._extract_sync, file_path)
 
-            if text is None:
-                return self._create_error_result(
-                    "Could not decode text file with any supported encoding"
-                )
+        except Exception as e:
+            return self._create_error_result(f"Text extraction failed: {str(e)}")
 
-            # Count lines and words
-            lines = text.split("\n")
-            words = text.split()
+    def _extract_sync(self, file_path: str) -> Dict[str, Any]:
+        """Read the file and count lines and words off the event loop"""
+        text, used_encoding = self._read_text(file_path)
 
-            metadata = {
-                "line_count": len(lines),
-                "word_count": len(words),
-                "encoding": used_encoding,
-                "extraction_method": "direct_read",
-            }
+        # Count lines and words
+        line_count = text.count("\n") + (0 if not text or text.endswith("\n") else 1)
+        words = text.split()
 
-            return self._create_extraction_result(text, metadata)
+        metadata = {
+            "line_count": line_count,
+            "word_count": len(words),
+            "encoding": used_encoding,
+            "extraction_method": "direct_read",
+        }
 
-        except Exception as e:
-            return self._create_error_result(f"Text extraction failed: {str(e)}")
+        return self._create_extraction_result(text, metadata)
+
+    @staticmethod
+    def _read_text(file_path: str) -> Tuple[str, str]:
+        """Map the file, sniff its encoding from a prefix and decode it once"""
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return "", "utf-8"
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Start readahead of the whole file before decoding walks it
+                if hasattr(mmap, "MADV_WILLNEED"):
+                    mm.madvise(mmap.MADV_WILLNEED)
+
+                # Decode straight from the mapping, without copying it into a bytes object
+                encoding = _sniff_encoding(mm[:ENCODING_SNIFF_BYTES])
+                return str(mm, encoding, "replace"), encoding
 
 
 class AudioTextExtractor(BaseTextExtractor):
@@ -228,19 +430,24 @@ class TextExtractionService:
             DOCXTextExtractor(),
         ]
 
+        # Resolve file type -> extractor once; the first supporting extractor wins
+        self._extractors_by_type: Dict[FileType, BaseTextExtractor] = {}
+        for file_type in FileType:
+            for extractor in self.extractors:
+                if extractor.supports_file_type(file_type):
+                    self._extractors_by_type[file_type] = extractor
+                    break
+
     def get_extractor(self, file_type: FileType) -> Optional[BaseTextExtractor]:
         """Get appropriate extractor for file type"""
-        for extractor in self.extractors:
-            if extractor.supports_file_type(file_type):
-                return extractor
-        return None
-
-    async def extract_text(self, file_path: str, file_type: FileType) -> Dict[str, Any]:
-        """Extract text from file using appropriate extractor"""
-        extractor = self.get_extractor(file_type)
-
-        if not extractor:
-            return {
+        return self._extractors_by_type.get(file_type)
+
+    def _check_extractable(
+        self, file_path: str, file_type: FileType, stat: Optional[os.stat_result] = None
+    ) -> Tuple[Optional[os.stat_result], Optional[Dict[str, Any]]]:
+        """Stat the file once, returning (stat, None) or (None, error result)"""
+        if not self.get_extractor(file_type):
+            return None, {
                 "text": "",
                 "text_length": 0,
                 "metadata": {},
@@ -248,22 +455,39 @@ class TextExtractionService:
                 "error": f"No extractor available for file type: {file_type}",
             }
 
-        # Verify file exists
-        if not os.path.exists(file_path):
-            return {
-                "text": "",
-                "text_length": 0,
-                "metadata": {},
-                "success": False,
-                "error": f"File not found: {file_path}",
-            }
+        # Verify file exists; the stat result is reused for the file size
+        if stat is None:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                return None, {
+                    "text": "",
+                    "text_length": 0,
+                    "metadata": {},
+                    "success": False,
+                    "error": f"File not found: {file_path}",
+                }
+
+        return stat, None
+
+    @staticmethod
+    def _add_file_size(result: Dict[str, Any], stat: os.stat_result) -> Dict[str, Any]:
+        """Record the file size from the existing stat result in successful extractions"""
+        if result["success"]:
+            result["metadata"]["file_size"] = stat.st_size
+        return result
+
+    async def extract_text(
+        self, file_path: str, file_type: FileType, *, stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Extract text from file using appropriate extractor"""
+        stat, error_result = self._check_extractable(file_path, file_type, stat)
+        if error_result:
+            return error_result
 
-        return await extractor.extract_text(file_path)
+        result = await self.get_extractor(file_type).extract_text(file_path)
+        return self._add_file_size(result, stat)
 
     def get_supported_file_types(self) -> list[FileType]:
         """Get list of supported file types"""
-        supported_types = []
-        for file_type in FileType:
-            if self.get_extractor(file_type):
-                supported_types.append(file_type)
-        return supported_types
+        return list(self._extractors_by_type)
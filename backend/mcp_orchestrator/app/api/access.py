@@ -6,12 +6,13 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.auth import UserContext, get_current_user
 from backend.common.database import get_db
 
+from ..core.cache import ToolCache, get_tool_cache
 from ..crud.tool import ToolAccessCRUD, ToolCRUD
 from ..models.schemas import ToolAccessResponse, ToolAccessUpdate
 
@@ -19,13 +20,29 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/access", tags=["access"])
 
+# Access entries change rarely, so polling clients may reuse a response for a few seconds
+ACCESS_CACHE_CONTROL = "private, max-age=5"
+
+
+async def _raise_access_not_found(db: AsyncSession, tool_id: UUID, user_id: UUID) -> None:
+    """Raise the 404 for a missed owner-scoped lookup, telling a foreign tool from missing access"""
+    if not await ToolCRUD.get_tool_if_owner(db, tool_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
+        )
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Access not found")
+
 
 @router.get("/my-tools", response_model=List[ToolAccessResponse])
 async def get_my_tool_access(
-    current_user: UserContext = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    response: Response,
+    current_user: UserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get all tool access permissions for the current user"""
     try:
+        response.headers["Cache-Control"] = ACCESS_CACHE_CONTROL
+
         # This would require a new CRUD method to get all access for a user
         # For now, we'll return an empty list as this is a complex query
         # that would need to be implemented in the CRUD layer
@@ -48,27 +65,28 @@ async def update_tool_access(
     updates: ToolAccessUpdate,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
 ):
     """Update access permissions for a user on a tool (owner only)"""
     try:
-        # Check if user is owner
-        tool = await ToolCRUD.get_tool(db, tool_id, current_user.user_id)
-        if not tool or tool.owner_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
-
+        # Ownership is checked in the same statement as the update
         access = await ToolAccessCRUD.update_access(
-            db=db, tool_id=tool_id, user_id=user_id, updates=updates
+            db=db,
+            tool_id=tool_id,
+            user_id=user_id,
+            updates=updates,
+            owner_id=current_user.user_id,
         )
 
         if not access:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Access not found")
+            await _raise_access_not_found(db, tool_id, current_user.user_id)
+
+        await tool_cache.invalidate(tool_id)
 
         logger.info(
             f"User {current_user.user_id} updated access to tool {tool_id} for user {user_id}"
         )
-        return ToolAccessResponse.from_orm(access)
+        return ToolAccessResponse.model_validate(access)
 
     except HTTPException:
         raise
@@ -83,24 +101,22 @@ async def update_tool_access(
 async def get_user_tool_access(
     tool_id: UUID,
     user_id: UUID,
+    response: Response,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get specific user's access to a tool (owner only)"""
     try:
-        # Check if user is owner
-        tool = await ToolCRUD.get_tool(db, tool_id, current_user.user_id)
-        if not tool or tool.owner_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
-
-        access = await ToolAccessCRUD.get_user_access(db=db, tool_id=tool_id, user_id=user_id)
+        # Ownership is checked in the same query as the lookup
+        access = await ToolAccessCRUD.get_user_access_cached(
+            db=db, tool_id=tool_id, user_id=user_id, owner_id=current_user.user_id
+        )
 
         if not access:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Access not found")
+            await _raise_access_not_found(db, tool_id, current_user.user_id)
 
-        return ToolAccessResponse.from_orm(access)
+        response.headers["Cache-Control"] = ACCESS_CACHE_CONTROL
+        return ToolAccessResponse.model_validate(access)
 
     except HTTPException:
         raise
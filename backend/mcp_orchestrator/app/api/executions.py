@@ -6,54 +6,104 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.auth import UserContext, get_current_user
 from backend.common.database import get_db
 
-from ..crud.tool import ToolAccessCRUD, ToolCRUD, ToolExecutionCRUD
+from ..core.cache import ExecutionResultCache, get_execution_result_cache
+from ..core.execution_writer import execution_writer
+from ..core.validation import validate_parameters
+from ..crud.tool import ToolCRUD, ToolExecutionCRUD
 from ..models.schemas import ToolExecutionListResponse, ToolExecutionRequest, ToolExecutionResponse
-from ..models.tool import ExecutionStatus
+from ..models.tool import ExecutionStatus, ToolExecution
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/executions", tags=["executions"])
 
+# Built at import so the request type is compiled before the first request, not during it
+_execution_request_decoder = msgspec.json.Decoder(ToolExecutionRequest)
+
+
+async def decode_execution_request(request: Request) -> ToolExecutionRequest:
+    """Decode and validate an execution request body with msgspec instead of pydantic"""
+    try:
+        return _execution_request_decoder.decode(await request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
 
 @router.post("/", response_model=ToolExecutionResponse, status_code=status.HTTP_201_CREATED)
 async def create_execution(
-    execution_request: ToolExecutionRequest,
+    execution_request: ToolExecutionRequest = Depends(decode_execution_request),
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    result_cache: ExecutionResultCache = Depends(get_execution_result_cache),
 ):
     """Create a new tool execution"""
     try:
-        # Check if user has execute access to the tool
-        tool = await ToolCRUD.get_tool(db, execution_request.tool_id, current_user.user_id)
-        if not tool:
+        # Check if user has execute access to the tool; only the permission columns are read
+        permissions = await ToolCRUD.get_tool_permissions(
+            db, execution_request.tool_id, current_user.user_id
+        )
+        is_owner = permissions is not None and permissions.owner_id == current_user.user_id
+        if not permissions or not (is_owner or permissions.can_view):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
             )
 
         # Check execute permissions
-        if tool.owner_id != current_user.user_id:
-            access = await ToolAccessCRUD.get_user_access(
-                db, execution_request.tool_id, current_user.user_id
+        if not is_owner and not permissions.can_execute:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Execute permission denied"
             )
-            if not access or not access.can_execute:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN, detail="Execute permission denied"
-                )
 
-        execution = await ToolExecutionCRUD.create_execution(
-            db=db, user_id=current_user.user_id, execution_request=execution_request
+        # Validate the input against the tool's parameters schema
+        error = validate_parameters(
+            permissions.parameters_schema, execution_request.input_parameters
         )
+        if error:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid input parameters: {error}",
+            )
+
+        values = ToolExecutionCRUD.build_execution(current_user.user_id, execution_request)
+
+        # Deterministic tools answer repeated input from the result cache
+        if permissions.cache_ttl_seconds:
+            cached_output = await result_cache.get(
+                execution_request.tool_id,
+                permissions.version,
+                execution_request.input_parameters,
+            )
+            if cached_output is not None:
+                values.update(
+                    status=ExecutionStatus.CACHED,
+                    output_result=cached_output,
+                    execution_time_ms=0,
+                    completed_at=values["started_at"],
+                )
+
+        # The row is written by the background writer; insert inline only if its queue is full
+        if execution_writer.submit(values):
+            execution = ToolExecution(**values)
+        else:
+            execution = await ToolExecutionCRUD.create_execution(
+                db=db,
+                user_id=current_user.user_id,
+                execution_request=execution_request,
+                values=values,
+            )
 
         logger.info(
             f"User {current_user.user_id} created execution {execution.id} for tool {execution_request.tool_id}"
         )
-        return ToolExecutionResponse.from_orm(execution)
+        return ToolExecutionResponse.model_validate(execution)
 
     except HTTPException:
         raise
@@ -75,7 +125,7 @@ async def list_user_executions(
 ):
     """List executions for the current user"""
     try:
-        executions = await ToolExecutionCRUD.get_user_executions(
+        executions, total = await ToolExecutionCRUD.get_user_executions(
             db=db,
             user_id=current_user.user_id,
             limit=limit,
@@ -84,15 +134,9 @@ async def list_user_executions(
             status=status_filter,
         )
 
-        execution_responses = [
-            ToolExecutionResponse.from_orm(execution) for execution in executions
-        ]
-
-        return ToolExecutionListResponse(
-            executions=execution_responses,
-            total=len(execution_responses),
-            limit=limit,
-            offset=offset,
+        # Rows are already shaped like ToolExecutionResponse; skip re-validating them
+        return ORJSONResponse(
+            {"executions": executions, "total": total, "limit": limit, "offset": offset}
         )
 
     except Exception as e:
@@ -112,18 +156,16 @@ async def get_execution(
     """Get a specific execution"""
     try:
         # Get execution and check if user has access
-        executions = await ToolExecutionCRUD.get_user_executions(
-            db=db, user_id=current_user.user_id, limit=1, offset=0
+        execution = await ToolExecutionCRUD.get_execution_by_id(
+            db=db, execution_id=execution_id, user_id=current_user.user_id
         )
 
-        execution = next((e for e in executions if e.id == execution_id), None)
-
         if not execution:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Execution not found or access denied"
             )
 
-        return ToolExecutionResponse.from_orm(execution)
+        return ToolExecutionResponse.model_validate(execution)
 
     except HTTPException:
         raise
@@ -144,26 +186,22 @@ async def list_tool_executions(
 ):
     """List executions for a specific tool (owner only)"""
     try:
-        # Check if user is owner of the tool
-        tool = await ToolCRUD.get_tool(db, tool_id, current_user.user_id)
-        if not tool or tool.owner_id != current_user.user_id:
+        # Ownership is checked in the same query as the listing
+        executions, total = await ToolExecutionCRUD.get_tool_executions(
+            db=db, tool_id=tool_id, limit=limit, offset=offset, owner_id=current_user.user_id
+        )
+
+        # An empty page is either a foreign tool or genuinely no executions
+        if not executions and not await ToolCRUD.get_tool_if_owner(
+            db, tool_id, current_user.user_id
+        ):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
             )
 
-        executions = await ToolExecutionCRUD.get_tool_executions(
-            db=db, tool_id=tool_id, limit=limit, offset=offset
-        )
-
-        execution_responses = [
-            ToolExecutionResponse.from_orm(execution) for execution in executions
-        ]
-
-        return ToolExecutionListResponse(
-            executions=execution_responses,
-            total=len(execution_responses),
-            limit=limit,
-            offset=offset,
+        # Rows are already shaped like ToolExecutionResponse; skip re-validating them
+        return ORJSONResponse(
+            {"executions": executions, "total": total, "limit": limit, "offset": offset}
         )
 
     except HTTPException:
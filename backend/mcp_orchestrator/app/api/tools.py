@@ -3,15 +3,24 @@ MCP Orchestrator Tools API
 """
 
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.auth import UserContext, get_current_user
-from backend.common.database import get_db
+from backend.common.database import get_db, get_db_session
 
+from ..core.cache import (
+    ExecutionResultCache,
+    ToolCache,
+    get_execution_result_cache,
+    get_tool_cache,
+)
 from ..crud.tool import ToolAccessCRUD, ToolCRUD
 from ..models.schemas import (
     ToolAccessCreate,
@@ -26,7 +35,16 @@ from ..models.tool import ToolStatus, ToolType
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1/tools", tags=["tools"])
+# Unexpected errors are logged and turned into a 500 by the app's global exception handler
+router = APIRouter(prefix="/api/v1/tools", tags=["tools"], default_response_class=ORJSONResponse)
+
+# Serializes access lists in one call rather than per entry
+ToolAccessListAdapter = TypeAdapter(List[ToolAccessResponse])
+
+
+def _json_response(body: str) -> Response:
+    """Send an already-serialized response body without validating it again"""
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=ToolResponse, status_code=status.HTTP_201_CREATED)
@@ -36,17 +54,30 @@ async def create_tool(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new tool"""
-    try:
-        tool = await ToolCRUD.create_tool(db=db, owner_id=current_user.user_id, tool_data=tool_data)
+    tool = await ToolCRUD.create_tool(db=db, owner_id=current_user.user_id, tool_data=tool_data)
 
-        logger.info(f"User {current_user.user_id} created tool {tool.id}")
-        return ToolResponse.from_orm(tool)
+    logger.info(f"User {current_user.user_id} created tool {tool.id}")
+    return ToolResponse.model_validate(tool)
 
-    except Exception as e:
-        logger.error(f"Error creating tool: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create tool"
-        )
+
+async def _export_tools(
+    user_id: UUID,
+    status_filter: Optional[ToolStatus],
+    tool_type: Optional[ToolType],
+    search: Optional[str],
+    tag: Optional[str],
+) -> AsyncIterator[bytes]:
+    """Yield one JSON line per tool; uses its own session as it outlives the request handler"""
+    async with get_db_session() as db:
+        async for tool in ToolCRUD.stream_user_tools(
+            db=db,
+            user_id=user_id,
+            status=status_filter,
+            tool_type=tool_type,
+            search=search,
+            tag=tag,
+        ):
+            yield orjson.dumps(tool) + b"\n"
 
 
 @router.get("/", response_model=ToolListResponse)
@@ -56,12 +87,22 @@ async def list_tools(
     status_filter: Optional[ToolStatus] = Query(None, alias="status"),
     tool_type: Optional[ToolType] = Query(None),
     search: Optional[str] = Query(None),
+    tag: Optional[str] = Query(None),
+    summary: bool = Query(False),
+    cursor: Optional[str] = Query(None),
+    export: bool = Query(False),
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List tools accessible to the current user"""
+    """List tools accessible to the current user; export=true streams all of them as NDJSON"""
+    if export:
+        return StreamingResponse(
+            _export_tools(current_user.user_id, status_filter, tool_type, search, tag),
+            media_type="application/x-ndjson",
+        )
+
     try:
-        tools = await ToolCRUD.get_user_tools(
+        tools, total, next_cursor = await ToolCRUD.get_user_tools(
             db=db,
             user_id=current_user.user_id,
             limit=limit,
@@ -69,19 +110,23 @@ async def list_tools(
             status=status_filter,
             tool_type=tool_type,
             search=search,
+            cursor=cursor,
+            tag=tag,
+            summary=summary,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-        tool_responses = [ToolResponse.from_orm(tool) for tool in tools]
-
-        return ToolListResponse(
-            tools=tool_responses, total=len(tool_responses), limit=limit, offset=offset
-        )
-
-    except Exception as e:
-        logger.error(f"Error listing tools for user {current_user.user_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve tools"
-        )
+    # Rows are already shaped like ToolResponse; skip re-validating them on the way out
+    return ORJSONResponse(
+        {
+            "tools": tools,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @router.get("/{tool_id}", response_model=ToolResponse)
@@ -89,26 +134,25 @@ async def get_tool(
     tool_id: UUID,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
 ):
     """Get a specific tool"""
-    try:
-        tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
+    cached = await tool_cache.get(tool_id, "tool", current_user.user_id)
+    if cached:
+        return _json_response(cached)
 
-        if not tool:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
+    tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
 
-        return ToolResponse.from_orm(tool)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting tool {tool_id}: {e}")
+    if not tool:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve tool"
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
+    # Serialized once, for both the cache and the response
+    body = ToolResponse.model_validate(tool).model_dump_json()
+    await tool_cache.set(tool_id, "tool", current_user.user_id, body)
+    return _json_response(body)
+
 
 @router.put("/{tool_id}", response_model=ToolResponse)
 async def update_tool(
@@ -116,55 +160,48 @@ async def update_tool(
     updates: ToolUpdate,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
+    result_cache: ExecutionResultCache = Depends(get_execution_result_cache),
 ):
     """Update a tool"""
-    try:
-        tool = await ToolCRUD.update_tool(
-            db=db, tool_id=tool_id, user_id=current_user.user_id, updates=updates
-        )
+    tool = await ToolCRUD.update_tool(
+        db=db, tool_id=tool_id, user_id=current_user.user_id, updates=updates
+    )
 
-        if not tool:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
-
-        logger.info(f"User {current_user.user_id} updated tool {tool_id}")
-        return ToolResponse.from_orm(tool)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating tool {tool_id}: {e}")
+    if not tool:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update tool"
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
+    await tool_cache.invalidate(tool_id)
+    # Cached outputs may no longer match the tool's behavior
+    await result_cache.invalidate(tool_id)
+
+    logger.info(f"User {current_user.user_id} updated tool {tool_id}")
+    return ToolResponse.model_validate(tool)
+
 
 @router.delete("/{tool_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_tool(
     tool_id: UUID,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
+    result_cache: ExecutionResultCache = Depends(get_execution_result_cache),
 ):
     """Delete a tool (owner only)"""
-    try:
-        success = await ToolCRUD.delete_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
+    success = await ToolCRUD.delete_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
 
-        logger.info(f"User {current_user.user_id} deleted tool {tool_id}")
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting tool {tool_id}: {e}")
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete tool"
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
+    await tool_cache.invalidate(tool_id)
+    await result_cache.invalidate(tool_id)
+
+    logger.info(f"User {current_user.user_id} deleted tool {tool_id}")
+
 
 @router.get("/{tool_id}/stats", response_model=ToolStatsResponse)
 async def get_tool_stats(
@@ -173,66 +210,44 @@ async def get_tool_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get tool execution statistics"""
-    try:
-        tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
+    stats = await ToolCRUD.get_tool_stats(db=db, tool_id=tool_id, user_id=current_user.user_id)
 
-        if not tool:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
-
-        return ToolStatsResponse(
-            tool_id=tool.id,
-            execution_count=tool.execution_count,
-            success_count=tool.success_count,
-            failure_count=tool.failure_count,
-            avg_execution_time_ms=tool.avg_execution_time_ms,
-            last_executed_at=tool.last_executed_at,
-            success_rate=(
-                tool.success_count / tool.execution_count if tool.execution_count > 0 else 0.0
-            ),
-            total_users=0,  # TODO: Implement user count calculation
-            active_users_last_30_days=0,  # TODO: Implement active user calculation
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting tool stats {tool_id}: {e}")
+    if not stats:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve tool statistics",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
+    return ToolStatsResponse(**stats)
+
 
 @router.get("/{tool_id}/access", response_model=List[ToolAccessResponse])
 async def get_tool_access(
     tool_id: UUID,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
 ):
     """Get tool access permissions (owner only)"""
-    try:
-        tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
-
-        if not tool or tool.owner_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
+    cached = await tool_cache.get(tool_id, "access", current_user.user_id)
+    if cached:
+        return _json_response(cached)
 
-        access_list = await ToolAccessCRUD.get_tool_access_list(db=db, tool_id=tool_id)
+    # Ownership is checked in the same query as the listing
+    access_list = await ToolAccessCRUD.get_tool_access_list(
+        db=db, tool_id=tool_id, owner_id=current_user.user_id
+    )
 
-        return [ToolAccessResponse.from_orm(access) for access in access_list]
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting tool access {tool_id}: {e}")
+    # An empty list is either a foreign tool or a tool nobody else can access
+    if not access_list and not await ToolCRUD.get_tool_if_owner(db, tool_id, current_user.user_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve tool access",
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
+    responses = [ToolAccessResponse.model_validate(access) for access in access_list]
+    body = ToolAccessListAdapter.dump_json(responses).decode()
+    await tool_cache.set(tool_id, "access", current_user.user_id, body)
+    return _json_response(body)
+
 
 @router.post(
     "/{tool_id}/access", response_model=ToolAccessResponse, status_code=status.HTTP_201_CREATED
@@ -242,30 +257,22 @@ async def grant_tool_access(
     access_data: ToolAccessCreate,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
 ):
     """Grant access to a tool (owner only)"""
-    try:
-        tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
-
-        if not tool or tool.owner_id != current_user.user_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
-            )
-
-        access = await ToolAccessCRUD.grant_access(
-            db=db, tool_id=tool_id, granted_by=current_user.user_id, access_data=access_data
+    # Ownership only needs an index probe, not the full tool row
+    if not await ToolCRUD.get_tool_if_owner(db, tool_id, current_user.user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
         )
 
-        logger.info(f"User {current_user.user_id} granted access to tool {tool_id}")
-        return ToolAccessResponse.from_orm(access)
+    access = await ToolAccessCRUD.grant_access(
+        db=db, tool_id=tool_id, granted_by=current_user.user_id, access_data=access_data
+    )
+    await tool_cache.invalidate(tool_id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error granting tool access: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to grant tool access"
-        )
+    logger.info(f"User {current_user.user_id} granted access to tool {tool_id}")
+    return ToolAccessResponse.model_validate(access)
 
 
 @router.delete("/{tool_id}/access/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -274,29 +281,21 @@ async def revoke_tool_access(
     user_id: UUID,
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    tool_cache: ToolCache = Depends(get_tool_cache),
 ):
     """Revoke tool access (owner only)"""
-    try:
-        tool = await ToolCRUD.get_tool(db=db, tool_id=tool_id, user_id=current_user.user_id)
+    # Ownership is checked in the same statement as the delete
+    success = await ToolAccessCRUD.revoke_access(
+        db=db, tool_id=tool_id, user_id=user_id, owner_id=current_user.user_id
+    )
 
-        if not tool or tool.owner_id != current_user.user_id:
+    if not success:
+        if not await ToolCRUD.get_tool_if_owner(db, tool_id, current_user.user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found or access denied"
             )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Access record not found")
 
-        success = await ToolAccessCRUD.revoke_access(db=db, tool_id=tool_id, user_id=user_id)
+    await tool_cache.invalidate(tool_id)
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Access record not found"
-            )
-
-        logger.info(f"User {current_user.user_id} revoked access to tool {tool_id}")
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error revoking tool access: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to revoke tool access"
-        )
+    logger.info(f"User {current_user.user_id} revoked access to tool {tool_id}")
@@ -0,0 +1,170 @@
+"""
+MCP Orchestrator Caches
+Caches per-user tool reads in Redis with explicit invalidation on writes, and the
+outputs of deterministic tools by input
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from redis.asyncio import Redis
+
+from backend.common.database import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCache:
+    """Per-tool Redis hash of serialized responses, one field per (kind, user)
+
+    Responses are access-checked per user, so every field includes the user id.
+    Invalidating a tool is a single DEL of its hash, with no key scans.
+    """
+
+    def __init__(self, redis: Optional[Redis], prefix: str = "tool_cache:", ttl: int = 60):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _tool_key(self, tool_id) -> str:
+        """Generate the Redis key for a tool's cached responses"""
+        return f"{self.prefix}{tool_id}"
+
+    async def get(self, tool_id, kind: str, user_id) -> Optional[str]:
+        """Get a cached JSON response, or None on a miss or Redis error"""
+        if self.redis is None:
+            return None
+        try:
+            return await self.redis.hget(self._tool_key(tool_id), f"{kind}:{user_id}")
+        except Exception as e:
+            logger.error(f"Tool cache get error for {tool_id}: {e}")
+            return None
+
+    async def set(self, tool_id, kind: str, user_id, value: str) -> bool:
+        """Cache a JSON response; the tool's hash expires ttl seconds after its first write
+
+        The expiry is only set on a new hash (EXPIRE NX), so a frequently written tool
+        still drops every field within ttl instead of having its expiry pushed back forever.
+        """
+        if self.redis is None:
+            return False
+        try:
+            key = self._tool_key(tool_id)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, f"{kind}:{user_id}", value)
+                pipe.expire(key, self.ttl, nx=True)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Tool cache set error for {tool_id}: {e}")
+            return False
+
+    async def invalidate(self, tool_id) -> bool:
+        """Drop every cached response for a tool"""
+        if self.redis is None:
+            return False
+        try:
+            await self.redis.delete(self._tool_key(tool_id))
+            return True
+        except Exception as e:
+            logger.error(f"Tool cache invalidate error for {tool_id}: {e}")
+            return False
+
+
+class ExecutionResultCache:
+    """Redis cache of tool outputs keyed by tool, tool version and canonical input parameters
+
+    Only tools with a cache_ttl_seconds are cached; their output must depend on the
+    input alone. Each tool has a generation counter stored with every cached output;
+    bumping it on update or delete invalidates all of the tool's outputs without a scan.
+    """
+
+    def __init__(self, redis: Optional[Redis], prefix: str = "mcp_execution_cache:"):
+        self.redis = redis
+        self.prefix = prefix
+
+    def _generation_key(self, tool_id) -> str:
+        """Generate the key of a tool's invalidation counter"""
+        return f"{self.prefix}generation:{tool_id}"
+
+    def _result_key(self, tool_id, version: str, input_parameters: Dict[str, Any]) -> str:
+        """Hash the tool id, version and key-sorted parameters JSON into a fixed-size key"""
+        digest = hashlib.blake2b(f"{tool_id}:{version}".encode(), digest_size=20)
+        digest.update(orjson.dumps(input_parameters, option=orjson.OPT_SORT_KEYS))
+        return f"{self.prefix}{digest.hexdigest()}"
+
+    async def get(
+        self, tool_id, version: str, input_parameters: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached output, or None on a miss, a stale generation or a Redis error"""
+        if self.redis is None:
+            return None
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._generation_key(tool_id))
+                pipe.get(self._result_key(tool_id, version, input_parameters))
+                generation, cached = await pipe.execute()
+            if not cached:
+                return None
+            entry = orjson.loads(cached)
+            if entry["generation"] != int(generation or 0):
+                return None
+            return entry["output"]
+        except Exception as e:
+            logger.error(f"Execution cache get error for {tool_id}: {e}")
+            return None
+
+    async def set(
+        self,
+        tool_id,
+        version: str,
+        input_parameters: Dict[str, Any],
+        output_result: Dict[str, Any],
+        ttl: int,
+    ) -> bool:
+        """Cache a completed execution's output for ttl seconds"""
+        if self.redis is None:
+            return False
+        try:
+            # An invalidation after this read leaves the entry on an old generation: a miss
+            generation = int(await self.redis.get(self._generation_key(tool_id)) or 0)
+            entry = orjson.dumps({"generation": generation, "output": output_result})
+            await self.redis.set(
+                self._result_key(tool_id, version, input_parameters), entry, ex=ttl
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Execution cache set error for {tool_id}: {e}")
+            return False
+
+    async def invalidate(self, tool_id) -> bool:
+        """Make every cached output of a tool stale"""
+        if self.redis is None:
+            return False
+        try:
+            await self.redis.incr(self._generation_key(tool_id))
+            return True
+        except Exception as e:
+            logger.error(f"Execution cache invalidate error for {tool_id}: {e}")
+            return False
+
+
+async def _get_redis_or_none() -> Optional[Redis]:
+    """Get the shared Redis client, or None if it is unavailable"""
+    try:
+        return await get_redis()
+    except Exception as e:
+        logger.warning(f"Cache disabled, Redis unavailable: {e}")
+        return None
+
+
+async def get_tool_cache() -> ToolCache:
+    """Dependency to get the tool cache; without Redis it degrades to a no-op"""
+    return ToolCache(await _get_redis_or_none())
+
+
+async def get_execution_result_cache() -> ExecutionResultCache:
+    """Dependency to get the execution result cache; without Redis it degrades to a no-op"""
+    return ExecutionResultCache(await _get_redis_or_none())
@@ -0,0 +1,131 @@
+"""
+MCP Orchestrator Execution Writer
+Buffers new tool execution rows in memory and inserts them in batches off the request path
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from backend.common.database import get_db_session
+
+from ..models.tool import ToolExecution
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionWriter:
+    """Background batch writer for tool execution rows
+
+    Rows are flushed as one multi-row INSERT once batch_size rows are queued or
+    flush_interval seconds after the first queued row, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_queued: int = 10_000,
+        max_attempts: int = 3,
+        retry_delay: float = 0.2,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is accepting rows"""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background worker"""
+        if not self.running:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker after writing everything still queued"""
+        if not self.running:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def submit(self, values: Dict[str, Any]) -> bool:
+        """Queue one execution row; False if the caller has to write it itself
+
+        A full queue is the backpressure signal: the caller then inserts the row inline,
+        so requests slow down to the database's pace instead of failing.
+        """
+        if not self.running or self._queue.full():
+            return False
+        self._queue.put_nowait(values)
+        return True
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for the first row, then collect more until the batch fills or the window ends"""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: write batches until cancelled"""
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write_with_retry(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_with_retry(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch, retrying transient failures, then row by row as a last resort
+
+        Clients already hold the execution IDs in this batch, so rows are only given up on
+        individually, when they fail on their own.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self._write(batch)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Error writing {len(batch)} tool executions "
+                    f"(attempt {attempt}/{self.max_attempts}): {e}"
+                )
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(self.retry_delay * attempt)
+
+        for values in batch:
+            try:
+                await self._write([values])
+            except Exception as e:
+                logger.error(f"Dropping tool execution {values.get('id')}: {e}")
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of execution rows in one statement"""
+        async with get_db_session() as db:
+            await db.execute(insert(ToolExecution), batch)
+            await db.commit()
+
+
+# Shared by the executions API; started and stopped with the service
+execution_writer = ExecutionWriter()
@@ -0,0 +1,44 @@
+"""
+MCP Orchestrator Parameter Validation
+Validates execution input against a tool's parameters_schema with cached validators
+"""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import LRUCache
+from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+# Canonical schema JSON -> compiled validator. Building a validator checks the schema
+# and resolves its keywords, which costs far more than validating one payload.
+_validators: LRUCache = LRUCache(maxsize=1024)
+
+
+def get_parameters_validator(schema: Dict[str, Any]) -> Optional[Validator]:
+    """Get the cached validator for a JSON Schema; None for an empty schema (accepts anything)"""
+    if not schema:
+        return None
+
+    key = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    validator = _validators.get(key)
+    if validator is None:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = _validators[key] = cls(schema)
+    return validator
+
+
+def validate_parameters(schema: Dict[str, Any], parameters: Dict[str, Any]) -> Optional[str]:
+    """Validate parameters against a schema; returns the first error message, or None if valid"""
+    try:
+        validator = get_parameters_validator(schema)
+    except SchemaError as e:
+        # Tools stored before schemas were checked on write can still carry a broken one
+        return f"tool parameters_schema is invalid: {e.message}"
+    if validator is None:
+        return None
+
+    error = next(validator.iter_errors(parameters), None)
+    return error.message if error else None
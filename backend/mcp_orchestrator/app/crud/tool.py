@@ -2,26 +2,156 @@
 MCP Orchestrator CRUD Operations
 """
 
+import base64
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from uuid import UUID
-
-from sqlalchemy import and_, delete, desc, func, or_, select, update
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from cachetools import TTLCache
+from sqlalchemy import (
+    Integer,
+    Row,
+    Text,
+    and_,
+    cast,
+    delete,
+    desc,
+    distinct,
+    exists,
+    func,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
+
+from backend.common.database.pagination import page_total
 
+from ..core.cache import ExecutionResultCache
 from ..models.schemas import (
     ToolAccessCreate,
     ToolAccessUpdate,
     ToolCreate,
     ToolExecutionRequest,
+    ToolExecutionResponse,
+    ToolResponse,
+    ToolSummaryResponse,
     ToolUpdate,
 )
-from ..models.tool import ExecutionStatus, Tool, ToolAccess, ToolExecution, ToolStatus, ToolType
+from ..models.tool import (
+    ExecutionStatus,
+    Tool,
+    ToolAccess,
+    ToolExecution,
+    ToolStatus,
+    ToolType,
+    utc_now,
+)
 
 logger = logging.getLogger(__name__)
 
+# (tool_id, user_id) -> (owner_id, access) for the owner-facing access lookup, which UIs poll
+_owner_access_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
+
+def _evict_tool_access(tool_id: UUID) -> None:
+    """Drop every cached owner access lookup for a tool"""
+    for key in [key for key in _owner_access_cache if key[0] == tool_id]:
+        _owner_access_cache.pop(key, None)
+
+
+def _list_columns(table, names) -> List[Any]:
+    """Select the named columns for a list page, with UUIDs sent as text
+
+    List rows go straight to JSON, so a UUID object per id would only be turned
+    back into a string; casting in SQL lets the driver hand over str directly.
+    """
+    columns = []
+    for name in names:
+        column = table.c[name]
+        if isinstance(column.type, PGUUID):
+            column = cast(column, Text).label(name)
+        columns.append(column)
+    return columns
+
+
+# Plain columns for list pages: rows map straight to response dicts without ORM objects
+_TOOL_LIST_COLUMNS = _list_columns(Tool.__table__, ToolResponse.model_fields)
+# Summary pages never touch the large JSON documents, so Postgres never detoasts them
+_TOOL_SUMMARY_COLUMNS = _list_columns(Tool.__table__, ToolSummaryResponse.model_fields)
+_EXECUTION_LIST_COLUMNS = _list_columns(ToolExecution.__table__, ToolExecutionResponse.model_fields)
+
+
+def encode_tool_cursor(tool: Tool) -> str:
+    """Encode a tool's (updated_at, id) sort key as an opaque pagination cursor"""
+    raw = f"{tool.updated_at.isoformat()}|{tool.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_tool_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a pagination cursor; raises ValueError if it is malformed"""
+    try:
+        updated_at, tool_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), UUID(tool_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+async def _fetch_page_with_total(
+    db: AsyncSession, query, columns, offset: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Run a COUNT(*) OVER () page query and split it into (column dicts, total)"""
+    rows = (await db.execute(query)).all()
+    total = await page_total(db, query, rows, offset)
+
+    page = [{column.name: row._mapping[column.name] for column in columns} for row in rows]
+    return page, total
+
+
+def _user_tools_query(
+    user_id: UUID,
+    status: Optional[ToolStatus] = None,
+    tool_type: Optional[ToolType] = None,
+    search: Optional[str] = None,
+    tag: Optional[str] = None,
+    columns: Optional[List[Any]] = None,
+):
+    """Build the filtered SELECT of tool list columns visible to a user"""
+    # Get tools where user is owner or has access; EXISTS keeps one row per tool
+    has_access = exists().where(
+        and_(
+            ToolAccess.tool_id == Tool.id,
+            ToolAccess.user_id == user_id,
+            ToolAccess.can_view == True,
+        )
+    )
+    query = select(*(columns or _TOOL_LIST_COLUMNS)).where(
+        or_(Tool.owner_id == user_id, has_access)
+    )
+
+    # Apply filters
+    if status:
+        query = query.where(Tool.status == status)
+
+    if tool_type:
+        query = query.where(Tool.tool_type == tool_type)
+
+    if search:
+        search_pattern = f"%{search}%"
+        query = query.where(
+            or_(Tool.name.ilike(search_pattern), Tool.description.ilike(search_pattern))
+        )
+
+    if tag:
+        query = query.where(Tool.tags.contains([tag]))
+
+    return query
+
 
 class ToolCRUD:
     """CRUD operations for tools"""
@@ -42,6 +172,7 @@ class ToolCRUD:
                 tags=tool_data.tags,
                 tool_metadata=tool_data.tool_metadata,
                 version=tool_data.version,
+                cache_ttl_seconds=tool_data.cache_ttl_seconds,
             )
 
             db.add(tool)
@@ -62,36 +193,121 @@ class ToolCRUD:
     ) -> Optional[Tool]:
         """Get a tool by ID with optional access check"""
         try:
-            query = select(Tool).where(Tool.id == tool_id)
+            # ToolResponse reads columns only; fail loudly rather than lazy load a relationship
+            query = select(Tool).options(raiseload("*")).where(Tool.id == tool_id)
 
-            # If user_id provided, check access
+            # If user_id provided, user can access if they own it or have explicit access
             if user_id:
-                # User can access if they own it or have explicit access
-                access_query = select(ToolAccess).where(
+                query = query.outerjoin(
+                    ToolAccess,
                     and_(
-                        ToolAccess.tool_id == tool_id,
+                        ToolAccess.tool_id == Tool.id,
                         ToolAccess.user_id == user_id,
                         ToolAccess.can_view == True,
+                    ),
+                ).where(or_(Tool.owner_id == user_id, ToolAccess.id.isnot(None)))
+
+            result = await db.execute(query)
+            return result.scalars().first()
+
+        except Exception as e:
+            logger.error(f"Error getting tool {tool_id}: {e}")
+            raise
+
+    @staticmethod
+    async def get_tool_permissions(db: AsyncSession, tool_id: UUID, user_id: UUID) -> Optional[Row]:
+        """Get owner_id, access flags, parameters_schema, cache_ttl_seconds and version of a tool
+
+        Only the columns an execution needs are read; the access flags are None without an
+        entry, and None is returned if the tool is missing.
+        """
+        query = (
+            select(
+                Tool.owner_id,
+                ToolAccess.can_view,
+                ToolAccess.can_execute,
+                Tool.parameters_schema,
+                Tool.cache_ttl_seconds,
+                Tool.version,
+            )
+            .outerjoin(
+                ToolAccess, and_(ToolAccess.tool_id == Tool.id, ToolAccess.user_id == user_id)
+            )
+            .where(Tool.id == tool_id)
+            .limit(1)
+        )
+        result = await db.execute(query)
+        return result.first()
+
+    @staticmethod
+    async def get_tool_stats(
+        db: AsyncSession, tool_id: UUID, user_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """Get a tool's execution statistics, computed in one query, if the user can view it"""
+        try:
+            active_since = datetime.utcnow() - timedelta(days=30)
+
+            total_users = (
+                select(func.count(distinct(ToolExecution.user_id)))
+                .where(ToolExecution.tool_id == Tool.id)
+                .scalar_subquery()
+            )
+            active_users = (
+                select(func.count(distinct(ToolExecution.user_id)))
+                .where(
+                    and_(
+                        ToolExecution.tool_id == Tool.id,
+                        ToolExecution.started_at >= active_since,
                     )
                 )
-                access_result = await db.execute(access_query)
-                access = access_result.scalar_one_or_none()
-
-                # Check if user is owner or has access
-                tool_query = select(Tool).where(
+                .scalar_subquery()
+            )
+            query = (
+                select(
+                    Tool.id.label("tool_id"),
+                    Tool.execution_count,
+                    Tool.success_count,
+                    Tool.failure_count,
+                    Tool.success_rate,
+                    Tool.avg_execution_time_ms,
+                    Tool.last_executed_at,
+                    total_users.label("total_users"),
+                    active_users.label("active_users_last_30_days"),
+                )
+                .outerjoin(
+                    ToolAccess,
+                    and_(
+                        ToolAccess.tool_id == Tool.id,
+                        ToolAccess.user_id == user_id,
+                        ToolAccess.can_view == True,
+                    ),
+                )
+                .where(
                     and_(
                         Tool.id == tool_id,
-                        or_(Tool.owner_id == user_id, access.id.isnot(None) if access else False),
+                        or_(Tool.owner_id == user_id, ToolAccess.id.isnot(None)),
                     )
                 )
-                result = await db.execute(tool_query)
-            else:
-                result = await db.execute(query)
+            )
 
-            return result.scalar_one_or_none()
+            result = await db.execute(query)
+            row = result.first()
+            return dict(row._mapping) if row else None
 
         except Exception as e:
-            logger.error(f"Error getting tool {tool_id}: {e}")
+            logger.error(f"Error getting tool stats {tool_id}: {e}")
+            raise
+
+    @staticmethod
+    async def get_tool_if_owner(db: AsyncSession, tool_id: UUID, user_id: UUID) -> bool:
+        """Check that a tool exists and is owned by the user"""
+        try:
+            query = select(Tool.id).where(and_(Tool.id == tool_id, Tool.owner_id == user_id))
+            result = await db.execute(query)
+            return result.scalar_one_or_none() is not None
+
+        except Exception as e:
+            logger.error(f"Error checking ownership of tool {tool_id}: {e}")
             raise
 
     @staticmethod
@@ -103,62 +319,85 @@ class ToolCRUD:
         status: Optional[ToolStatus] = None,
         tool_type: Optional[ToolType] = None,
         search: Optional[str] = None,
-    ) -> List[Tool]:
-        """Get tools accessible to a user"""
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        summary: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[str]]:
+        """Get a page of tools accessible to a user as plain dicts, the total and the next cursor
+
+        The total is only counted for offset pages; cursor pages return None for it.
+        Summary pages leave out the tools' JSON documents.
+        """
         try:
-            # Get tools where user is owner or has access
-            query = (
-                select(Tool)
-                .join(
-                    ToolAccess,
-                    and_(
-                        ToolAccess.tool_id == Tool.id,
-                        ToolAccess.user_id == user_id,
-                        ToolAccess.can_view == True,
-                    ),
-                    isouter=True,
-                )
-                .where(or_(Tool.owner_id == user_id, ToolAccess.user_id == user_id))
-            )
-
-            # Apply filters
-            if status:
-                query = query.where(Tool.status == status)
-
-            if tool_type:
-                query = query.where(Tool.tool_type == tool_type)
+            columns = _TOOL_SUMMARY_COLUMNS if summary else _TOOL_LIST_COLUMNS
+            query = _user_tools_query(user_id, status, tool_type, search, tag, columns)
 
-            if search:
-                search_pattern = f"%{search}%"
+            # Keyset pagination seeks past the cursor through the index, so deep pages cost
+            # the same as the first one; offset is only the fallback without a cursor
+            if cursor:
+                cursor_updated_at, cursor_id = decode_tool_cursor(cursor)
                 query = query.where(
-                    or_(Tool.name.ilike(search_pattern), Tool.description.ilike(search_pattern))
+                    tuple_(Tool.updated_at, Tool.id) < tuple_(cursor_updated_at, cursor_id)
                 )
+            else:
+                # Total matches come back with the page rather than from a second COUNT query
+                query = query.add_columns(func.count().over().label("total_count"))
+                if offset:
+                    query = query.offset(offset)
 
-            query = query.order_by(desc(Tool.updated_at)).limit(limit).offset(offset)
+            query = query.order_by(desc(Tool.updated_at), desc(Tool.id)).limit(limit)
 
             result = await db.execute(query)
-            return result.scalars().unique().all()
+            rows = result.all()
+
+            total = None if cursor else await page_total(db, query, rows, offset)
+
+            tools = [{column.name: row._mapping[column.name] for column in columns} for row in rows]
+            next_cursor = encode_tool_cursor(rows[-1]) if len(rows) == limit else None
+            return tools, total, next_cursor
 
         except Exception as e:
             logger.error(f"Error getting user tools for {user_id}: {e}")
             raise
 
+    @staticmethod
+    async def stream_user_tools(
+        db: AsyncSession,
+        user_id: UUID,
+        status: Optional[ToolStatus] = None,
+        tool_type: Optional[ToolType] = None,
+        search: Optional[str] = None,
+        tag: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every tool accessible to a user through a server-side cursor"""
+        query = _user_tools_query(user_id, status, tool_type, search, tag).order_by(
+            desc(Tool.updated_at), desc(Tool.id)
+        )
+
+        # yield_per fetches batch_size rows at a time, so memory stays bounded for any export
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for row in result:
+            yield dict(row._mapping)
+
     @staticmethod
     async def update_tool(
         db: AsyncSession, tool_id: UUID, user_id: UUID, updates: ToolUpdate
     ) -> Optional[Tool]:
         """Update a tool"""
         try:
-            # Check if user has modify access
-            tool = await ToolCRUD.get_tool(db, tool_id, user_id)
-            if not tool:
-                return None
-
-            # Check modify permissions
-            if tool.owner_id != user_id:
-                access = await ToolAccessCRUD.get_user_access(db, tool_id, user_id)
-                if not access or not access.can_modify:
-                    return None
+            # Modify access is checked inside the statement itself, never by loading rows
+            can_modify = or_(
+                Tool.owner_id == user_id,
+                exists().where(
+                    and_(
+                        ToolAccess.tool_id == Tool.id,
+                        ToolAccess.user_id == user_id,
+                        ToolAccess.can_view == True,
+                        ToolAccess.can_modify == True,
+                    )
+                ),
+            )
 
             # Build update dictionary
             update_data = {}
@@ -168,18 +407,25 @@ class ToolCRUD:
                     update_data[field] = value
 
             if not update_data:
-                return tool
+                query = select(Tool).options(raiseload("*")).where(Tool.id == tool_id, can_modify)
+                result = await db.execute(query)
+                return result.scalars().first()
 
-            # Add updated timestamp
-            update_data["updated_at"] = datetime.utcnow()
+            # updated_at is stamped by the column's onupdate
 
-            # Update tool
-            query = update(Tool).where(Tool.id == tool_id).values(**update_data)
-            await db.execute(query)
+            # Update tool; RETURNING hands back the fresh row in the same round-trip
+            query = (
+                update(Tool)
+                .where(and_(Tool.id == tool_id, can_modify))
+                .values(**update_data)
+                .returning(Tool)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            result = await db.execute(query)
+            tool = result.scalar_one_or_none()
             await db.commit()
 
-            # Return updated tool
-            return await ToolCRUD.get_tool(db, tool_id, user_id)
+            return tool
 
         except Exception as e:
             await db.rollback()
@@ -190,17 +436,19 @@ class ToolCRUD:
     async def delete_tool(db: AsyncSession, tool_id: UUID, user_id: UUID) -> bool:
         """Delete a tool (only owner can delete)"""
         try:
-            # Check if user is owner
-            tool = await ToolCRUD.get_tool(db, tool_id, user_id)
-            if not tool or tool.owner_id != user_id:
-                return False
-
-            # Delete tool (cascade will handle related records)
-            query = delete(Tool).where(Tool.id == tool_id)
+            # Ownership is part of the DELETE; executions and access rows go via ON DELETE CASCADE
+            query = (
+                delete(Tool)
+                .where(and_(Tool.id == tool_id, Tool.owner_id == user_id))
+                .returning(Tool.id)
+            )
             result = await db.execute(query)
             await db.commit()
 
-            return result.rowcount > 0
+            deleted = result.scalar_one_or_none() is not None
+            if deleted:
+                _evict_tool_access(tool_id)
+            return deleted
 
         except Exception as e:
             await db.rollback()
@@ -213,44 +461,32 @@ class ToolCRUD:
     ) -> bool:
         """Update tool execution statistics"""
         try:
-            # Get current stats
-            tool_query = select(Tool).where(Tool.id == tool_id)
-            result = await db.execute(tool_query)
-            tool = result.scalar_one_or_none()
-
-            if not tool:
-                return False
-
-            # Calculate new averages
-            new_execution_count = tool.execution_count + 1
-            new_success_count = tool.success_count + (1 if success else 0)
-            new_failure_count = tool.failure_count + (0 if success else 1)
-
-            # Calculate new average execution time
-            if tool.avg_execution_time_ms is None:
-                new_avg_time = execution_time_ms
-            else:
-                total_time = tool.avg_execution_time_ms * tool.execution_count
-                new_avg_time = int((total_time + execution_time_ms) / new_execution_count)
-
-            # Update stats
+            # One atomic UPDATE: counters and the running mean are computed from the row's
+            # current values, so concurrent executions cannot overwrite each other
             update_query = (
                 update(Tool)
                 .where(Tool.id == tool_id)
                 .values(
-                    execution_count=new_execution_count,
-                    success_count=new_success_count,
-                    failure_count=new_failure_count,
-                    avg_execution_time_ms=new_avg_time,
-                    last_executed_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    execution_count=Tool.execution_count + 1,
+                    success_count=Tool.success_count + (1 if success else 0),
+                    failure_count=Tool.failure_count + (0 if success else 1),
+                    avg_execution_time_ms=cast(
+                        (
+                            func.coalesce(Tool.avg_execution_time_ms, 0) * Tool.execution_count
+                            + execution_time_ms
+                        )
+                        / (Tool.execution_count + 1),
+                        Integer,
+                    ),
+                    last_executed_at=utc_now(),
+                    updated_at=utc_now(),
                 )
             )
 
-            await db.execute(update_query)
+            result = await db.execute(update_query)
             await db.commit()
 
-            return True
+            return result.rowcount > 0
 
         except Exception as e:
             await db.rollback()
@@ -261,19 +497,36 @@ class ToolCRUD:
 class ToolExecutionCRUD:
     """CRUD operations for tool executions"""
 
+    @staticmethod
+    def build_execution(user_id: UUID, execution_request: ToolExecutionRequest) -> Dict[str, Any]:
+        """Build a complete row for a new pending execution, id and timestamps included"""
+        return {
+            "id": uuid4(),
+            "tool_id": execution_request.tool_id,
+            "user_id": user_id,
+            "session_id": execution_request.session_id,
+            "status": ExecutionStatus.PENDING,
+            "input_parameters": execution_request.input_parameters,
+            "execution_context": execution_request.execution_context,
+            "execution_metadata": execution_request.execution_metadata,
+            "started_at": datetime.utcnow(),
+            # Always present so batched inserts share one column set
+            "output_result": None,
+            "execution_time_ms": None,
+            "completed_at": None,
+        }
+
     @staticmethod
     async def create_execution(
-        db: AsyncSession, user_id: UUID, execution_request: ToolExecutionRequest
+        db: AsyncSession,
+        user_id: UUID,
+        execution_request: ToolExecutionRequest,
+        values: Optional[Dict[str, Any]] = None,
     ) -> ToolExecution:
-        """Create a new tool execution"""
+        """Create a new tool execution, optionally from a row already built by build_execution"""
         try:
             execution = ToolExecution(
-                tool_id=execution_request.tool_id,
-                user_id=user_id,
-                session_id=execution_request.session_id,
-                input_parameters=execution_request.input_parameters,
-                execution_context=execution_request.execution_context,
-                execution_metadata=execution_request.execution_metadata,
+                **(values or ToolExecutionCRUD.build_execution(user_id, execution_request))
             )
 
             db.add(execution)
@@ -298,13 +551,18 @@ class ToolExecutionCRUD:
         execution_time_ms: Optional[int] = None,
         memory_used_mb: Optional[int] = None,
         cpu_usage_percent: Optional[int] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
     ) -> Optional[ToolExecution]:
-        """Update execution status and results"""
+        """Update execution status and results
+
+        With a result_cache, a completed run of a cached tool also stores its output for
+        later executions with the same input.
+        """
         try:
             update_data = {
                 "status": status,
                 "completed_at": (
-                    datetime.utcnow()
+                    utc_now()
                     if status
                     in [
                         ExecutionStatus.COMPLETED,
@@ -336,7 +594,31 @@ class ToolExecutionCRUD:
             # Get updated execution
             result_query = select(ToolExecution).where(ToolExecution.id == execution_id)
             result = await db.execute(result_query)
-            return result.scalar_one_or_none()
+            execution = result.scalar_one_or_none()
+
+            if (
+                result_cache is not None
+                and execution is not None
+                and status == ExecutionStatus.COMPLETED
+                and output_result is not None
+            ):
+                tool = (
+                    await db.execute(
+                        select(Tool.version, Tool.cache_ttl_seconds).where(
+                            Tool.id == execution.tool_id
+                        )
+                    )
+                ).first()
+                if tool is not None and tool.cache_ttl_seconds:
+                    await result_cache.set(
+                        execution.tool_id,
+                        tool.version,
+                        execution.input_parameters,
+                        output_result,
+                        tool.cache_ttl_seconds,
+                    )
+
+            return execution
 
         except Exception as e:
             await db.rollback()
@@ -351,10 +633,13 @@ class ToolExecutionCRUD:
         offset: int = 0,
         tool_id: Optional[UUID] = None,
         status: Optional[ExecutionStatus] = None,
-    ) -> List[ToolExecution]:
-        """Get executions for a user"""
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of executions for a user, as plain dicts, and the total matching count"""
         try:
-            query = select(ToolExecution).where(ToolExecution.user_id == user_id)
+            # COUNT(*) OVER () returns the total alongside the page in one round-trip
+            query = select(
+                *_EXECUTION_LIST_COLUMNS, func.count().over().label("total_count")
+            ).where(ToolExecution.user_id == user_id)
 
             if tool_id:
                 query = query.where(ToolExecution.tool_id == tool_id)
@@ -364,29 +649,52 @@ class ToolExecutionCRUD:
 
             query = query.order_by(desc(ToolExecution.started_at)).limit(limit).offset(offset)
 
-            result = await db.execute(query)
-            return result.scalars().all()
+            return await _fetch_page_with_total(db, query, _EXECUTION_LIST_COLUMNS, offset)
 
         except Exception as e:
             logger.error(f"Error getting user executions for {user_id}: {e}")
             raise
 
     @staticmethod
-    async def get_tool_executions(
-        db: AsyncSession, tool_id: UUID, limit: int = 50, offset: int = 0
-    ) -> List[ToolExecution]:
-        """Get executions for a tool"""
+    async def get_execution_by_id(
+        db: AsyncSession, execution_id: UUID, user_id: UUID
+    ) -> Optional[ToolExecution]:
+        """Get a single execution owned by a user"""
         try:
-            query = (
-                select(ToolExecution)
-                .where(ToolExecution.tool_id == tool_id)
-                .order_by(desc(ToolExecution.started_at))
-                .limit(limit)
-                .offset(offset)
+            query = select(ToolExecution).where(
+                and_(ToolExecution.id == execution_id, ToolExecution.user_id == user_id)
             )
 
             result = await db.execute(query)
-            return result.scalars().all()
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(f"Error getting execution {execution_id}: {e}")
+            raise
+
+    @staticmethod
+    async def get_tool_executions(
+        db: AsyncSession,
+        tool_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        owner_id: Optional[UUID] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of a tool's executions as dicts and the total, optionally owner-scoped"""
+        try:
+            query = select(
+                *_EXECUTION_LIST_COLUMNS, func.count().over().label("total_count")
+            ).where(ToolExecution.tool_id == tool_id)
+
+            # Ownership check joined into the same query
+            if owner_id:
+                query = query.join(Tool, Tool.id == ToolExecution.tool_id).where(
+                    Tool.owner_id == owner_id
+                )
+
+            query = query.order_by(desc(ToolExecution.started_at)).limit(limit).offset(offset)
+
+            return await _fetch_page_with_total(db, query, _EXECUTION_LIST_COLUMNS, offset)
 
         except Exception as e:
             logger.error(f"Error getting tool executions for {tool_id}: {e}")
@@ -402,51 +710,33 @@ class ToolAccessCRUD:
     ) -> ToolAccess:
         """Grant access to a tool"""
         try:
-            # Check if access already exists
-            existing_query = select(ToolAccess).where(
-                and_(ToolAccess.tool_id == tool_id, ToolAccess.user_id == access_data.user_id)
-            )
-            existing_result = await db.execute(existing_query)
-            existing_access = existing_result.scalar_one_or_none()
-
-            if existing_access:
-                # Update existing access
-                update_query = (
-                    update(ToolAccess)
-                    .where(ToolAccess.id == existing_access.id)
-                    .values(
-                        can_execute=access_data.can_execute,
-                        can_view=access_data.can_view,
-                        can_modify=access_data.can_modify,
-                        expires_at=access_data.expires_at,
-                        granted_by=granted_by,
-                        granted_at=datetime.utcnow(),
-                    )
-                )
-                await db.execute(update_query)
-                await db.commit()
+            permissions = {
+                "can_execute": access_data.can_execute,
+                "can_view": access_data.can_view,
+                "can_modify": access_data.can_modify,
+                "expires_at": access_data.expires_at,
+                "granted_by": granted_by,
+                "granted_at": utc_now(),
+            }
 
-                # Return updated access
-                updated_result = await db.execute(existing_query)
-                return updated_result.scalar_one()
-            else:
-                # Create new access
-                access = ToolAccess(
-                    tool_id=tool_id,
-                    user_id=access_data.user_id,
-                    can_execute=access_data.can_execute,
-                    can_view=access_data.can_view,
-                    can_modify=access_data.can_modify,
-                    expires_at=access_data.expires_at,
-                    granted_by=granted_by,
+            # One race-free upsert on the (tool_id, user_id) unique index
+            query = (
+                pg_insert(ToolAccess)
+                .values(tool_id=tool_id, user_id=access_data.user_id, **permissions)
+                .on_conflict_do_update(
+                    index_elements=[ToolAccess.tool_id, ToolAccess.user_id], set_=permissions
                 )
+                .returning(ToolAccess)
+                .execution_options(populate_existing=True)
+            )
+            result = await db.execute(query)
+            access = result.scalar_one()
+            await db.commit()
+            # Evicted once committed, so a concurrent lookup cannot re-cache the old grant
+            _owner_access_cache.pop((tool_id, access_data.user_id), None)
 
-                db.add(access)
-                await db.commit()
-                await db.refresh(access)
-
-                logger.info(f"Granted access to tool {tool_id} for user {access_data.user_id}")
-                return access
+            logger.info(f"Granted access to tool {tool_id} for user {access_data.user_id}")
+            return access
 
         except Exception as e:
             await db.rollback()
@@ -455,14 +745,20 @@ class ToolAccessCRUD:
 
     @staticmethod
     async def get_user_access(
-        db: AsyncSession, tool_id: UUID, user_id: UUID
+        db: AsyncSession, tool_id: UUID, user_id: UUID, owner_id: Optional[UUID] = None
     ) -> Optional[ToolAccess]:
-        """Get user's access to a tool"""
+        """Get user's access to a tool, optionally only if the tool is owned by owner_id"""
         try:
             query = select(ToolAccess).where(
                 and_(ToolAccess.tool_id == tool_id, ToolAccess.user_id == user_id)
             )
 
+            # Ownership check joined into the same query
+            if owner_id:
+                query = query.join(Tool, Tool.id == ToolAccess.tool_id).where(
+                    Tool.owner_id == owner_id
+                )
+
             result = await db.execute(query)
             return result.scalar_one_or_none()
 
@@ -471,14 +767,34 @@ class ToolAccessCRUD:
             raise
 
     @staticmethod
-    async def get_tool_access_list(db: AsyncSession, tool_id: UUID) -> List[ToolAccess]:
-        """Get all access entries for a tool"""
+    async def get_user_access_cached(
+        db: AsyncSession, tool_id: UUID, user_id: UUID, owner_id: UUID
+    ) -> Optional[ToolAccess]:
+        """Owner-scoped get_user_access served from a short-lived in-process cache"""
+        cached = _owner_access_cache.get((tool_id, user_id))
+        if cached and cached[0] == owner_id:
+            return cached[1]
+
+        access = await ToolAccessCRUD.get_user_access(db, tool_id, user_id, owner_id)
+        if access:
+            _owner_access_cache[(tool_id, user_id)] = (owner_id, access)
+        return access
+
+    @staticmethod
+    async def get_tool_access_list(
+        db: AsyncSession, tool_id: UUID, owner_id: Optional[UUID] = None
+    ) -> List[ToolAccess]:
+        """Get all access entries for a tool, optionally only if the tool is owned by owner_id"""
         try:
-            query = (
-                select(ToolAccess)
-                .where(ToolAccess.tool_id == tool_id)
-                .order_by(ToolAccess.granted_at)
-            )
+            query = select(ToolAccess).where(ToolAccess.tool_id == tool_id)
+
+            # Ownership check joined into the same query
+            if owner_id:
+                query = query.join(Tool, Tool.id == ToolAccess.tool_id).where(
+                    Tool.owner_id == owner_id
+                )
+
+            query = query.order_by(ToolAccess.granted_at)
 
             result = await db.execute(query)
             return result.scalars().all()
@@ -489,20 +805,14 @@ class ToolAccessCRUD:
 
     @staticmethod
     async def update_access(
-        db: AsyncSession, tool_id: UUID, user_id: UUID, updates: ToolAccessUpdate
+        db: AsyncSession,
+        tool_id: UUID,
+        user_id: UUID,
+        updates: ToolAccessUpdate,
+        owner_id: Optional[UUID] = None,
     ) -> Optional[ToolAccess]:
-        """Update access permissions for a user"""
+        """Update access permissions for a user, optionally only if the tool is owned by owner_id"""
         try:
-            # Check if access exists
-            existing_query = select(ToolAccess).where(
-                and_(ToolAccess.tool_id == tool_id, ToolAccess.user_id == user_id)
-            )
-            existing_result = await db.execute(existing_query)
-            existing_access = existing_result.scalar_one_or_none()
-
-            if not existing_access:
-                return None
-
             # Build update dictionary
             update_data = {}
             for field, value in updates.dict(exclude_unset=True).items():
@@ -510,19 +820,27 @@ class ToolAccessCRUD:
                     update_data[field] = value
 
             if not update_data:
-                return existing_access
+                return await ToolAccessCRUD.get_user_access(db, tool_id, user_id, owner_id)
 
-            # Update access
-            update_query = (
-                update(ToolAccess).where(ToolAccess.id == existing_access.id).values(**update_data)
+            # Single UPDATE ... RETURNING; the ownership check becomes UPDATE ... FROM tools
+            update_query = update(ToolAccess).where(
+                and_(ToolAccess.tool_id == tool_id, ToolAccess.user_id == user_id)
             )
+            if owner_id:
+                update_query = update_query.where(
+                    and_(Tool.id == ToolAccess.tool_id, Tool.owner_id == owner_id)
+                )
 
-            await db.execute(update_query)
+            result = await db.execute(
+                update_query.values(**update_data)
+                .returning(ToolAccess)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            access = result.scalar_one_or_none()
             await db.commit()
+            _owner_access_cache.pop((tool_id, user_id), None)
 
-            # Return updated access
-            updated_result = await db.execute(existing_query)
-            return updated_result.scalar_one()
+            return access
 
         except Exception as e:
             await db.rollback()
@@ -530,15 +848,22 @@ class ToolAccessCRUD:
             raise
 
     @staticmethod
-    async def revoke_access(db: AsyncSession, tool_id: UUID, user_id: UUID) -> bool:
-        """Revoke user's access to a tool"""
+    async def revoke_access(
+        db: AsyncSession, tool_id: UUID, user_id: UUID, owner_id: Optional[UUID] = None
+    ) -> bool:
+        """Revoke user's access to a tool, optionally only if the tool is owned by owner_id"""
         try:
             query = delete(ToolAccess).where(
                 and_(ToolAccess.tool_id == tool_id, ToolAccess.user_id == user_id)
             )
 
+            # The ownership check becomes DELETE ... USING tools
+            if owner_id:
+                query = query.where(and_(Tool.id == ToolAccess.tool_id, Tool.owner_id == owner_id))
+
             result = await db.execute(query)
             await db.commit()
+            _owner_access_cache.pop((tool_id, user_id), None)
 
             return result.rowcount > 0
 
@@ -4,25 +4,31 @@ MCP Orchestrator Service - Main Application
 Handles Model Context Protocol (MCP) tool integration and orchestration
 """
 
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import configure_mappers
+
 from backend.common.service_factory import create_service_app
 from backend.mcp_orchestrator.app.api.executions import router as executions_router
 from backend.mcp_orchestrator.app.api.tools import router as tools_router
 from backend.mcp_orchestrator.app.core.config import get_settings
+from backend.mcp_orchestrator.app.core.execution_writer import execution_writer
 
 
 async def mcp_startup_tasks():
     """MCP orchestrator specific startup tasks"""
+    # Resolve relationships and mapper state now instead of inside the first request
+    configure_mappers()
+    execution_writer.start()
     # TODO: Add database initialization
     # TODO: Load MCP tool configurations
     # TODO: Initialize tool execution environment
-    pass
 
 
 async def mcp_shutdown_tasks():
     """MCP orchestrator specific shutdown tasks"""
+    await execution_writer.stop()
     # TODO: Add cleanup logic
     # TODO: Cleanup tool execution environment
-    pass
 
 
 # Create the service app using the DRY factory
@@ -37,6 +43,8 @@ mcp_app = create_service_app(
     version="1.0.0",
     startup_tasks_func=mcp_startup_tasks,
     shutdown_tasks_func=mcp_shutdown_tasks,
+    # Tool and execution payloads carry large JSON documents; orjson encodes them much faster
+    default_response_class=ORJSONResponse,
     endpoints_config={
         "health": "/health",
         "tools": "/api/v1/tools",
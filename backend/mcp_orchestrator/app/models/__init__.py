@@ -16,6 +16,7 @@ from .schemas import (
     ToolRegistryResponse,
     ToolResponse,
     ToolStats,
+    ToolSummaryResponse,
     ToolUpdate,
     ToolValidationResult,
 )
@@ -43,6 +44,7 @@ __all__ = [
     "ToolCreate",
     "ToolUpdate",
     "ToolResponse",
+    "ToolSummaryResponse",
     "ToolListResponse",
     "ToolExecutionRequest",
     "ToolExecutionResponse",
@@ -1,16 +1,29 @@
 """
-MCP Orchestrator Pydantic Schemas
+MCP Orchestrator Schemas (pydantic for API models, msgspec for plain data)
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import msgspec
+from jsonschema.exceptions import SchemaError
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from ..core.validation import get_parameters_validator
 from .tool import ExecutionStatus, ToolStatus, ToolType
 
 
+def _check_parameters_schema(schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reject a parameters_schema that is not a valid JSON Schema (and cache its validator)"""
+    if schema:
+        try:
+            get_parameters_validator(schema)
+        except SchemaError as e:
+            raise ValueError(f"Invalid JSON Schema: {e.message}")
+    return schema
+
+
 # Tool Schemas
 class ToolCreate(BaseModel):
     """Tool creation schema"""
@@ -25,6 +38,9 @@ class ToolCreate(BaseModel):
     tags: List[str] = Field(default_factory=list)
     tool_metadata: Dict[str, Any] = Field(default_factory=dict)
     version: str = Field(default="1.0.0", max_length=50)
+    cache_ttl_seconds: Optional[int] = Field(None, ge=1)  # Only for deterministic tools
+
+    _validate_parameters_schema = field_validator("parameters_schema")(_check_parameters_schema)
 
 
 class ToolUpdate(BaseModel):
@@ -40,10 +56,13 @@ class ToolUpdate(BaseModel):
     tags: Optional[List[str]] = None
     tool_metadata: Optional[Dict[str, Any]] = None
     version: Optional[str] = Field(None, max_length=50)
+    cache_ttl_seconds: Optional[int] = Field(None, ge=1)
 
+    _validate_parameters_schema = field_validator("parameters_schema")(_check_parameters_schema)
 
-class ToolResponse(BaseModel):
-    """Tool response schema"""
+
+class ToolSummaryResponse(BaseModel):
+    """Tool summary schema: the tool without its configuration, schema and metadata documents"""
 
     id: UUID
     name: str
@@ -51,13 +70,9 @@ class ToolResponse(BaseModel):
     owner_id: UUID
     tool_type: ToolType
     status: ToolStatus
-    configuration: Dict[str, Any]
-    parameters_schema: Dict[str, Any]
-    return_schema: Dict[str, Any]
-    implementation: Dict[str, Any]
     tags: List[str]
-    tool_metadata: Dict[str, Any]
     version: str
+    cache_ttl_seconds: Optional[int] = None
     execution_count: int
     success_count: int
     failure_count: int
@@ -66,33 +81,49 @@ class ToolResponse(BaseModel):
     updated_at: datetime
     last_executed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ToolResponse(ToolSummaryResponse):
+    """Tool response schema"""
+
+    configuration: Dict[str, Any]
+    parameters_schema: Dict[str, Any]
+    return_schema: Dict[str, Any]
+    implementation: Dict[str, Any]
+    tool_metadata: Dict[str, Any]
 
 
 class ToolListResponse(BaseModel):
     """Tool list response schema"""
 
-    tools: List[ToolResponse]
-    total: int
+    tools: List[Union[ToolResponse, ToolSummaryResponse]]  # Summaries with ?summary=true
+    total: Optional[int] = None  # Only counted for offset pages
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 # Tool Execution Schemas
-class ToolExecutionRequest(BaseModel):
-    """Tool execution request schema"""
+class ToolExecutionRequest(msgspec.Struct, kw_only=True):
+    """Tool execution request schema
+
+    A msgspec Struct rather than a pydantic model: it is decoded on every tool
+    invocation, and msgspec decodes and validates JSON in a single pass.
+    """
 
     tool_id: UUID
-    input_parameters: Dict[str, Any] = Field(default_factory=dict)
+    input_parameters: Dict[str, Any] = msgspec.field(default_factory=dict)
     session_id: Optional[UUID] = None
-    execution_context: Dict[str, Any] = Field(default_factory=dict)
-    execution_metadata: Dict[str, Any] = Field(default_factory=dict)
+    execution_context: Dict[str, Any] = msgspec.field(default_factory=dict)
+    execution_metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
 class ToolExecutionResponse(BaseModel):
     """Tool execution response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     tool_id: UUID
     user_id: UUID
@@ -109,9 +140,6 @@ class ToolExecutionResponse(BaseModel):
     started_at: datetime
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-
 
 class ToolExecutionListResponse(BaseModel):
     """Tool execution list response schema"""
@@ -145,6 +173,8 @@ class ToolAccessUpdate(BaseModel):
 class ToolAccessResponse(BaseModel):
     """Tool access response schema"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     tool_id: UUID
     user_id: UUID
@@ -155,9 +185,6 @@ class ToolAccessResponse(BaseModel):
     granted_at: datetime
     expires_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
-
 
 # Tool Registry Schemas
 class ToolRegistryCreate(BaseModel):
@@ -198,12 +225,11 @@ class ToolRegistryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Tool Statistics
-class ToolStats(BaseModel):
+class ToolStats(msgspec.Struct, frozen=True, kw_only=True):
     """Tool statistics schema"""
 
     tool_id: UUID
@@ -230,22 +256,21 @@ class ToolStatsResponse(BaseModel):
     total_users: int
     active_users_last_30_days: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Tool Validation
-class ToolValidationResult(BaseModel):
+class ToolValidationResult(msgspec.Struct, frozen=True, kw_only=True):
     """Tool validation result schema"""
 
     is_valid: bool
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
-    suggestions: List[str] = Field(default_factory=list)
+    errors: List[str] = msgspec.field(default_factory=list)
+    warnings: List[str] = msgspec.field(default_factory=list)
+    suggestions: List[str] = msgspec.field(default_factory=list)
 
 
 # Execution Context
-class ExecutionContext(BaseModel):
+class ExecutionContext(msgspec.Struct, frozen=True, kw_only=True):
     """Execution context schema"""
 
     user_id: UUID
@@ -254,6 +279,6 @@ class ExecutionContext(BaseModel):
     timeout_seconds: int = 30
     max_memory_mb: int = 512
     max_cpu_percent: float = 50.0
-    allowed_domains: List[str] = Field(default_factory=list)
-    blocked_domains: List[str] = Field(default_factory=list)
-    custom_headers: Dict[str, str] = Field(default_factory=dict)
+    allowed_domains: List[str] = msgspec.field(default_factory=list)
+    blocked_domains: List[str] = msgspec.field(default_factory=list)
+    custom_headers: Dict[str, str] = msgspec.field(default_factory=dict)
@@ -3,11 +3,26 @@ MCP Orchestrator Database Models
 """
 
 import enum
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -15,6 +30,11 @@ from sqlalchemy.orm import relationship
 Base = declarative_base()
 
 
+def utc_now():
+    """SQL expression for the current UTC time as a naive timestamp, stamped by Postgres"""
+    return func.timezone("utc", func.now())
+
+
 class ToolStatus(enum.Enum):
     """Tool status enumeration"""
 
@@ -42,6 +62,7 @@ class ExecutionStatus(enum.Enum):
     FAILED = "failed"
     TIMEOUT = "timeout"
     CANCELLED = "cancelled"
+    CACHED = "cached"  # Answered from a previous run with the same input
 
 
 class Tool(Base):
@@ -58,31 +79,80 @@ class Tool(Base):
     status = Column(Enum(ToolStatus), default=ToolStatus.ACTIVE, nullable=False)
 
     # Tool Configuration
-    configuration = Column(JSON, nullable=False, default=dict)
-    parameters_schema = Column(JSON, nullable=False, default=dict)  # JSON Schema for parameters
-    return_schema = Column(JSON, nullable=False, default=dict)  # JSON Schema for return values
+    configuration = Column(JSONB, nullable=False, default=dict)
+    parameters_schema = Column(JSONB, nullable=False, default=dict)  # JSON Schema for parameters
+    return_schema = Column(JSONB, nullable=False, default=dict)  # JSON Schema for return values
 
     # Tool Implementation
-    implementation = Column(JSON, nullable=False, default=dict)  # Code, URL, or execution details
+    implementation = Column(JSONB, nullable=False, default=dict)  # Code, URL, or execution details
 
     # Metadata
-    tags = Column(JSON, nullable=False, default=list)  # List of tags
-    tool_metadata = Column(JSON, nullable=False, default=dict)
+    tags = Column(JSONB, nullable=False, default=list)  # List of tags
+    tool_metadata = Column(JSONB, nullable=False, default=dict)
     version = Column(String(50), nullable=False, default="1.0.0")
+    # Seconds a result may be reused for identical input; None means the tool is not cached
+    cache_ttl_seconds = Column(Integer, nullable=True)
 
     # Usage Statistics
     execution_count = Column(Integer, nullable=False, default=0)
     success_count = Column(Integer, nullable=False, default=0)
     failure_count = Column(Integer, nullable=False, default=0)
     avg_execution_time_ms = Column(Integer, nullable=True)
+    # Maintained by Postgres on every write, so reads never divide the counters themselves
+    success_rate = Column(
+        Float,
+        Computed(
+            "CASE WHEN execution_count > 0 "
+            "THEN success_count::double precision / execution_count ELSE 0 END",
+            persisted=True,
+        ),
+    )
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
     last_executed_at = Column(DateTime, nullable=True)
 
     # Relationships
-    executions = relationship("ToolExecution", back_populates="tool", cascade="all, delete-orphan")
+    executions = relationship(
+        "ToolExecution", back_populates="tool", cascade="all, delete-orphan", passive_deletes=True
+    )
+    access_entries = relationship("ToolAccess", back_populates="tool", passive_deletes=True)
+
+
+# Matches the tool listing's keyset order so each page is an index seek
+Index("ix_mcp_tools_owner_updated_id", Tool.owner_id, Tool.updated_at.desc(), Tool.id.desc())
+
+# Listing a user's active tools (status=active) is the common filter; the partial index is
+# smaller and includes the summary's small columns
+Index(
+    "ix_mcp_tools_owner_active_updated_id",
+    Tool.owner_id,
+    Tool.updated_at.desc(),
+    Tool.id.desc(),
+    postgresql_where=Tool.status == ToolStatus.ACTIVE,
+    postgresql_include=["name", "tool_type", "execution_count"],
+)
+
+# "Best tools" rankings among tools with a meaningful number of runs
+Index(
+    "ix_mcp_tools_success_rate",
+    Tool.success_rate.desc(),
+    postgresql_where=Tool.execution_count > 100,
+)
+
+# Tag containment filters (tags @> '["tag"]') on the listing
+Index("ix_mcp_tools_tags", Tool.tags, postgresql_using="gin")
+
+# Trigram index so the listing's '%term%' ILIKE search is an index lookup, not a scan
+# (pg_trgm is created by database/init and the add_tool_search_trgm_index migration)
+Index(
+    "ix_mcp_tools_name_description_trgm",
+    Tool.name,
+    Tool.description,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops", "description": "gin_trgm_ops"},
+)
 
 
 class ToolExecution(Base):
@@ -92,14 +162,16 @@ class ToolExecution(Base):
     __table_args__ = {"schema": "mcp"}
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tool_id = Column(PGUUID(as_uuid=True), ForeignKey("mcp.tools.id"), nullable=False)
-    user_id = Column(PGUUID(as_uuid=True), nullable=False, index=True)
+    tool_id = Column(
+        PGUUID(as_uuid=True), ForeignKey("mcp.tools.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id = Column(PGUUID(as_uuid=True), nullable=False)  # Indexed with started_at below
     session_id = Column(PGUUID(as_uuid=True), nullable=True)  # Optional chat session reference
 
     # Execution Details
     status = Column(Enum(ExecutionStatus), default=ExecutionStatus.PENDING, nullable=False)
-    input_parameters = Column(JSON, nullable=False, default=dict)
-    output_result = Column(JSON, nullable=True)
+    input_parameters = Column(JSONB, nullable=False, default=dict)
+    output_result = Column(JSONB, nullable=True)
     error_message = Column(Text, nullable=True)
 
     # Performance Metrics
@@ -108,17 +180,40 @@ class ToolExecution(Base):
     cpu_usage_percent = Column(Integer, nullable=True)
 
     # Metadata
-    execution_context = Column(JSON, nullable=False, default=dict)
-    execution_metadata = Column(JSON, nullable=False, default=dict)
+    execution_context = Column(JSONB, nullable=False, default=dict)
+    execution_metadata = Column(JSONB, nullable=False, default=dict)
 
     # Timestamps
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, server_default=utc_now(), nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
     tool = relationship("Tool", back_populates="executions")
 
 
+# Execution listings filter by user or tool and order by started_at desc, so these serve
+# the ORDER BY without a sort. status is left out of the indexes: every execution changes
+# it, and an indexed status would rule out HOT updates for those writes.
+Index(
+    "ix_mcp_tool_executions_user_started",
+    ToolExecution.user_id,
+    ToolExecution.started_at.desc(),
+    postgresql_include=["tool_id"],
+)
+Index("ix_mcp_tool_executions_tool_started", ToolExecution.tool_id, ToolExecution.started_at.desc())
+
+# Per-tool distinct user counts for tool statistics
+Index("ix_mcp_tool_executions_tool_user", ToolExecution.tool_id, ToolExecution.user_id)
+
+# Each execution row is inserted and then updated as it completes; free space left on every
+# page lets those updates stay on the page (HOT), and vacuum keeps up with the dead tuples
+event.listen(
+    ToolExecution.__table__,
+    "after_create",
+    DDL("ALTER TABLE %(fullname)s SET (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05)"),
+)
+
+
 class ToolAccess(Base):
     """Tool access control"""
 
@@ -126,7 +221,9 @@ class ToolAccess(Base):
     __table_args__ = {"schema": "mcp"}
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
-    tool_id = Column(PGUUID(as_uuid=True), ForeignKey("mcp.tools.id"), nullable=False)
+    tool_id = Column(
+        PGUUID(as_uuid=True), ForeignKey("mcp.tools.id", ondelete="CASCADE"), nullable=False
+    )
     user_id = Column(PGUUID(as_uuid=True), nullable=False, index=True)
 
     # Permissions
@@ -136,11 +233,15 @@ class ToolAccess(Base):
 
     # Metadata
     granted_by = Column(PGUUID(as_uuid=True), nullable=False)
-    granted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    granted_at = Column(DateTime, server_default=utc_now(), nullable=False)
     expires_at = Column(DateTime, nullable=True)
 
     # Relationships
-    tool = relationship("Tool")
+    tool = relationship("Tool", back_populates="access_entries")
+
+
+# One access entry per user and tool; grants upsert on this index
+Index("uq_mcp_tool_access_tool_user", ToolAccess.tool_id, ToolAccess.user_id, unique=True)
 
 
 class ToolRegistry(Base):
@@ -160,23 +261,23 @@ class ToolRegistry(Base):
 
     # Tool Information
     latest_version = Column(String(50), nullable=False)
-    supported_versions = Column(JSON, nullable=False, default=list)
-    compatibility = Column(JSON, nullable=False, default=dict)
+    supported_versions = Column(JSONB, nullable=False, default=list)
+    compatibility = Column(JSONB, nullable=False, default=dict)
 
     # Metadata
     description = Column(Text, nullable=True)
     author = Column(String(255), nullable=True)
     license = Column(String(100), nullable=True)
-    tags = Column(JSON, nullable=False, default=list)
+    tags = Column(JSONB, nullable=False, default=list)
 
     # Status
     is_verified = Column(Boolean, default=False, nullable=False)
     is_deprecated = Column(Boolean, default=False, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
 
-    parameters = Column(JSON, nullable=False, default=dict)
-    tool_metadata = Column(JSON, nullable=False, default=dict)
+    parameters = Column(JSONB, nullable=False, default=dict)
+    tool_metadata = Column(JSONB, nullable=False, default=dict)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -0,0 +1,51 @@
+"""add_chunk_content_hash
+
+Revision ID: add_chunk_content_hash_007
+Revises: add_file_checksum_006
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_chunk_content_hash_007"
+down_revision = "add_file_checksum_006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_chunks",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+        schema="files",
+    )
+
+    # Backfill with the same normalization used at ingest (trimmed, lower-cased)
+    op.execute(
+        """
+        UPDATE files.document_chunks
+        SET content_hash = encode(
+            sha256(convert_to(lower(btrim(content, E' \\t\\n\\r\\f\\v')), 'UTF8')), 'hex'
+        )
+    """
+    )
+
+    op.create_index(
+        op.f("ix_files_document_chunks_content_hash"),
+        "document_chunks",
+        ["content_hash"],
+        unique=False,
+        schema="files",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_files_document_chunks_content_hash"),
+        table_name="document_chunks",
+        schema="files",
+    )
+    op.drop_column("document_chunks", "content_hash", schema="files")
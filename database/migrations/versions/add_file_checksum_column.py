@@ -0,0 +1,67 @@
+"""add_file_checksum_column
+
+Revision ID: add_file_checksum_006
+Revises: fix_message_role_005
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_file_checksum_006"
+down_revision = "fix_message_role_005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "files", sa.Column("checksum", sa.String(length=64), nullable=True), schema="files"
+    )
+
+    # Backfill from the checksum previously stored in file_metadata. Rows without one
+    # get a unique placeholder derived from their id so the column can be NOT NULL.
+    op.execute(
+        """
+        UPDATE files.files
+        SET checksum = COALESCE(
+            file_metadata->>'checksum',
+            encode(sha256(convert_to(id::text, 'UTF8')), 'hex')
+        )
+    """
+    )
+
+    # Duplicate uploads within a collection were allowed until now. Keep the checksum on the
+    # oldest copy and give the later ones their id-derived placeholder, so the unique index
+    # below can be built; those rows just stop taking part in duplicate detection.
+    op.execute(
+        """
+        UPDATE files.files AS f
+        SET checksum = encode(sha256(convert_to(f.id::text, 'UTF8')), 'hex')
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY collection_id, checksum ORDER BY created_at, id
+            ) AS copy_number
+            FROM files.files
+        ) AS copies
+        WHERE copies.id = f.id AND copies.copy_number > 1
+    """
+    )
+
+    op.alter_column("files", "checksum", nullable=False, schema="files")
+
+    # Duplicate detection becomes an index probe enforced by the database
+    op.create_index(
+        "uq_files_collection_checksum",
+        "files",
+        ["collection_id", "checksum"],
+        unique=True,
+        schema="files",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_files_collection_checksum", table_name="files", schema="files")
+    op.drop_column("files", "checksum", schema="files")
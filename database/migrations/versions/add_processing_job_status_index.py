@@ -0,0 +1,35 @@
+"""add_processing_job_status_index
+
+Revision ID: add_job_status_index_010
+Revises: add_user_file_stats_009
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_job_status_index_010"
+down_revision = "add_user_file_stats_009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets status filters such as ProcessingJob.is_failed use an index scan. The table is
+    # created from the file service models rather than by a migration, so it may not exist.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('files.processing_jobs') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_files_processing_jobs_status
+                ON files.processing_jobs (status);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS files.ix_files_processing_jobs_status")
@@ -0,0 +1,46 @@
+"""add_tool_access_unique_index
+
+Revision ID: add_tool_access_unique_index_016
+Revises: add_tool_search_trgm_index_015
+Create Date: 2026-10-17 19:40:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_tool_access_unique_index_016"
+down_revision = "add_tool_search_trgm_index_015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # grant_access upserts ON CONFLICT (tool_id, user_id), which needs this unique index.
+    # Grants used to be inserted without a conflict target, so keep only the most recent
+    # grant of each pair first. The table is created from the MCP orchestrator models rather
+    # than by a migration, so it may not exist.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tool_access') IS NOT NULL THEN
+                DELETE FROM mcp.tool_access AS a
+                USING (
+                    SELECT id, row_number() OVER (
+                        PARTITION BY tool_id, user_id ORDER BY granted_at DESC, id DESC
+                    ) AS grant_number
+                    FROM mcp.tool_access
+                ) AS grants
+                WHERE grants.id = a.id AND grants.grant_number > 1;
+
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_mcp_tool_access_tool_user
+                ON mcp.tool_access (tool_id, user_id);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS mcp.uq_mcp_tool_access_tool_user")
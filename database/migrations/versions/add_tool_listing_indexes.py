@@ -0,0 +1,82 @@
+"""add_tool_listing_indexes
+
+Revision ID: add_tool_listing_indexes_018
+Revises: cascade_tool_foreign_keys_017
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_tool_listing_indexes_018"
+down_revision = "cascade_tool_foreign_keys_017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # These indexes were declared on the models only. The tables are created from the MCP
+    # orchestrator models rather than by a migration, so they may not exist; new tables
+    # already get the indexes.
+
+    # The tool listing pages by (updated_at, id) desc per owner; these indexes match that
+    # keyset order so each page is an index seek
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tools') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_mcp_tools_owner_updated_id
+                ON mcp.tools (owner_id, updated_at DESC, id DESC);
+
+                -- Listing a user's active tools is the common filter; the partial index is
+                -- smaller and includes the summary's small columns
+                CREATE INDEX IF NOT EXISTS ix_mcp_tools_owner_active_updated_id
+                ON mcp.tools (owner_id, updated_at DESC, id DESC)
+                INCLUDE (name, tool_type, execution_count)
+                WHERE status = 'ACTIVE';
+            END IF;
+        END $$
+    """
+    )
+
+    # Execution listings filter by user or tool and order by started_at desc, so these serve
+    # the ORDER BY without a sort. The user index includes tool_id for the optional tool
+    # filter.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tool_executions') IS NOT NULL THEN
+                -- Tables created from an older model have this index without tool_id
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_indexes
+                    WHERE schemaname = 'mcp'
+                      AND indexname = 'ix_mcp_tool_executions_user_started'
+                      AND indexdef LIKE '%INCLUDE (tool_id)'
+                ) THEN
+                    DROP INDEX IF EXISTS mcp.ix_mcp_tool_executions_user_started;
+                END IF;
+
+                CREATE INDEX IF NOT EXISTS ix_mcp_tool_executions_user_started
+                ON mcp.tool_executions (user_id, started_at DESC) INCLUDE (tool_id);
+
+                CREATE INDEX IF NOT EXISTS ix_mcp_tool_executions_tool_started
+                ON mcp.tool_executions (tool_id, started_at DESC);
+
+                -- Per-tool distinct user counts for tool statistics
+                CREATE INDEX IF NOT EXISTS ix_mcp_tool_executions_tool_user
+                ON mcp.tool_executions (tool_id, user_id);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tool_executions_tool_user")
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tool_executions_tool_started")
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tool_executions_user_started")
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tools_owner_active_updated_id")
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tools_owner_updated_id")
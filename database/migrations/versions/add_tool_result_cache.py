@@ -0,0 +1,39 @@
+"""add_tool_result_cache
+
+Revision ID: add_tool_result_cache_013
+Revises: add_tool_success_rate_012
+Create Date: 2026-10-17 19:10:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_tool_result_cache_013"
+down_revision = "add_tool_success_rate_012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tool.cache_ttl_seconds opts a tool into the execution result cache, and executions
+    # answered from it are recorded as CACHED (enum columns store the member names). The
+    # tables are created from the MCP orchestrator models, so they may not exist yet.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tools') IS NOT NULL THEN
+                ALTER TABLE mcp.tools ADD COLUMN IF NOT EXISTS cache_ttl_seconds integer;
+            END IF;
+            IF to_regtype('executionstatus') IS NOT NULL THEN
+                ALTER TYPE executionstatus ADD VALUE IF NOT EXISTS 'CACHED';
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    # Postgres cannot drop an enum value; CACHED stays in executionstatus
+    op.execute("ALTER TABLE IF EXISTS mcp.tools DROP COLUMN IF EXISTS cache_ttl_seconds")
@@ -0,0 +1,38 @@
+"""add_tool_search_trgm_index
+
+Revision ID: add_tool_search_trgm_index_015
+Revises: convert_mcp_json_to_jsonb_014
+Create Date: 2026-10-17 19:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_tool_search_trgm_index_015"
+down_revision = "convert_mcp_json_to_jsonb_014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # database/init creates pg_trgm for fresh databases; older ones may predate that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Lets the tool listing's '%term%' ILIKE search use an index. The table is created from
+    # the MCP orchestrator models rather than by a migration, so it may not exist.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tools') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_mcp_tools_name_description_trgm
+                ON mcp.tools USING gin (name gin_trgm_ops, description gin_trgm_ops);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tools_name_description_trgm")
@@ -0,0 +1,45 @@
+"""add_tool_success_rate
+
+Revision ID: add_tool_success_rate_012
+Revises: tune_tool_executions_storage_011
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "add_tool_success_rate_012"
+down_revision = "tune_tool_executions_storage_011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tool.success_rate is a stored generated column, and ix_mcp_tools_success_rate serves the
+    # "best tools" ranking. The table is created from the MCP orchestrator models rather than
+    # by a migration, so it may not exist; new tables already get both.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tools') IS NOT NULL THEN
+                ALTER TABLE mcp.tools
+                ADD COLUMN IF NOT EXISTS success_rate double precision
+                GENERATED ALWAYS AS (
+                    CASE WHEN execution_count > 0
+                    THEN success_count::double precision / execution_count ELSE 0 END
+                ) STORED;
+
+                CREATE INDEX IF NOT EXISTS ix_mcp_tools_success_rate
+                ON mcp.tools (success_rate DESC)
+                WHERE execution_count > 100;
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tools_success_rate")
+    op.execute("ALTER TABLE IF EXISTS mcp.tools DROP COLUMN IF EXISTS success_rate")
@@ -0,0 +1,173 @@
+"""add_user_file_stats
+
+Revision ID: add_user_file_stats_009
+Revises: add_chunk_content_hash_007
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "add_user_file_stats_009"
+down_revision = "add_chunk_content_hash_007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_file_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("slot", sa.SmallInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "status_counts",
+            postgresql.JSONB(),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "type_counts",
+            postgresql.JSONB(),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("total_size_bytes", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("total_chunks", sa.BigInteger(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["auth.users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "slot"),
+        schema="files",
+    )
+
+    # Add (sign = 1) or remove (sign = -1) one file's contribution to its owner's totals.
+    # Files are spread over 8 slot rows per owner (USER_FILE_STATS_SLOTS) by file id, so
+    # concurrent uploads and status changes for one user do not all queue on one row lock.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION files.apply_user_file_stats(
+            p_file_id uuid, p_collection_id uuid, p_status text, p_file_type text,
+            p_file_size bigint, p_total_chunks bigint, p_sign integer
+        ) RETURNS void AS $$
+        DECLARE
+            v_owner_id uuid;
+        BEGIN
+            SELECT owner_id INTO v_owner_id
+            FROM collections.collections WHERE id = p_collection_id;
+            IF v_owner_id IS NULL THEN
+                RETURN;
+            END IF;
+
+            INSERT INTO files.user_file_stats AS s
+                (user_id, slot, status_counts, type_counts, total_size_bytes, total_chunks)
+            VALUES (
+                v_owner_id,
+                hashtext(p_file_id::text) & 7,
+                jsonb_build_object(p_status, p_sign),
+                jsonb_build_object(p_file_type, p_sign),
+                p_sign * p_file_size,
+                p_sign * p_total_chunks
+            )
+            ON CONFLICT (user_id, slot) DO UPDATE SET
+                status_counts = s.status_counts || jsonb_build_object(
+                    p_status, COALESCE((s.status_counts->>p_status)::bigint, 0) + p_sign
+                ),
+                type_counts = s.type_counts || jsonb_build_object(
+                    p_file_type, COALESCE((s.type_counts->>p_file_type)::bigint, 0) + p_sign
+                ),
+                total_size_bytes = s.total_size_bytes + EXCLUDED.total_size_bytes,
+                total_chunks = s.total_chunks + EXCLUDED.total_chunks;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION files.user_file_stats_trigger() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM files.apply_user_file_stats(
+                    OLD.id, OLD.collection_id, OLD.status::text, OLD.file_type::text,
+                    OLD.file_size, OLD.total_chunks, -1
+                );
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM files.apply_user_file_stats(
+                    NEW.id, NEW.collection_id, NEW.status::text, NEW.file_type::text,
+                    NEW.file_size, NEW.total_chunks, 1
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER files_user_file_stats_insert_delete
+        AFTER INSERT OR DELETE ON files.files
+        FOR EACH ROW EXECUTE FUNCTION files.user_file_stats_trigger()
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER files_user_file_stats_update
+        AFTER UPDATE OF status, file_type, file_size, total_chunks, collection_id
+        ON files.files
+        FOR EACH ROW EXECUTE FUNCTION files.user_file_stats_trigger()
+    """
+    )
+
+    # Backfill from the existing files; each owner's totals start in slot 0
+    op.execute(
+        """
+        INSERT INTO files.user_file_stats
+            (user_id, slot, status_counts, type_counts, total_size_bytes, total_chunks)
+        SELECT
+            totals.owner_id,
+            0,
+            COALESCE(statuses.counts, '{}'::jsonb),
+            COALESCE(types.counts, '{}'::jsonb),
+            totals.total_size_bytes,
+            totals.total_chunks
+        FROM (
+            SELECT c.owner_id,
+                   SUM(f.file_size)::bigint AS total_size_bytes,
+                   SUM(f.total_chunks)::bigint AS total_chunks
+            FROM files.files f JOIN collections.collections c ON c.id = f.collection_id
+            GROUP BY c.owner_id
+        ) totals
+        LEFT JOIN (
+            SELECT owner_id, jsonb_object_agg(status, n) AS counts
+            FROM (
+                SELECT c.owner_id, f.status::text AS status, COUNT(*) AS n
+                FROM files.files f JOIN collections.collections c ON c.id = f.collection_id
+                GROUP BY c.owner_id, f.status
+            ) grouped
+            GROUP BY owner_id
+        ) statuses ON statuses.owner_id = totals.owner_id
+        LEFT JOIN (
+            SELECT owner_id, jsonb_object_agg(file_type, n) AS counts
+            FROM (
+                SELECT c.owner_id, f.file_type::text AS file_type, COUNT(*) AS n
+                FROM files.files f JOIN collections.collections c ON c.id = f.collection_id
+                GROUP BY c.owner_id, f.file_type
+            ) grouped
+            GROUP BY owner_id
+        ) types ON types.owner_id = totals.owner_id
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS files_user_file_stats_update ON files.files")
+    op.execute("DROP TRIGGER IF EXISTS files_user_file_stats_insert_delete ON files.files")
+    op.execute("DROP FUNCTION IF EXISTS files.user_file_stats_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "files.apply_user_file_stats(uuid, uuid, text, text, bigint, bigint, integer)"
+    )
+    op.drop_table("user_file_stats", schema="files")
@@ -0,0 +1,60 @@
+"""cascade_mcp_tool_foreign_keys
+
+Revision ID: cascade_tool_foreign_keys_017
+Revises: add_tool_access_unique_index_016
+Create Date: 2026-10-17 19:50:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "cascade_tool_foreign_keys_017"
+down_revision = "add_tool_access_unique_index_016"
+branch_labels = None
+depends_on = None
+
+
+def _set_tool_foreign_keys(on_delete: str) -> None:
+    """Recreate the tool_id foreign keys of the MCP child tables with the given ON DELETE"""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            tbl text;
+            fk text;
+        BEGIN
+            FOREACH tbl IN ARRAY ARRAY['tool_executions', 'tool_access'] LOOP
+                IF to_regclass('mcp.' || tbl) IS NULL THEN
+                    CONTINUE;
+                END IF;
+
+                SELECT conname INTO fk
+                FROM pg_constraint
+                WHERE conrelid = ('mcp.' || tbl)::regclass
+                  AND confrelid = 'mcp.tools'::regclass
+                  AND contype = 'f';
+
+                IF fk IS NOT NULL THEN
+                    EXECUTE format(
+                        'ALTER TABLE mcp.%I DROP CONSTRAINT %I, '
+                        'ADD CONSTRAINT %I FOREIGN KEY (tool_id) REFERENCES mcp.tools (id) '
+                        'ON DELETE {on_delete}',
+                        tbl, fk, fk
+                    );
+                END IF;
+            END LOOP;
+        END $$
+    """
+    )
+
+
+def upgrade() -> None:
+    # delete_tool issues one DELETE and relies on the database to remove the tool's
+    # executions and access entries (passive_deletes). The tables are created from the MCP
+    # orchestrator models rather than by a migration, so they may not exist.
+    _set_tool_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    _set_tool_foreign_keys("NO ACTION")
@@ -0,0 +1,69 @@
+"""convert_mcp_json_to_jsonb
+
+Revision ID: convert_mcp_json_to_jsonb_014
+Revises: add_tool_result_cache_013
+Create Date: 2026-10-17 19:20:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "convert_mcp_json_to_jsonb_014"
+down_revision = "add_tool_result_cache_013"
+branch_labels = None
+depends_on = None
+
+# MCP orchestrator tables whose JSON documents the models declare as JSONB
+TABLES = ("tools", "tool_executions", "tool_registry")
+
+
+def _convert_columns(from_type: str, to_type: str) -> None:
+    """Rewrite every from_type column of the MCP tables to to_type, one ALTER per table"""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            tbl text;
+            alterations text;
+        BEGIN
+            FOREACH tbl IN ARRAY ARRAY['{"', '".join(TABLES)}'] LOOP
+                SELECT string_agg(
+                    format('ALTER COLUMN %I TYPE {to_type} USING %I::{to_type}',
+                           column_name, column_name),
+                    ', '
+                )
+                INTO alterations
+                FROM information_schema.columns
+                WHERE table_schema = 'mcp' AND table_name = tbl AND data_type = '{from_type}';
+
+                IF alterations IS NOT NULL THEN
+                    EXECUTE format('ALTER TABLE mcp.%I ', tbl) || alterations;
+                END IF;
+            END LOOP;
+        END $$
+    """
+    )
+
+
+def upgrade() -> None:
+    # The tables are created from the MCP orchestrator models rather than by a migration;
+    # ones created before the switch to JSONB still have json columns, which the GIN index
+    # and the @> tag filter need as jsonb
+    _convert_columns("json", "jsonb")
+
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tools') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_mcp_tools_tags ON mcp.tools USING gin (tags);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS mcp.ix_mcp_tools_tags")
+    _convert_columns("jsonb", "json")
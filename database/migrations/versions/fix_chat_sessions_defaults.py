@@ -6,7 +6,6 @@ Create Date: 2025-06-01 11:20:00.000000
 
 """
 
-import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -17,30 +16,30 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Make problematic fields nullable or add defaults
-    op.alter_column("chat_sessions", "status", nullable=True, schema="chat")
-
-    op.alter_column("chat_sessions", "model_name", nullable=True, schema="chat")
-
-    op.alter_column("chat_sessions", "temperature", nullable=True, schema="chat")
-
-    op.alter_column("chat_sessions", "max_tokens", nullable=True, schema="chat")
-
-    op.alter_column("chat_sessions", "message_count", nullable=True, schema="chat")
-
-    op.alter_column("chat_sessions", "title", nullable=True, schema="chat")
+    # Make problematic fields nullable; one ALTER TABLE takes the table lock once
+    op.execute(
+        """
+        ALTER TABLE chat.chat_sessions
+            ALTER COLUMN status DROP NOT NULL,
+            ALTER COLUMN model_name DROP NOT NULL,
+            ALTER COLUMN temperature DROP NOT NULL,
+            ALTER COLUMN max_tokens DROP NOT NULL,
+            ALTER COLUMN message_count DROP NOT NULL,
+            ALTER COLUMN title DROP NOT NULL
+    """
+    )
 
 
 def downgrade() -> None:
     # Revert to not null (this might fail if there are null values)
-    op.alter_column("chat_sessions", "title", nullable=False, schema="chat")
-
-    op.alter_column("chat_sessions", "message_count", nullable=False, schema="chat")
-
-    op.alter_column("chat_sessions", "max_tokens", nullable=False, schema="chat")
-
-    op.alter_column("chat_sessions", "temperature", nullable=False, schema="chat")
-
-    op.alter_column("chat_sessions", "model_name", nullable=False, schema="chat")
-
-    op.alter_column("chat_sessions", "status", nullable=False, schema="chat")
+    op.execute(
+        """
+        ALTER TABLE chat.chat_sessions
+            ALTER COLUMN title SET NOT NULL,
+            ALTER COLUMN message_count SET NOT NULL,
+            ALTER COLUMN max_tokens SET NOT NULL,
+            ALTER COLUMN temperature SET NOT NULL,
+            ALTER COLUMN model_name SET NOT NULL,
+            ALTER COLUMN status SET NOT NULL
+    """
+    )
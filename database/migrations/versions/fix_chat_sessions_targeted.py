@@ -6,9 +6,7 @@ Create Date: 2025-06-01 11:15:00.000000
 
 """
 
-import sqlalchemy as sa
 from alembic import op
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision = "fix_chat_sessions_003"
@@ -18,46 +16,42 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add missing columns to chat_sessions table
-    op.add_column(
-        "chat_sessions",
-        sa.Column("collection_ids", sa.JSON(), nullable=False, server_default="[]"),
-        schema="chat",
-    )
-
-    op.add_column(
-        "chat_sessions",
-        sa.Column("context_settings", sa.JSON(), nullable=False, server_default="{}"),
-        schema="chat",
-    )
-
-    op.add_column(
-        "chat_sessions",
-        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
-        schema="chat",
+    # Add missing columns to chat_sessions table; one ALTER TABLE per table takes its lock once
+    op.execute(
+        """
+        ALTER TABLE chat.chat_sessions
+            ADD COLUMN collection_ids JSON NOT NULL DEFAULT '[]',
+            ADD COLUMN context_settings JSON NOT NULL DEFAULT '{}',
+            ADD COLUMN is_active BOOLEAN NOT NULL DEFAULT true
+    """
     )
 
     # Add missing columns to chat_messages table
-    op.add_column(
-        "chat_messages",
-        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
-        schema="chat",
-    )
-
-    op.add_column(
-        "chat_messages", sa.Column("tokens_used", sa.Integer(), nullable=True), schema="chat"
-    )
-
-    op.add_column(
-        "chat_messages", sa.Column("response_time_ms", sa.Integer(), nullable=True), schema="chat"
+    op.execute(
+        """
+        ALTER TABLE chat.chat_messages
+            ADD COLUMN user_id UUID,
+            ADD COLUMN tokens_used INTEGER,
+            ADD COLUMN response_time_ms INTEGER
+    """
     )
 
 
 def downgrade() -> None:
     # Remove added columns
-    op.drop_column("chat_messages", "response_time_ms", schema="chat")
-    op.drop_column("chat_messages", "tokens_used", schema="chat")
-    op.drop_column("chat_messages", "user_id", schema="chat")
-    op.drop_column("chat_sessions", "is_active", schema="chat")
-    op.drop_column("chat_sessions", "context_settings", schema="chat")
-    op.drop_column("chat_sessions", "collection_ids", schema="chat")
+    op.execute(
+        """
+        ALTER TABLE chat.chat_messages
+            DROP COLUMN response_time_ms,
+            DROP COLUMN tokens_used,
+            DROP COLUMN user_id
+    """
+    )
+    op.execute(
+        """
+        ALTER TABLE chat.chat_sessions
+            DROP COLUMN is_active,
+            DROP COLUMN context_settings,
+            DROP COLUMN collection_ids
+    """
+    )
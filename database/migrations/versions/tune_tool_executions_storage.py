@@ -0,0 +1,47 @@
+"""tune_tool_executions_storage
+
+Revision ID: tune_tool_executions_storage_011
+Revises: add_job_status_index_010
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "tune_tool_executions_storage_011"
+down_revision = "add_job_status_index_010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Leaves room on each page for the status/result update that follows every execution
+    # insert, so it can be a HOT update, and vacuums the table at 5% dead tuples. The table
+    # is created from the MCP orchestrator models rather than by a migration, so it may not
+    # exist; new tables get the same settings when they are created.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tool_executions') IS NOT NULL THEN
+                ALTER TABLE mcp.tool_executions
+                SET (fillfactor = 80, autovacuum_vacuum_scale_factor = 0.05);
+            END IF;
+        END $$
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('mcp.tool_executions') IS NOT NULL THEN
+                ALTER TABLE mcp.tool_executions
+                RESET (fillfactor, autovacuum_vacuum_scale_factor);
+            END IF;
+        END $$
+    """
+    )
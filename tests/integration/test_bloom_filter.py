@@ -0,0 +1,87 @@
+"""
+RedisBloom-backed BloomFilter: seeding, concurrent adds and the no-module fallback
+"""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from backend.common.database import redis as redis_module
+from backend.common.database.redis import BloomFilter
+
+
+@pytest_asyncio.fixture
+async def bloom_support(redis_client, monkeypatch):
+    """Whether the test Redis has RedisBloom, probed without the per-process cache"""
+    monkeypatch.setattr(BloomFilter, "_supported", None)
+    supported = await BloomFilter.is_supported(redis_client)
+    monkeypatch.setattr(BloomFilter, "_supported", None)
+    return supported
+
+
+@pytest_asyncio.fixture
+async def bloom(redis_client, bloom_support):
+    if not bloom_support:
+        pytest.skip("Redis server has no RedisBloom module")
+
+    prefix = f"test:bloom:{uuid4().hex}:"
+    yield BloomFilter(redis_client, prefix=prefix, capacity=1000, error_rate=0.001)
+
+    keys = [key async for key in redis_client.scan_iter(f"{prefix}*")]
+    if keys:
+        await redis_client.delete(*keys)
+
+
+@pytest.mark.asyncio
+async def test_unseeded_filter_is_not_trusted(bloom):
+    assert await bloom.might_contain("checksums", "a") is None
+    assert await bloom.might_contain_many("checksums", ["a", "b"]) is None
+
+
+@pytest.mark.asyncio
+async def test_add_before_seed_does_not_mark_filter_seeded(bloom):
+    assert await bloom.add("checksums", ["early"])
+
+    # Lookups keep falling back to the database until the filter is seeded
+    assert await bloom.might_contain("checksums", "early") is None
+
+
+@pytest.mark.asyncio
+async def test_seed_keeps_items_added_before_it(bloom):
+    await bloom.add("checksums", ["added-while-seeding"])
+    assert await bloom.seed("checksums", ["from-database"])
+
+    assert await bloom.might_contain_many(
+        "checksums", ["added-while-seeding", "from-database", "never-added"]
+    ) == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_seed_with_no_items_marks_empty_filter(bloom):
+    assert await bloom.seed("checksums", [])
+    assert await bloom.might_contain("checksums", "anything") is False
+
+    await bloom.add("checksums", ["new"])
+    assert await bloom.might_contain("checksums", "new") is True
+
+
+@pytest.mark.asyncio
+async def test_filters_are_independent(bloom):
+    await bloom.seed("user:1:chk", ["shared"])
+    await bloom.seed("user:2:chk", [])
+
+    assert await bloom.might_contain("user:1:chk", "shared") is True
+    assert await bloom.might_contain("user:2:chk", "shared") is False
+
+
+@pytest.mark.asyncio
+async def test_server_without_module_disables_filter(redis_client, bloom_support, monkeypatch):
+    if bloom_support:
+        pytest.skip("Redis server has the RedisBloom module")
+
+    async def get_test_redis():
+        return redis_client
+
+    monkeypatch.setattr(redis_module, "get_redis", get_test_redis)
+    assert await redis_module.get_bloom_filter() is None
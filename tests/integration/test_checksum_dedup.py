@@ -0,0 +1,142 @@
+"""
+Duplicate upload detection through the files checksum column and its unique index
+"""
+
+import asyncio
+import io
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import func, select
+
+from backend.common.database import redis as redis_module
+from backend.common.database.models import Collection, File, User
+from backend.common.database.redis import BloomFilter
+from backend.file_service.app.crud.file import FileCRUD
+
+
+def upload(content: bytes, filename: str = "notes.txt") -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename=filename)
+
+
+async def create_owner(db):
+    """A user with one collection, returned as (user_id, collection_id)"""
+    suffix = uuid4().hex[:12]
+    user = User(email=f"{suffix}@example.com", username=f"user_{suffix}", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    collection = Collection(
+        name="Uploads", owner_id=user.id, vector_collection_name=f"test_{suffix}"
+    )
+    db.add(collection)
+    await db.commit()
+    return user.id, collection.id
+
+
+@pytest_asyncio.fixture
+async def owner(db):
+    return await create_owner(db)
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    """Redis unreachable: duplicate detection relies on the database alone"""
+
+    async def unavailable():
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(redis_module, "get_redis", unavailable)
+
+
+@pytest_asyncio.fixture
+async def redis_bloom(redis_client, monkeypatch):
+    """Route the file service's Bloom filters to the test Redis, which must have RedisBloom"""
+
+    async def test_redis():
+        return redis_client
+
+    monkeypatch.setattr(redis_module, "get_redis", test_redis)
+    monkeypatch.setattr(BloomFilter, "_supported", None)
+    if not await BloomFilter.is_supported(redis_client):
+        pytest.skip("Redis server has no RedisBloom module")
+    return redis_client
+
+
+async def count_files(db, collection_id) -> int:
+    return await db.scalar(
+        select(func.count()).select_from(File).where(File.collection_id == collection_id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_is_rejected(db, owner, tmp_path, redis_down):
+    user_id, collection_id = owner
+    content = uuid4().bytes * 100
+
+    first = await FileCRUD.create_file(db, upload(content), user_id, str(tmp_path), collection_id)
+    assert first.checksum == FileCRUD.calculate_file_checksum(content)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await FileCRUD.create_file(
+            db, upload(content, "copy.txt"), user_id, str(tmp_path), collection_id
+        )
+    assert exc_info.value.status_code == 409
+    assert await count_files(db, collection_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_same_content_for_another_owner_is_accepted(db, owner, tmp_path, redis_down):
+    content = uuid4().bytes * 100
+    for user_id, collection_id in [owner, await create_owner(db)]:
+        await FileCRUD.create_file(db, upload(content), user_id, str(tmp_path), collection_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_leave_one_file(session_factory, owner, tmp_path, redis_down):
+    user_id, collection_id = owner
+    content = uuid4().bytes * 100
+
+    async def create(filename: str):
+        async with session_factory() as session:
+            return await FileCRUD.create_file(
+                session, upload(content, filename), user_id, str(tmp_path), collection_id
+            )
+
+    results = await asyncio.gather(
+        *[create(f"copy-{i}.txt") for i in range(4)], return_exceptions=True
+    )
+
+    created = [result for result in results if isinstance(result, File)]
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+    assert len(created) == 1
+    assert [error.status_code for error in rejected] == [409] * 3
+
+    async with session_factory() as session:
+        assert await count_files(session, collection_id) == 1
+
+
+@pytest.mark.asyncio
+async def test_bloom_filter_is_seeded_and_updated(db, owner, tmp_path, redis_bloom):
+    user_id, collection_id = owner
+    existing, new = uuid4().bytes * 100, uuid4().bytes * 100
+
+    await FileCRUD.create_file(db, upload(existing), user_id, str(tmp_path), collection_id)
+    await redis_bloom.delete(f"bloom:user:{user_id}:chk", f"bloom:user:{user_id}:chk:seeded")
+
+    # The first lookup seeds the filter from the database
+    checksum = FileCRUD.calculate_file_checksum(existing)
+    assert await FileCRUD.checksum_may_exist(db, checksum, str(user_id))
+    assert not await FileCRUD.checksum_may_exist(
+        db, FileCRUD.calculate_file_checksum(new), str(user_id)
+    )
+
+    # Uploads are recorded in the seeded filter and caught as duplicates afterwards
+    await FileCRUD.create_file(db, upload(new), user_id, str(tmp_path), collection_id)
+    assert await FileCRUD.checksum_may_exist(
+        db, FileCRUD.calculate_file_checksum(new), str(user_id)
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await FileCRUD.create_file(db, upload(new), user_id, str(tmp_path), collection_id)
+    assert exc_info.value.status_code == 409
@@ -0,0 +1,128 @@
+"""
+ExecutionWriter batching, backpressure and retry behavior
+"""
+
+import asyncio
+from typing import Any, Dict, List, Set
+
+import pytest
+
+from backend.mcp_orchestrator.app.core.execution_writer import ExecutionWriter
+
+
+class RecordingWriter(ExecutionWriter):
+    """ExecutionWriter whose batches go to a list instead of the database
+
+    Batches containing an id from fail_ids raise, as a database error would; the first
+    fail_times batch writes raise regardless of content.
+    """
+
+    def __init__(self, fail_ids: Set[str] = frozenset(), fail_times: int = 0, **kwargs):
+        kwargs.setdefault("retry_delay", 0)
+        super().__init__(**kwargs)
+        self.fail_ids = set(fail_ids)
+        self.fail_times = fail_times
+        self.attempts: List[List[str]] = []
+        self.written: List[List[str]] = []
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        ids = [values["id"] for values in batch]
+        self.attempts.append(ids)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("connection reset")
+        if self.fail_ids.intersection(ids):
+            raise RuntimeError("violates foreign key constraint")
+        self.written.append(ids)
+
+
+def written_ids(writer: RecordingWriter) -> List[str]:
+    return [row_id for batch in writer.written for row_id in batch]
+
+
+@pytest.mark.asyncio
+async def test_submit_is_refused_until_started():
+    writer = RecordingWriter()
+    assert not writer.submit({"id": "e1"})
+
+    writer.start()
+    assert writer.submit({"id": "e1"})
+    await writer.stop()
+
+    assert written_ids(writer) == ["e1"]
+    assert not writer.submit({"id": "e2"})
+
+
+@pytest.mark.asyncio
+async def test_rows_are_grouped_into_batches():
+    writer = RecordingWriter(batch_size=3, flush_interval=0.5)
+    writer.start()
+    for i in range(7):
+        assert writer.submit({"id": f"e{i}"})
+    await writer.stop()
+
+    assert [len(batch) for batch in writer.written] == [3, 3, 1]
+    assert written_ids(writer) == [f"e{i}" for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval():
+    writer = RecordingWriter(batch_size=100, flush_interval=0.01)
+    writer.start()
+    writer.submit({"id": "e1"})
+
+    await asyncio.sleep(0.2)
+    assert writer.written == [["e1"]]
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_pushes_back_on_the_caller():
+    writer = RecordingWriter(max_queued=2, batch_size=10, flush_interval=1)
+    writer.start()
+
+    # The worker holds no rows yet, so the queue fills after two submissions
+    assert writer.submit({"id": "e1"})
+    assert writer.submit({"id": "e2"})
+    assert not writer.submit({"id": "e3"})
+    await writer.stop()
+
+    assert written_ids(writer) == ["e1", "e2"]
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried():
+    writer = RecordingWriter(fail_times=2, max_attempts=3, batch_size=2)
+    writer.start()
+    writer.submit({"id": "e1"})
+    writer.submit({"id": "e2"})
+    await writer.stop()
+
+    assert writer.attempts == [["e1", "e2"]] * 3
+    assert writer.written == [["e1", "e2"]]
+
+
+@pytest.mark.asyncio
+async def test_persistent_failure_only_drops_the_bad_row():
+    writer = RecordingWriter(fail_ids={"e2"}, max_attempts=2, batch_size=3)
+    writer.start()
+    for i in range(1, 4):
+        writer.submit({"id": f"e{i}"})
+    await writer.stop()
+
+    # Two attempts at the whole batch, then one insert per row
+    assert writer.attempts[:2] == [["e1", "e2", "e3"]] * 2
+    assert writer.attempts[2:] == [["e1"], ["e2"], ["e3"]]
+    assert written_ids(writer) == ["e1", "e3"]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_rows():
+    writer = RecordingWriter(batch_size=20, flush_interval=0.2)
+    writer.start()
+    for i in range(50):
+        writer.submit({"id": f"e{i}"})
+
+    await asyncio.wait_for(writer.stop(), timeout=5)
+    assert len(written_ids(writer)) == 50
+    assert not writer.running
@@ -0,0 +1,292 @@
+"""
+Migrations after fix_message_role_005: round trip, data backfills and the objects they create
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from conftest import MIGRATIONS_BASE, alembic_config, migrations_head, sync_url
+from sqlalchemy import create_engine, insert, text
+
+from backend.common.database.models import Collection, File, FileStatus, FileType, User
+from backend.mcp_orchestrator.app.models.tool import (
+    Tool,
+    ToolAccess,
+    ToolExecution,
+    ToolType,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class MigratedDatabase:
+    """Scratch database with helpers to move between revisions and run raw SQL"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.head = migrations_head(alembic_config(url))
+        self.engine = create_engine(sync_url(url))
+
+    def downgrade(self, revision: str) -> None:
+        command.downgrade(alembic_config(self.url), revision)
+
+    def upgrade(self, revision: str = None) -> None:
+        command.upgrade(alembic_config(self.url), revision or self.head)
+
+    def current(self) -> str:
+        with self.engine.connect() as conn:
+            return conn.scalar(text("SELECT version_num FROM alembic_version"))
+
+    def index_exists(self, schema: str, name: str) -> bool:
+        with self.engine.connect() as conn:
+            return conn.scalar(text("SELECT to_regclass(:name)"), {"name": f"{schema}.{name}"})
+
+    def triggers(self) -> set:
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT tgname FROM pg_trigger "
+                    "WHERE tgrelid = 'files.files'::regclass AND NOT tgisinternal"
+                )
+            )
+            return {row.tgname for row in rows}
+
+
+@pytest.fixture
+def migrated(scratch_databases):
+    database = MigratedDatabase(scratch_databases.create())
+    yield database
+    database.engine.dispose()
+
+
+def add_owner(conn):
+    """Insert a user with one collection; returns (user_id, collection_id)"""
+    user_id, collection_id = uuid4(), uuid4()
+    conn.execute(
+        insert(User.__table__).values(
+            id=user_id,
+            email=f"{user_id.hex}@example.com",
+            username=f"user_{user_id.hex}",
+            hashed_password="x",
+            is_active=True,
+            is_superuser=False,
+        )
+    )
+    conn.execute(
+        insert(Collection.__table__).values(
+            id=collection_id,
+            name="Uploads",
+            owner_id=user_id,
+            vector_collection_name=f"test_{collection_id.hex}",
+        )
+    )
+    return user_id, collection_id
+
+
+def add_file(conn, collection_id, **values):
+    """Insert a file row with only the given columns set beyond the required ones"""
+    file_id = values.pop("id", uuid4())
+    row = {
+        "id": file_id,
+        "filename": f"{file_id.hex}.txt",
+        "original_filename": "notes.txt",
+        "file_type": FileType.TXT,
+        "file_size": 100,
+        "file_path": f"/tmp/{file_id.hex}.txt",
+        "mime_type": "text/plain",
+        "status": FileStatus.UPLOADED,
+        "collection_id": collection_id,
+        "total_chunks": 0,
+        "extracted_text_length": 0,
+    }
+    row.update(values)
+    conn.execute(insert(File.__table__).values(**row))
+    return file_id
+
+
+def placeholder_checksum(file_id) -> str:
+    return hashlib.sha256(str(file_id).encode()).hexdigest()
+
+
+def test_round_trip_from_base_to_head(migrated):
+    migrated.downgrade(MIGRATIONS_BASE)
+    assert migrated.current() == MIGRATIONS_BASE
+    assert not migrated.index_exists("files", "uq_files_collection_checksum")
+    assert not migrated.triggers()
+
+    migrated.upgrade()
+    assert migrated.current() == migrated.head
+    assert migrated.index_exists("files", "uq_files_collection_checksum")
+    assert migrated.index_exists("mcp", "uq_mcp_tool_access_tool_user")
+    assert migrated.triggers() == {
+        "files_user_file_stats_insert_delete",
+        "files_user_file_stats_update",
+    }
+
+    # Downgrades run cleanly on a schema built by the upgrades as well
+    migrated.downgrade(MIGRATIONS_BASE)
+    migrated.upgrade()
+
+
+def test_checksum_backfill_keeps_the_oldest_duplicate(migrated):
+    migrated.downgrade(MIGRATIONS_BASE)
+    with migrated.engine.begin() as conn:
+        _, collection_id = add_owner(conn)
+        _, other_collection_id = add_owner(conn)
+        metadata = {"checksum": "a" * 64}
+        oldest = add_file(conn, collection_id, file_metadata=metadata, created_at=BASE_TIME)
+        copy = add_file(
+            conn,
+            collection_id,
+            file_metadata=metadata,
+            created_at=BASE_TIME + timedelta(minutes=1),
+        )
+        elsewhere = add_file(conn, other_collection_id, file_metadata=metadata)
+        no_metadata = add_file(conn, collection_id)
+
+    migrated.upgrade("add_file_checksum_006")
+
+    with migrated.engine.connect() as conn:
+        checksums = dict(conn.execute(text("SELECT id, checksum FROM files.files")).all())
+    assert checksums == {
+        oldest: "a" * 64,
+        copy: placeholder_checksum(copy),
+        elsewhere: "a" * 64,
+        no_metadata: placeholder_checksum(no_metadata),
+    }
+    assert migrated.index_exists("files", "uq_files_collection_checksum")
+
+
+def test_user_file_stats_follow_file_changes(migrated):
+    migrated.downgrade("add_chunk_content_hash_007")
+    with migrated.engine.begin() as conn:
+        user_id, collection_id = add_owner(conn)
+        add_file(conn, collection_id, checksum="b" * 64, file_size=50, total_chunks=2)
+
+    migrated.upgrade()
+
+    with migrated.engine.begin() as conn:
+        # Backfilled totals land in slot 0
+        backfilled = conn.execute(
+            text("SELECT slot, total_size_bytes FROM files.user_file_stats")
+        ).all()
+        assert [tuple(row) for row in backfilled] == [(0, 50)]
+
+        files = [
+            add_file(conn, collection_id, checksum=f"{i:064x}", file_size=10 * i)
+            for i in range(1, 11)
+        ]
+        conn.execute(
+            text("UPDATE files.files SET status = 'PROCESSED', total_chunks = 3 WHERE id = :id"),
+            {"id": files[0]},
+        )
+        conn.execute(text("DELETE FROM files.files WHERE id = :id"), {"id": files[1]})
+
+    with migrated.engine.connect() as conn:
+        slots = conn.execute(
+            text(
+                "SELECT slot, status_counts, type_counts, total_size_bytes, total_chunks "
+                "FROM files.user_file_stats WHERE user_id = :user_id"
+            ),
+            {"user_id": user_id},
+        ).all()
+
+    assert all(0 <= row.slot < 8 for row in slots)
+    assert len(slots) > 1, "ten files should spread over several slots"
+
+    def summed(column: str) -> dict:
+        totals = {}
+        for row in slots:
+            for key, count in getattr(row, column).items():
+                totals[key] = totals.get(key, 0) + count
+        return {key: count for key, count in totals.items() if count}
+
+    assert summed("status_counts") == {"UPLOADED": 9, "PROCESSED": 1}
+    assert summed("type_counts") == {"TXT": 10}
+    assert sum(row.total_size_bytes for row in slots) == 50 + sum(
+        10 * i for i in range(1, 11) if i != 2
+    )
+    assert sum(row.total_chunks for row in slots) == 2 + 3
+
+
+def test_tool_access_index_keeps_the_latest_grant(migrated):
+    migrated.downgrade("add_tool_search_trgm_index_015")
+    tool_id, user_id, owner_id = uuid4(), uuid4(), uuid4()
+    grants = [uuid4() for _ in range(3)]
+    with migrated.engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS mcp.uq_mcp_tool_access_tool_user"))
+        conn.execute(
+            insert(Tool.__table__).values(
+                id=tool_id, name="search", owner_id=owner_id, tool_type=ToolType.FUNCTION
+            )
+        )
+        for minutes, grant_id in enumerate(grants):
+            conn.execute(
+                insert(ToolAccess.__table__).values(
+                    id=grant_id,
+                    tool_id=tool_id,
+                    user_id=user_id,
+                    granted_by=owner_id,
+                    granted_at=BASE_TIME + timedelta(minutes=minutes),
+                )
+            )
+
+    migrated.upgrade("add_tool_access_unique_index_016")
+
+    with migrated.engine.connect() as conn:
+        remaining = conn.scalars(text("SELECT id FROM mcp.tool_access")).all()
+    assert remaining == [grants[-1]]
+    assert migrated.index_exists("mcp", "uq_mcp_tool_access_tool_user")
+
+
+def test_deleting_a_tool_cascades_to_its_rows(migrated):
+    tool_id, user_id = uuid4(), uuid4()
+
+    def add_tool_with_rows(conn):
+        conn.execute(
+            insert(Tool.__table__).values(
+                id=tool_id, name="search", owner_id=user_id, tool_type=ToolType.FUNCTION
+            )
+        )
+        conn.execute(insert(ToolExecution.__table__).values(tool_id=tool_id, user_id=user_id))
+        conn.execute(
+            insert(ToolAccess.__table__).values(
+                tool_id=tool_id, user_id=user_id, granted_by=user_id
+            )
+        )
+
+    # Before the migration the foreign keys block the delete
+    migrated.downgrade("add_tool_access_unique_index_016")
+    with migrated.engine.begin() as conn:
+        add_tool_with_rows(conn)
+    with pytest.raises(Exception, match="foreign key"):
+        with migrated.engine.begin() as conn:
+            conn.execute(text("DELETE FROM mcp.tools WHERE id = :id"), {"id": tool_id})
+
+    migrated.upgrade()
+    with migrated.engine.begin() as conn:
+        conn.execute(text("DELETE FROM mcp.tools WHERE id = :id"), {"id": tool_id})
+    with migrated.engine.connect() as conn:
+        for table in ["tool_executions", "tool_access"]:
+            count = conn.scalar(
+                text(f"SELECT count(*) FROM mcp.{table} WHERE tool_id = :id"), {"id": tool_id}
+            )
+            assert count == 0
+
+
+def test_tool_listing_indexes_are_created(migrated):
+    indexes = [
+        "ix_mcp_tools_owner_updated_id",
+        "ix_mcp_tools_owner_active_updated_id",
+        "ix_mcp_tool_executions_user_started",
+        "ix_mcp_tool_executions_tool_started",
+        "ix_mcp_tool_executions_tool_user",
+    ]
+    migrated.downgrade("cascade_tool_foreign_keys_017")
+    assert not any(migrated.index_exists("mcp", name) for name in indexes)
+
+    migrated.upgrade()
+    assert all(migrated.index_exists("mcp", name) for name in indexes)
@@ -0,0 +1,215 @@
+"""
+Tool and execution listings: keyset cursors and COUNT(*) OVER () totals
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+
+from backend.mcp_orchestrator.app.crud.tool import ToolCRUD, ToolExecutionCRUD, decode_tool_cursor
+from backend.mcp_orchestrator.app.models.tool import (
+    ExecutionStatus,
+    Tool,
+    ToolAccess,
+    ToolExecution,
+    ToolType,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def make_tool(owner_id: UUID, updated_at: datetime, name: str = "tool") -> Tool:
+    return Tool(
+        name=name,
+        owner_id=owner_id,
+        tool_type=ToolType.FUNCTION,
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+
+
+@pytest_asyncio.fixture
+async def owner_tools(db):
+    """12 tools of one owner; pairs share updated_at so ids have to break the ties"""
+    owner_id = uuid4()
+    tools = [
+        make_tool(owner_id, BASE_TIME + timedelta(minutes=i // 2), name=f"tool-{i}")
+        for i in range(12)
+    ]
+    db.add_all(tools)
+    await db.commit()
+
+    expected = sorted(tools, key=lambda tool: (tool.updated_at, tool.id), reverse=True)
+    return owner_id, [str(tool.id) for tool in expected]
+
+
+async def walk_cursor_pages(db, user_id: UUID, limit: int, **filters):
+    """Follow next_cursor from the first page to the end, returning every page"""
+    pages = []
+    cursor = None
+    while True:
+        tools, total, cursor = await ToolCRUD.get_user_tools(
+            db, user_id, limit=limit, cursor=cursor, **filters
+        )
+        pages.append((tools, total))
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 5, 6, 12, 50])
+async def test_cursor_pages_cover_every_tool_once_in_order(db, owner_tools, limit):
+    owner_id, expected_ids = owner_tools
+
+    pages = await walk_cursor_pages(db, owner_id, limit)
+
+    seen = [tool["id"] for tools, _ in pages for tool in tools]
+    assert seen == expected_ids
+    assert all(len(tools) <= limit for tools, _ in pages)
+
+
+@pytest.mark.asyncio
+async def test_only_the_first_page_is_counted(db, owner_tools):
+    owner_id, _ = owner_tools
+
+    pages = await walk_cursor_pages(db, owner_id, limit=5)
+
+    assert pages[0][1] == 12
+    assert all(total is None for _, total in pages[1:])
+
+
+@pytest.mark.asyncio
+async def test_cursor_encodes_the_last_row_sort_key(db, owner_tools):
+    owner_id, expected_ids = owner_tools
+
+    tools, _, cursor = await ToolCRUD.get_user_tools(db, owner_id, limit=3)
+
+    updated_at, tool_id = decode_tool_cursor(cursor)
+    assert str(tool_id) == expected_ids[2] == tools[-1]["id"]
+    assert updated_at == tools[-1]["updated_at"]
+
+
+@pytest.mark.asyncio
+async def test_summary_pages_use_the_same_cursor(db, owner_tools):
+    owner_id, expected_ids = owner_tools
+
+    pages = await walk_cursor_pages(db, owner_id, limit=4, summary=True)
+
+    assert [tool["id"] for tools, _ in pages for tool in tools] == expected_ids
+    assert "configuration" not in pages[0][0][0]
+
+
+@pytest.mark.asyncio
+async def test_offset_pages_report_the_total(db, owner_tools):
+    owner_id, expected_ids = owner_tools
+
+    tools, total, _ = await ToolCRUD.get_user_tools(db, owner_id, limit=5, offset=10)
+    assert [tool["id"] for tool in tools] == expected_ids[10:]
+    assert total == 12
+
+    # Past the last page the window function has no row to carry the total
+    tools, total, cursor = await ToolCRUD.get_user_tools(db, owner_id, limit=5, offset=40)
+    assert tools == []
+    assert total == 12
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_shared_tools_are_listed_once(db, owner_tools):
+    owner_id, expected_ids = owner_tools
+    viewer_id = uuid4()
+    db.add_all(
+        [
+            ToolAccess(tool_id=UUID(tool_id), user_id=viewer_id, granted_by=owner_id)
+            for tool_id in expected_ids[:3]
+        ]
+    )
+    await db.commit()
+
+    tools, total, _ = await ToolCRUD.get_user_tools(db, viewer_id, limit=50)
+
+    assert [tool["id"] for tool in tools] == expected_ids[:3]
+    assert total == 3
+
+
+@pytest_asyncio.fixture
+async def user_executions(db):
+    """7 executions of one user across two tools, one minute apart"""
+    user_id = uuid4()
+    tools = [make_tool(uuid4(), BASE_TIME), make_tool(uuid4(), BASE_TIME)]
+    db.add_all(tools)
+    await db.flush()
+
+    executions = [
+        ToolExecution(
+            tool_id=tools[i % 2].id,
+            user_id=user_id,
+            status=ExecutionStatus.COMPLETED if i % 3 else ExecutionStatus.FAILED,
+            started_at=BASE_TIME + timedelta(minutes=i),
+        )
+        for i in range(7)
+    ]
+    db.add_all(executions)
+    await db.commit()
+
+    newest_first = sorted(executions, key=lambda execution: execution.started_at, reverse=True)
+    return user_id, tools, newest_first
+
+
+@pytest.mark.asyncio
+async def test_execution_pages_carry_the_window_total(db, user_executions):
+    user_id, _, newest_first = user_executions
+
+    page, total = await ToolExecutionCRUD.get_user_executions(db, user_id, limit=3, offset=3)
+
+    assert [row["id"] for row in page] == [str(e.id) for e in newest_first[3:6]]
+    assert total == 7
+    assert "total_count" not in page[0]
+
+
+@pytest.mark.asyncio
+async def test_execution_total_past_the_last_page(db, user_executions):
+    user_id, _, _ = user_executions
+
+    page, total = await ToolExecutionCRUD.get_user_executions(db, user_id, limit=3, offset=9)
+
+    assert page == []
+    assert total == 7
+
+
+@pytest.mark.asyncio
+async def test_execution_total_respects_filters(db, user_executions):
+    user_id, tools, newest_first = user_executions
+
+    page, total = await ToolExecutionCRUD.get_user_executions(
+        db, user_id, limit=50, tool_id=tools[0].id, status=ExecutionStatus.COMPLETED
+    )
+
+    expected = [
+        str(e.id)
+        for e in newest_first
+        if e.tool_id == tools[0].id and e.status == ExecutionStatus.COMPLETED
+    ]
+    assert [row["id"] for row in page] == expected
+    assert total == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_tool_execution_pages_are_owner_scoped(db, user_executions):
+    _, tools, newest_first = user_executions
+    tool = tools[1]
+
+    page, total = await ToolExecutionCRUD.get_tool_executions(
+        db, tool.id, limit=2, owner_id=tool.owner_id
+    )
+    expected = [str(e.id) for e in newest_first if e.tool_id == tool.id]
+    assert [row["id"] for row in page] == expected[:2]
+    assert total == len(expected)
+
+    page, total = await ToolExecutionCRUD.get_tool_executions(
+        db, tool.id, limit=2, owner_id=uuid4()
+    )
+    assert page == []
+    assert total == 0
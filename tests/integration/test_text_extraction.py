@@ -0,0 +1,40 @@
+"""
+CSV text extraction through the pandas and Arrow readers
+"""
+
+import pytest
+
+from backend.file_service.app.processing.text_extractor import CSVTextExtractor
+
+EXPECTED_TEXT = "Headers: a | b | c\nRow 1: 1 | nan | x\nRow 2: 2 | 3 | y"
+
+
+@pytest.fixture
+def csv_with_empty_cell(tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("a,b,c\n1,,x\n2,3,y\n")
+    return str(path)
+
+
+def test_pandas_renders_empty_cells_as_nan(csv_with_empty_cell):
+    result = CSVTextExtractor()._extract_pandas(csv_with_empty_cell, "utf-8")
+    assert result["text"] == EXPECTED_TEXT
+    assert result["metadata"]["row_count"] == 2
+
+
+def test_pandas_renders_empty_cells_in_a_single_column(tmp_path):
+    path = tmp_path / "column.csv"
+    path.write_text("a,b\n,\n")
+    extractor = CSVTextExtractor()
+    assert (
+        extractor._extract_pandas(str(path), "utf-8")["text"] == "Headers: a | b\nRow 1: nan | nan"
+    )
+
+    path.write_text("a\n1\n\n3\n")
+    assert extractor._extract_pandas(str(path), "utf-8")["text"] == "Headers: a\nRow 1: 1\nRow 2: 3"
+
+
+def test_arrow_and_pandas_produce_the_same_text(csv_with_empty_cell):
+    pytest.importorskip("pyarrow")
+    result = CSVTextExtractor()._extract_arrow(csv_with_empty_cell, "utf-8")
+    assert result["text"] == EXPECTED_TEXT